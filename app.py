@@ -1,6 +1,10 @@
-from app import config, app
+from app import create_app
+from app.config.config import Config
+
+config = Config().dev_config
+app = create_app(config)
 
 if __name__ == '__main__':
     app.run(host= config.HOST,
             port= config.PORT,
-            debug= config.DEBUG)
\ No newline at end of file
+            debug= config.DEBUG)
@@ -1,71 +1,134 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
+from app.cache import Cache
+from app.passwords import PasswordHasher
+from app.revocation import TokenBlocklist
+from app.rate_limit import RateLimiter
 from app.config.config import Config
+from app.reference_cache import ReferenceCache
 import os
 from datetime import timedelta
 
 
-# Load environment variables
-load_dotenv()
-
-# Create the Flask application instance
-app = Flask(__name__)
-
-# Creating config file
-config = Config().dev_config
-
-# Using dev env
-app.env = config.ENV
-
-# Update configuration for the database
-app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv('SQLALCHEMY_DATABASE_URI')
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = os.getenv('SQLALCHEMY_TRACK_MODIFICATIONS')
-
-# Update configuration for JWT
-app.config["JWT_SECRET_KEY"] = os.getenv('JWT_SECRET_KEY')
-app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1)
-app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(days=7)
-
-# Initialize Flask extensions using the container
-db = SQLAlchemy(app)
-
-# Initialize Flask-Bcrypt
-bcrypt = Bcrypt(app)
-
-# Initialize Flask-JWT-Extended
-jwt = JWTManager(app)
-
-# Initialize Flask-Migrate
-migrate = Migrate(app, db)
-
-# Import models so they are registered with SQLAlchemy
-from app.models import (
-    Developer,
-    Follower,
-    game_platform,
-    GameStatus,
-    Game,
-    Genre,
-    Platform,
-    Publisher,
-    user_gamelist_has_game,
-    UserGameList,
-    UserReview,
-    User,
-    UserBacklog
-)
-
-# Register commands
-from app.commands.seed import register_seed_commands
-register_seed_commands(app)
-
-
-# Register routes
-from app.routes import api
-app.register_blueprint(api, url_prefix='/api/v1')
-
-
+# Flask extensions, bound to an application by create_app
+db = SQLAlchemy()
+jwt = JWTManager()
+
+# Shared response cache
+cache = Cache()
+
+# Reference table cache, following the tag versions of the shared cache
+reference_cache = ReferenceCache(db, cache)
+
+# Password hashing process pool
+passwords = PasswordHasher()
+
+# Revoked token JTIs
+blocklist = TokenBlocklist()
+
+# Token bucket rate limits
+limiter = RateLimiter()
+
+
+def create_app(config=None):
+    '''
+    Create and configure a Flask application.
+
+    Models, commands and blueprints are imported here rather than at package import, so
+    importing app (from the CLI, migrations or tests) stays cheap and every call returns
+    an isolated application. Flask-Migrate, and with it alembic, is only imported when a
+    "flask db" command runs (see benchmarks/startup.py for the measured start-up times).
+
+    Parameters:
+    ----------
+    config : DevConfig | ProductionConfig, optional
+        The configuration to apply (default is the development configuration).
+        Any uppercase attribute, including SQLALCHEMY_DATABASE_URI, overrides the environment.
+
+    Returns:
+    -------
+    Flask
+        The configured application.
+    '''
+    # Load environment variables
+    load_dotenv()
+
+    # Create the Flask application instance
+    app = Flask(__name__)
+
+    # Using dev env by default
+    if config is None:
+        config = Config().dev_config
+    app.env = config.ENV
+
+    # Update configuration for the database
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv('SQLALCHEMY_DATABASE_URI')
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = os.getenv('SQLALCHEMY_TRACK_MODIFICATIONS')
+
+    # Update configuration for JWT
+    app.config["JWT_SECRET_KEY"] = os.getenv('JWT_SECRET_KEY')
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1)
+    app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(days=7)
+
+    # Update configuration for the connection pool, pagination, caching and the SQL query budget
+    app.config.from_object(config)
+    from app.db_pool import engine_options
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+
+    # Import models so they are registered with SQLAlchemy
+    from app import models
+
+    # Initialize Flask extensions
+    db.init_app(app)
+    jwt.init_app(app)
+    reference_cache.init_app(app)
+    cache.init_app(app)
+    passwords.init_app(app)
+    blocklist.init_app(app, jwt)
+    limiter.init_app(app)
+
+    # Record connection pool metrics
+    from app.db_pool import init_pool_metrics
+    init_pool_metrics(app, db)
+
+    # Record request, SQL and serialization metrics
+    from app.metrics import init_metrics
+    init_metrics(app, db)
+
+    # Fail requests that exceed the SQL query budget
+    from app.query_budget import init_query_budget
+    init_query_budget(app, db)
+
+    # Confirm the identity claim of authenticated requests without a query per request
+    from app.identity import init_identity
+    init_identity(app, jwt, db, cache)
+
+    # Register commands (flask db sets up Flask-Migrate when it runs)
+    from app.commands.migrate import register_migrate_commands
+    register_migrate_commands(app)
+    from app.commands.seed import register_seed_commands
+    register_seed_commands(app)
+    from app.commands.ratings import register_ratings_commands
+    register_ratings_commands(app)
+    from app.commands.search import register_search_commands
+    register_search_commands(app)
+    from app.commands.catalog import register_catalog_commands
+    register_catalog_commands(app)
+    from app.commands.followers import register_followers_commands
+    register_followers_commands(app)
+    from app.commands.suggestions import register_suggestions_commands
+    register_suggestions_commands(app)
+    from app.commands.recommendations import register_recommendations_commands
+    register_recommendations_commands(app)
+
+    # Register routes
+    from app.routes import api
+    app.register_blueprint(api, url_prefix='/api/v1')
+
+    # Register internal endpoints
+    from app.controllers.internal_controller import internal
+    app.register_blueprint(internal)
+
+    return app
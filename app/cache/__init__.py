@@ -0,0 +1,2 @@
+from app.cache.backends import BACKENDS, FileBackend, MemoryBackend, RedisBackend
+from app.cache.cache import Cache, create_backend
@@ -0,0 +1,230 @@
+import fcntl
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+"""
+Cache Backends
+
+This module implements the interchangeable storage backends behind the shared Cache. Every
+backend stores opaque bytes under string keys and supports the same five operations, so the
+Cache never needs to know where its entries live:
+
+- MemoryBackend: a bounded LRU dictionary private to one process.
+- FileBackend: one file per key in a directory, shared by every worker on the host.
+- RedisBackend: any server speaking the Redis protocol, shared by every host.
+"""
+
+
+class MemoryBackend:
+    '''
+    In-process LRU backend.
+
+    Only entries with a timeout count towards max_entries and are evicted. Entries without
+    one (tag versions and the cache epoch) are kept until they are deleted, so a version
+    counter is never reset while responses and ETags derived from it are still in use.
+
+    Attributes:
+    ----------
+    max_entries : int
+        The number of expiring entries kept before the least recently used one is evicted.
+    '''
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._persistent: Dict[str, bytes] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._persistent:
+                return self._persistent[key]
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, timeout: Optional[int] = None) -> None:
+        with self._lock:
+            if not timeout:
+                self._entries.pop(key, None)
+                self._persistent[key] = value
+                return
+            self._persistent.pop(key, None)
+            self._entries[key] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._persistent.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._persistent.get(key, b'0')) + 1
+            self._persistent[key] = str(value).encode('ascii')
+            return value
+
+
+class FileBackend:
+    '''
+    Directory backend shared by the worker processes of one host.
+
+    Each entry is a file named after the hash of its key, holding the expiry timestamp followed
+    by the value. Files are written to a temporary name and renamed into place, so readers
+    never observe a partial entry; counters are updated under an exclusive file lock.
+
+    A version bump orphans the entries rendered under the old version, since their keys are
+    never read again, so writes also sweep the expired files out of the whole directory at
+    most once every sweep_interval seconds.
+
+    Attributes:
+    ----------
+    directory : str
+        The directory holding the entries. It is created if it does not exist.
+    sweep_interval : int
+        The minimum number of seconds between two sweeps of the directory.
+    '''
+
+    _HEADER = struct.Struct('!d')
+
+    def __init__(self, directory: str, sweep_interval: int = 300) -> None:
+        self.directory = directory
+        self.sweep_interval = sweep_interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, '.lock')
+        self._swept_at = 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        (expires_at,) = self._HEADER.unpack_from(data)
+        if expires_at and expires_at <= time.time():
+            self._remove(path)
+            return None
+        return data[self._HEADER.size:]
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, timeout: Optional[int] = None) -> None:
+        now = time.time()
+        if now - self._swept_at >= self.sweep_interval:
+            self._swept_at = now
+            self._sweep(now)
+
+        expires_at = now + timeout if timeout else 0.0
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(self._HEADER.pack(expires_at))
+                file.write(value)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    def incr(self, key: str) -> int:
+        with open(self._lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                value = int(self.get(key) or 0) + 1
+                self.set(key, str(value).encode('ascii'))
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        return value
+
+    def _sweep(self, now: float) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith('.'):
+                continue
+            try:
+                with open(entry.path, 'rb') as file:
+                    header = file.read(self._HEADER.size)
+            except FileNotFoundError:
+                continue
+            if len(header) != self._HEADER.size:
+                continue
+            (expires_at,) = self._HEADER.unpack(header)
+            if expires_at and expires_at <= now:
+                self._remove(entry.path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class RedisBackend:
+    '''
+    Backend for any server speaking the Redis protocol.
+
+    Requires the redis package, installed by requirements-redis.txt, unless a client is passed
+    in. Any object with the redis-py get/mget/set/delete/incr interface works as the client,
+    e.g. fakeredis.FakeRedis().
+
+    Attributes:
+    ----------
+    client : redis.Redis
+        The client the entries are read from and written to.
+    '''
+
+    def __init__(self, url: Optional[str] = None, client=None) -> None:
+        if client is None:
+            try:
+                import redis
+            except ImportError as err:
+                raise RuntimeError('The redis cache backend requires the redis package') from err
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return self.client.mget(keys) if keys else []
+
+    def set(self, key: str, value: bytes, timeout: Optional[int] = None) -> None:
+        self.client.set(key, value, ex=timeout or None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(key)
+
+
+BACKENDS: Dict[str, type] = {
+    'memory': MemoryBackend,
+    'file': FileBackend,
+    'redis': RedisBackend
+}
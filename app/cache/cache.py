@@ -0,0 +1,264 @@
+import hashlib
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+from flask import Flask, current_app, make_response, request
+from werkzeug.http import is_resource_modified
+
+from app.cache.backends import FileBackend, MemoryBackend, RedisBackend
+
+"""
+Shared Cache
+
+This module implements the response cache shared by the worker processes of the API.
+Whole JSON responses of public GET routes are stored in a pluggable backend and
+invalidated by tag.
+
+Invalidation never deletes entries: each tag has a version counter that is part of the key
+of every response rendered under it. Invalidating a tag increments its counter, so every
+response keyed by the old version stops being read and simply expires. A response is keyed
+with the versions read before it is rendered, so a write racing with the render can only
+orphan the entry, never make it stale.
+
+The same versions are the validators of conditional GETs: the ETag of a response is derived
+from its URL and the versions of its tags, and its Last-Modified is the time of the latest
+invalidation of any of them. Both are known without touching the database, so a client
+revalidating an unchanged collection gets a 304 before the route runs. Versions are scoped
+to a random epoch created with the backend's first entry, so a flushed backend can never
+hand out an old ETag for new content.
+
+Values that several responses are rendered from, such as aggregates, can be cached on their
+own with remember, under the same tag versions.
+"""
+
+
+def create_backend(config):
+    '''
+    Build the cache backend selected by the configuration.
+
+    Parameters:
+    ----------
+    config : Config
+        The application configuration with the CACHE_* settings.
+
+    Returns:
+    -------
+    MemoryBackend | FileBackend | RedisBackend
+        The configured backend.
+    '''
+    if config['CACHE_BACKEND'] == 'memory':
+        return MemoryBackend(config['CACHE_MAX_ENTRIES'])
+    if config['CACHE_BACKEND'] == 'file':
+        return FileBackend(config['CACHE_DIR'], config['CACHE_SWEEP_INTERVAL'])
+    if config['CACHE_BACKEND'] == 'redis':
+        return RedisBackend(config['CACHE_REDIS_URL'])
+    raise ValueError(f"Unknown cache backend: {config['CACHE_BACKEND']}")
+
+
+class Cache:
+    '''
+    Tag-invalidated response cache over a pluggable backend.
+
+    Attributes:
+    ----------
+    backend : MemoryBackend | FileBackend | RedisBackend
+        The backend of the current application.
+    default_timeout : int
+        Number of seconds a response is cached when the route does not set its own timeout.
+    prefix : str
+        Prefix of every key, so several applications can share one backend.
+
+    Methods:
+    -------
+    init_app(app: Flask) -> None:
+        Creates the backend of an application from its CACHE_* settings.
+    cached(*tags: str, timeout: int) -> Callable:
+        Decorator caching the JSON responses of a GET route under the given tags.
+    conditional(*tags: str) -> Callable:
+        Decorator answering conditional GETs of a route with 304 while its tags are unchanged.
+    validators(*tags: str) -> tuple[str, datetime]:
+        Computes the ETag and Last-Modified of the current request.
+    remember(key: str, tags: Iterable[str], compute: Callable, timeout: int) -> Any:
+        Returns a JSON-serializable value cached under the given tags, computing it on a miss.
+    version(*tags: str) -> str:
+        Returns an opaque string that changes whenever any of the tags is invalidated.
+    invalidate(*tags: str) -> None:
+        Drops every response cached under any of the given tags.
+    '''
+
+    def __init__(self, prefix: str = 'bonfire') -> None:
+        self.prefix = prefix
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['cache'] = create_backend(app.config)
+
+    @property
+    def backend(self):
+        return current_app.extensions['cache']
+
+    @property
+    def default_timeout(self) -> int:
+        return current_app.config['CACHE_DEFAULT_TIMEOUT']
+
+    def cached(self, *tags: str, timeout: Optional[int] = None):
+        '''
+        Cache the successful JSON responses of a GET route.
+
+        Responses are keyed by path, query string and the current version of each tag.
+        Apply it below the route decorator.
+
+        Parameters:
+        ----------
+        *tags : str
+            The tags of the collections the response is rendered from.
+        timeout : int, optional
+            Number of seconds the response is cached (default is default_timeout).
+        '''
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                key = self._response_key(tags)
+                body = self.backend.get(key)
+                if body is not None:
+                    return current_app.response_class(body, mimetype='application/json')
+
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and response.mimetype == 'application/json':
+                    self.backend.set(key, response.get_data(), timeout or self.default_timeout)
+                return response
+            return wrapper
+        return decorator
+
+    def conditional(self, *tags: str):
+        '''
+        Answer If-None-Match / If-Modified-Since requests with 304 while the tags are unchanged.
+
+        The route only runs when the client's copy is stale; its successful responses carry
+        the ETag and Last-Modified headers. Apply it below the route decorator and above cached.
+
+        Parameters:
+        ----------
+        *tags : str
+            The tags of the collections the response is rendered from.
+        '''
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                etag, last_modified = self.validators(*tags)
+                if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+                    response = current_app.response_class(status=304)
+                else:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+
+                response.set_etag(etag)
+                response.last_modified = last_modified
+                return response
+            return wrapper
+        return decorator
+
+    def validators(self, *tags: str) -> Tuple[str, datetime]:
+        '''
+        Compute the validators of the current request.
+
+        Parameters:
+        ----------
+        *tags : str
+            The tags of the collections the response is rendered from.
+
+        Returns:
+        -------
+        tuple[str, datetime]
+            The strong ETag and the Last-Modified time of the response.
+        '''
+        epoch, versions, modified = self._state(tags, with_modified=True)
+        digest = hashlib.sha1(f'{epoch}:{versions}:{request.full_path}'.encode('utf-8')).hexdigest()
+        return digest, datetime.fromtimestamp(int(modified), timezone.utc)
+
+    def remember(self, key: str, tags: Iterable[str], compute: Callable[[], Any], timeout: Optional[int] = None) -> Any:
+        '''
+        Return a JSON-serializable value cached under the given tags, computing it on a miss.
+
+        Parameters:
+        ----------
+        key : str
+            Identifies the value among those cached under the same tags.
+        tags : Iterable[str]
+            The tags of the collections the value is computed from.
+        compute : Callable
+            Computes the value on a miss.
+        timeout : int, optional
+            Number of seconds the value is cached (default is default_timeout).
+        '''
+        epoch, versions, _ = self._state(tags)
+        full_key = f'{self.prefix}:value:{epoch}:{versions}:{key}'
+        body = self.backend.get(full_key)
+        if body is not None:
+            return json.loads(body)
+
+        value = compute()
+        self.backend.set(full_key, json.dumps(value, separators=(',', ':')).encode('utf-8'), timeout or self.default_timeout)
+        return value
+
+    def version(self, *tags: str) -> str:
+        '''
+        Return an opaque string that changes whenever any of the tags is invalidated, for
+        in-process caches that must follow invalidations made by other workers.
+        '''
+        epoch, versions, _ = self._state(tags)
+        return f'{epoch}:{versions}'
+
+    def invalidate(self, *tags: str) -> None:
+        '''
+        Drop every response cached under any of the given tags. Call after the write is committed.
+        '''
+        now = str(time.time()).encode('ascii')
+        for tag in tags:
+            self.backend.incr(self._tag_key(tag))
+            self.backend.set(self._modified_key(tag), now)
+
+    def _response_key(self, tags: Iterable[str]) -> str:
+        epoch, versions, _ = self._state(tags)
+        query = urlencode(sorted(request.args.items(multi=True)))
+        return f'{self.prefix}:response:{epoch}:{versions}:{request.path}?{query}'
+
+    def _state(self, tags: Iterable[str], with_modified: bool = False) -> Tuple[str, str, float]:
+        '''
+        Read the epoch, the versions and (optionally) the latest invalidation time of the tags in one round trip.
+        '''
+        tags = list(tags)
+        keys = [self._epoch_key()] + [self._tag_key(tag) for tag in tags]
+        if with_modified:
+            keys += [self._modified_key(tag) for tag in tags]
+        values = self.backend.get_many(keys)
+
+        epoch = values[0]
+        if epoch is None:
+            epoch = f'{uuid.uuid4().hex}:{time.time()}'.encode('ascii')
+            self.backend.set(self._epoch_key(), epoch)
+        epoch_id, created_at = epoch.decode('ascii').split(':')
+
+        counters = values[1:len(tags) + 1]
+        versions = '.'.join(value.decode('ascii') if value else '0' for value in counters)
+
+        modified = float(created_at)
+        for value in values[len(tags) + 1:]:
+            if value is not None:
+                modified = max(modified, float(value))
+
+        return epoch_id, versions, modified
+
+    def _epoch_key(self) -> str:
+        return f'{self.prefix}:epoch'
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.prefix}:tag:{tag}'
+
+    def _modified_key(self, tag: str) -> str:
+        return f'{self.prefix}:modified:{tag}'
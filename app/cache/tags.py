@@ -0,0 +1,45 @@
+"""
+Cache Tags
+
+Every cached response is tagged with the collections it was rendered from. Repository write
+methods invalidate the tags of every collection whose responses embed the rows they change.
+"""
+
+# Game listing, detail, search and top-rated responses (embed genre, developer and publisher)
+GAMES = 'games'
+
+# Game detail and top-rated responses (embed the rating aggregates kept up to date by reviews)
+RATINGS = 'ratings'
+
+# Developer responses
+DEVELOPERS = 'developers'
+
+# Identity claims of access and refresh tokens confirmed by app.identity (no responses)
+IDENTITIES = 'identities'
+
+# Follower and following responses (embed usernames)
+FOLLOWERS = 'followers'
+
+# Game status responses
+GAME_STATUSES = 'game_statuses'
+
+# Genre responses
+GENRES = 'genres'
+
+# Platform responses
+PLATFORMS = 'platforms'
+
+# Publisher responses
+PUBLISHERS = 'publishers'
+
+# User backlog responses (embed game titles)
+USER_BACKLOGS = 'user_backlogs'
+
+# User game list responses (embed game titles)
+USER_GAMELISTS = 'user_gamelists'
+
+# User review responses (embed the username, game title and status name)
+USER_REVIEWS = 'user_reviews'
+
+# User responses
+USERS = 'users'
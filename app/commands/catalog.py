@@ -0,0 +1,31 @@
+import click
+from flask.cli import AppGroup
+from app.services.catalog_import_service import CatalogImportService
+
+
+# Create a catalog_cli
+catalog_cli = AppGroup('catalog')
+
+@catalog_cli.command("import")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'format', type=click.Choice(['jsonl', 'csv']), help='Format of the file (default is inferred from its extension).')
+@click.option('--batch-size', default=1000, show_default=True, type=click.IntRange(min=1), help='Records written and committed together.')
+def import_catalog_command(file, format, batch_size):
+    def report(result):
+        click.echo(f'{result.rows} rows, {result.rows_per_second:.0f} rows/sec', err=True)
+
+    try:
+        result = CatalogImportService().import_file(file, format, batch_size, on_batch=report)
+    except ValueError as err:
+        raise click.UsageError(str(err))
+
+    for line, messages in result.errors:
+        click.echo(f'Line {line}: {messages}', err=True)
+
+    print(f'Catalog imported: {result.rows} rows in {result.seconds:.1f}s ({result.rows_per_second:.0f} rows/sec), '
+          f'{result.created} created, {result.updated} updated, {result.invalid} invalid, {result.links} platform links added.')
+
+
+# Register the catalog_cli with the app
+def register_catalog_commands(app):
+    app.cli.add_command(catalog_cli)
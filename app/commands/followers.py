@@ -0,0 +1,16 @@
+from flask.cli import AppGroup
+from app.repositories.follower_repository import FollowerRepository
+
+
+# Create a followers_cli
+followers_cli = AppGroup('followers')
+
+@followers_cli.command("rebuild-counts")
+def rebuild_counts_command():
+    FollowerRepository().rebuild_counts()
+    print('Follow counters rebuilt!')
+
+
+# Register the followers_cli with the app
+def register_followers_commands(app):
+    app.cli.add_command(followers_cli)
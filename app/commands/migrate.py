@@ -0,0 +1,34 @@
+import click
+
+
+class _MigrateCommand(click.Command):
+    '''
+    Stand-in for Flask-Migrate's "flask db" group.
+
+    Flask-Migrate imports alembic, which only the migration commands need, so the extension
+    is set up and its group imported when "flask db" is invoked rather than by every
+    create_app. All arguments, --help included, are passed through to the real group.
+    '''
+
+    def __init__(self, app) -> None:
+        super().__init__(
+            'db',
+            help='Perform database migrations.',
+            add_help_option=False,
+            context_settings={'ignore_unknown_options': True, 'allow_extra_args': True}
+        )
+        self.app = app
+
+    def invoke(self, ctx):
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_cli
+        from app import db
+
+        Migrate(self.app, db)
+        with db_cli.make_context(ctx.info_name, list(ctx.args), parent=ctx.parent) as db_ctx:
+            return db_cli.invoke(db_ctx)
+
+
+# Register the db command with the app
+def register_migrate_commands(app):
+    app.cli.add_command(_MigrateCommand(app))
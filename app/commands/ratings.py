@@ -0,0 +1,16 @@
+from flask.cli import AppGroup
+from app.repositories.game_rating_stats_repository import GameRatingStatsRepository
+
+
+# Create a ratings_cli
+ratings_cli = AppGroup('ratings')
+
+@ratings_cli.command("rebuild")
+def rebuild_ratings_command():
+    games = GameRatingStatsRepository().rebuild()
+    print(f'Rating aggregates rebuilt for {games} games!')
+
+
+# Register the ratings_cli with the app
+def register_ratings_commands(app):
+    app.cli.add_command(ratings_cli)
@@ -0,0 +1,23 @@
+import click
+from flask.cli import AppGroup
+from app.services.recommendation_service import RecommendationService
+
+
+# Create a recommendations_cli
+recommendations_cli = AppGroup('recommendations')
+
+@recommendations_cli.command("compute")
+@click.option('--chunk-size', default=1000, show_default=True, type=click.IntRange(min=1), help='Games written and committed together.')
+@click.option('--max-user-games', default=1000, show_default=True, type=click.IntRange(min=1), help='Leave out users who interacted with more games than this.')
+def compute_recommendations_command(chunk_size, max_user_games):
+    def report(result):
+        click.echo(f'{result.games} games, {result.seconds:.1f}s', err=True)
+
+    result = RecommendationService().compute(chunk_size, max_user_games, on_chunk=report)
+    print(f'Similar games computed: {result.games} games, {result.similarities} neighbours '
+          f'from {result.interactions} interactions in {result.seconds:.1f}s.')
+
+
+# Register the recommendations_cli with the app
+def register_recommendations_commands(app):
+    app.cli.add_command(recommendations_cli)
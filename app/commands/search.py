@@ -0,0 +1,16 @@
+from flask.cli import AppGroup
+from app.repositories.game_search_repository import GameSearchRepository
+
+
+# Create a search_cli
+search_cli = AppGroup('search')
+
+@search_cli.command("rebuild")
+def rebuild_search_command():
+    GameSearchRepository().rebuild()
+    print('Game search index rebuilt!')
+
+
+# Register the search_cli with the app
+def register_search_commands(app):
+    app.cli.add_command(search_cli)
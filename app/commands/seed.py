@@ -1,3 +1,4 @@
+import click
 from flask.cli import AppGroup
 from app.seeds import (
     seed_developers,
@@ -6,6 +7,7 @@ from app.seeds import (
     seed_genres,
     seed_platforms,
     seed_publishers,
+    seed_synthetic,
     seed_users
 )
 
@@ -42,6 +44,17 @@ def seed_publishers_command():
 def seed_users_command():
     seed_users()
 
+# Large, skewed dataset for performance work
+@seed_cli.command("synthetic")
+@click.option('--users', default=10000, show_default=True, type=click.IntRange(min=1), help='Users to create.')
+@click.option('--games', default=5000, show_default=True, type=click.IntRange(min=1), help='Games to create.')
+@click.option('--reviews-per-user', default=20, show_default=True, type=click.IntRange(min=0), help='Distinct games each user reviews.')
+@click.option('--follows-per-user', default=10, show_default=True, type=click.IntRange(min=0), help='Distinct users each user follows.')
+@click.option('--seed', type=int, help='Random seed, for a repeatable distribution.')
+@click.option('--batch-size', default=5000, show_default=True, type=click.IntRange(min=1), help='Rows written per statement and commit.')
+def seed_synthetic_command(users, games, reviews_per_user, follows_per_user, seed, batch_size):
+    seed_synthetic(users, games, reviews_per_user, follows_per_user, seed=seed, batch_size=batch_size)
+
 # Full seed command
 @seed_cli.command("all")
 def seed_command():
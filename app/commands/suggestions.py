@@ -0,0 +1,24 @@
+import click
+from flask.cli import AppGroup
+from app.services.user_suggestion_service import UserSuggestionService
+
+
+# Create a suggestions_cli
+suggestions_cli = AppGroup('suggestions')
+
+@suggestions_cli.command("compute")
+@click.option('--full', is_flag=True, help='Recompute every user instead of only those whose follows changed.')
+@click.option('--chunk-size', default=1000, show_default=True, type=click.IntRange(min=1), help='Users written and committed together.')
+@click.option('--max-degree', default=5000, show_default=True, type=click.IntRange(min=1), help='Skip followed users who follow more users than this.')
+def compute_suggestions_command(full, chunk_size, max_degree):
+    def report(result):
+        click.echo(f'{result.users} users, {result.seconds:.1f}s', err=True)
+
+    result = UserSuggestionService().compute(full, chunk_size, max_degree, on_chunk=report)
+    print(f'Suggestions computed: {result.users} users, {result.suggestions} suggestions '
+          f'from {result.edges} follow edges in {result.seconds:.1f}s.')
+
+
+# Register the suggestions_cli with the app
+def register_suggestions_commands(app):
+    app.cli.add_command(suggestions_cli)
@@ -3,4 +3,112 @@ class ProductionConfig():
         self.ENV = 'production'
         self.DEBUG = False
         self.PORT = 80
-        self.HOST = '0.0.0.0'
\ No newline at end of file
+        self.HOST = '0.0.0.0'
+
+        # Database engine and connection pool (pool sizes do not apply to in-memory SQLite)
+        self.DB_POOL_SIZE = 10
+        self.DB_MAX_OVERFLOW = 20
+        self.DB_POOL_TIMEOUT = 10
+        self.DB_POOL_RECYCLE = 1800
+        self.DB_POOL_PRE_PING = True
+        self.DB_STATEMENT_TIMEOUT_MS = 15000
+
+        # Addresses allowed to call the /internal endpoints
+        self.INTERNAL_ALLOWED_IPS = ['127.0.0.1', '::1']
+
+        # Prometheus metrics served at /metrics (fraction of requests timed in detail)
+        self.METRICS_ENABLED = True
+        self.METRICS_SAMPLE_RATE = 0.1
+
+        # bcrypt cost (log2 rounds) of new password hashes; hashes made with another cost are
+        # upgraded on the next successful login
+        self.PASSWORD_HASH_ROUNDS = 12
+        # Processes hashing and checking passwords per application process (0 hashes on the
+        # request thread), and the hashes that may be running or queued before requests get 503
+        self.PASSWORD_HASH_WORKERS = 4
+        self.PASSWORD_HASH_MAX_PENDING = 64
+
+        # (user, token version) pairs confirmed against the users table, kept per process so
+        # authenticated requests skip the database
+        self.IDENTITY_CACHE_SIZE = 10000
+
+        # Maximum number of reviews accepted by POST /user_reviews/batch
+        self.REVIEW_BATCH_MAX_ITEMS = 1000
+
+        # Users with more followers than this have their activities pulled into feeds at read
+        # time instead of fanned out to every follower's timeline on write
+        self.FEED_FANOUT_MAX_FOLLOWERS = 10000
+        # Number of recent activities copied into the timeline of a new follower
+        self.FEED_BACKFILL_SIZE = 50
+
+        # Maximum number of user IDs accepted by GET /followers/relationship
+        self.FOLLOWER_RELATIONSHIP_MAX_IDS = 100
+
+        # Number of suggestions kept per user by flask suggestions compute
+        self.SUGGESTIONS_TOP_K = 20
+
+        # Number of neighbours kept per game by flask recommendations compute
+        self.GAME_SIMILAR_TOP_N = 20
+        # Recent reviews and backlog entries whose neighbours seed a user's recommendations,
+        # and the lowest review score that counts as liking a game
+        self.RECOMMENDATION_SEED_GAMES = 50
+        self.RECOMMENDATION_MIN_SCORE = 6
+
+        # Number of values returned per facet by GET /games/
+        self.GAME_FACET_MAX_VALUES = 50
+
+        # Maximum number of game IDs accepted by GET /game_platforms/games
+        self.GAME_PLATFORM_MAX_IDS = 100
+
+        # Maximum number of links accepted by POST and DELETE /game_platforms/links
+        self.GAME_PLATFORM_MAX_LINKS = 1000
+
+        # Maximum number of games accepted by the bulk add, remove and reorder routes of /user_gamelists
+        self.GAMELIST_MAX_GAMES = 1000
+
+        # Pagination
+        self.PAGINATION_DEFAULT_LIMIT = 20
+        self.PAGINATION_MAX_LIMIT = 100
+
+        # Seconds the reference tables (genres, platforms, ...) are cached in-process
+        self.REFERENCE_CACHE_TTL = 300
+
+        # Shared response cache: 'memory' (one process), 'file' (one host) or 'redis'; the file
+        # backend removes expired entries every CACHE_SWEEP_INTERVAL seconds
+        self.CACHE_BACKEND = 'file'
+        self.CACHE_DEFAULT_TIMEOUT = 300
+        self.CACHE_MAX_ENTRIES = 1024
+        self.CACHE_DIR = '/tmp/bonfire-cache'
+        self.CACHE_SWEEP_INTERVAL = 300
+        self.CACHE_REDIS_URL = 'redis://localhost:6379/0'
+
+        # Store of the JTIs revoked by logout until their tokens expire: 'memory' (one process),
+        # 'file' (one host) or 'redis'; the file store is swept every REVOCATION_SWEEP_INTERVAL seconds
+        self.REVOCATION_BACKEND = 'file'
+        self.REVOCATION_DIR = '/tmp/bonfire-revoked'
+        self.REVOCATION_SWEEP_INTERVAL = 60
+        self.REVOCATION_REDIS_URL = 'redis://localhost:6379/0'
+
+        # Token bucket policies by name: every rule gives each client IP or username a bucket of
+        # burst requests refilled at per_minute requests a minute; failures_only rules are only
+        # charged by the requests that fail
+        self.RATE_LIMITS = {
+            # POST /auth/login: bcrypt checks per client, and wrong guesses per targeted account
+            'login': [
+                {'by': 'ip', 'burst': 10, 'per_minute': 10},
+                {'by': 'username', 'burst': 5, 'per_minute': 2, 'failures_only': True}
+            ],
+            # POST /users/: bcrypt hashes of new accounts per client
+            'register': [{'by': 'ip', 'burst': 5, 'per_minute': 1}],
+            # Every other API route, per client IP
+            'api': [{'by': 'ip', 'burst': 120, 'per_minute': 600}],
+        }
+        # Store of the buckets: 'memory' (one process), 'shared' (a memory-mapped table shared
+        # by the workers of one host) or 'redis', and the number of buckets kept per process or host
+        self.RATE_LIMIT_BACKEND = 'shared'
+        self.RATE_LIMIT_MAX_ENTRIES = 65536
+        self.RATE_LIMIT_SHM_PATH = '/dev/shm/bonfire-rate-limits'
+        self.RATE_LIMIT_REDIS_URL = 'redis://localhost:6379/0'
+
+        # Fail requests that issue more SQL statements than this (None disables the check)
+        self.SQL_QUERY_BUDGET = None
\ No newline at end of file
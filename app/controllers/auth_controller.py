@@ -1,8 +1,9 @@
 from flask import Blueprint, jsonify, request
 from app.services.auth_service import AuthService
-from app.schemas.auth_schema import LoginSchema, AuthSchema
+from app.schemas.auth_schema import LoginSchema, AuthSchema, LogoutSchema
 from marshmallow import ValidationError
-from flask_jwt_extended import get_jwt_identity, jwt_required
+from flask_jwt_extended import current_user, get_jwt, jwt_required
+from app import limiter
 
 """
 Auth Controller
@@ -20,6 +21,7 @@ POST /login:
     - Responses:
         - 200: User logged in successfully, returns the authentication token.
         - 400: Invalid credentials provided.
+        - 429: Too many attempts from this client or for this username, see Retry-After.
 
 POST /refresh:
     Refresh the access token.
@@ -29,6 +31,17 @@ POST /refresh:
         - 200: Access token refreshed successfully, returns the new access token.
         - 401: Invalid or expired refresh token.
 
+POST /logout:
+    Revoke the token of the request until it expires.
+    - Headers:
+        - Authorization: Bearer <access_token or refresh_token>
+    - Request Body (optional):
+        - refresh_token (str): A refresh token of the same user, revoked as well.
+    - Responses:
+        - 200: Token revoked, later requests with it get 401.
+        - 400: Invalid request body, or a refresh token of another user.
+        - 401: Invalid, expired or already revoked token.
+
 Attributes:
 -----------
 auth : Blueprint
@@ -40,6 +53,7 @@ auth = Blueprint('auth', __name__)
 
 # Auth Controller Routes
 @auth.route('/login', methods=['POST'])
+@limiter.limit('login')
 def login(auth_service: AuthService = AuthService()):
     """
     Login a user.
@@ -78,6 +92,8 @@ def login(auth_service: AuthService = AuthService()):
     try:
         response = auth_schema.load(auth_status)
     except ValidationError as err:
+        # Only wrong guesses count against the account
+        limiter.penalize('login')
         return jsonify(auth_status), 400
     
     return jsonify(response), 200
@@ -106,18 +122,18 @@ def refresh(auth_service: AuthService = AuthService()):
     Response
         JSON response containing the new access token if the refresh token is valid, or an error message if the token is invalid or expired.
     """
-    current_user_id = get_jwt_identity()
-    new_access_token = auth_service.refresh(current_user_id)
+    new_access_token = auth_service.refresh(current_user)
     return jsonify(new_access_token), 200
 
 
 @auth.route('/logout', methods=['POST'])
-@jwt_required()
+@jwt_required(verify_type=False)
 def logout(auth_service: AuthService = AuthService()):
     """
     Logout the current user.
 
-    This route handles logging out the current user by revoking the access token.
+    This route handles logging out the current user by revoking the token of the request, either an
+    access or a refresh token, and the refresh token in the body if one is given.
 
     Parameters:
     -----------
@@ -130,7 +146,14 @@ def logout(auth_service: AuthService = AuthService()):
         JSON response indicating whether the logout was successful.
 
     """
-    auth_service.logout()
-    return jsonify({'message': 'Logout successful!'}), 200
+    try:
+        data = LogoutSchema().load(request.get_json(silent=True) or {})
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    response = auth_service.logout(get_jwt(), data.get('refresh_token'))
+    if response is None:
+        return jsonify({'message': 'Refresh token belongs to another user'}), 400
+    return jsonify(response), 200
 
 
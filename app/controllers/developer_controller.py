@@ -1,4 +1,6 @@
 from flask import Blueprint, request, jsonify
+from app import cache
+from app.cache import tags
 from app.schemas.developer_schema import DeveloperSchema
 from app.services.developer_service import DeveloperService
 
@@ -34,6 +36,7 @@ developers = Blueprint('developers', __name__)
 
 # Developer Controller Routes
 @developers.route('/<int:developer_id>', methods=['GET'])
+@cache.conditional(tags.DEVELOPERS)
 def get_developer(developer_id, developer_service: DeveloperService = DeveloperService()):
     """
     Get a developer by ID.
@@ -59,6 +62,7 @@ def get_developer(developer_id, developer_service: DeveloperService = DeveloperS
     return jsonify(DeveloperSchema().dump(developer)), 200
 
 @developers.route('/', methods=['GET'])
+@cache.conditional(tags.DEVELOPERS)
 def get_all_developers(developer_service: DeveloperService = DeveloperService()):
     """
     Get all developers.
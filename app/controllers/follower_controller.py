@@ -1,8 +1,13 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+from app import cache
+from app.cache import tags
 from app.services.follower_service import FollowerService
-from app.schemas.follower_schema import FollowerSchema, CreateOrDeleteFollowerSchema
+from app.schemas.follower_schema import FollowerSchema, CreateOrDeleteFollowerSchema, RelationshipArgsSchema, RelationshipSchema
+from app.schemas.pagination_schema import PageArgsSchema
+from app.repositories import load_plans
 from marshmallow import ValidationError
-from flask_jwt_extended import jwt_required
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.query_budget import query_budget
 
 """
 Follower Controller
@@ -32,21 +37,36 @@ DELETE /followers/unfollow:
         - 404: Already unfollowed or user not found.
 
 GET /followers/<int:user_id>:
-    Get all followers for a given user.
+    Get a page of followers for a given user.
     - Authentication: Not required.
     - Path Parameters:
         - user_id (int): The ID of the user whose followers are to be retrieved.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of followers to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
         - 200: Successfully retrieved the list of followers.
 
 GET /followers/following/<int:follower_id>:
-    Get all users that a given user is following.
+    Get a page of users that a given user is following.
     - Authentication: Not required.
     - Path Parameters:
         - follower_id (int): The ID of the user whose following list is to be retrieved.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of users to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
         - 200: Successfully retrieved the list of users the given user is following.
 
+GET /followers/relationship:
+    Get whether the authenticated user follows, and is followed by, each of several users.
+    - Authentication: Required (JWT).
+    - Query Parameters:
+        - ids (str): Comma-separated user IDs, at most FOLLOWER_RELATIONSHIP_MAX_IDS of them.
+    - Responses:
+        - 200: The following and followed_by flags of each user, in the order given.
+        - 400: Missing, malformed or too many IDs.
+
 Attributes:
 -----------
 followers : Blueprint
@@ -57,7 +77,10 @@ followers : Blueprint
 followers = Blueprint('followers', __name__)
 
 # Follower Controller Routes
+# Existence checks, the relation, both counters, stale suggestions, the feed backfill and
+# the reloaded response (measured: 11)
 @followers.route('/follow', methods=['POST'])
+@query_budget(11)
 @jwt_required()
 def follow(follower_service: FollowerService = FollowerService()):
     """
@@ -135,6 +158,7 @@ def unfollow(follower_service: FollowerService = FollowerService()):
     return jsonify({'message': 'Unfollowed successfully'}), 204
 
 @followers.route('/<int:user_id>', methods=['GET'])
+@cache.conditional(tags.FOLLOWERS)
 def get_followers(user_id, follower_service: FollowerService = FollowerService()):
     """
     Get all followers for a given user.
@@ -150,15 +174,28 @@ def get_followers(user_id, follower_service: FollowerService = FollowerService()
     follower_service : FollowerService, optional
         The follower service instance (default is a new instance of FollowerService).
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of followers to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of followers for the specified user.
+        JSON response containing a page of followers for the specified user and the next cursor.
     """
-    followers = follower_service.get_followers(user_id)
-    return jsonify(FollowerSchema(many=True).dump(followers)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    followers = follower_service.get_followers(user_id, **page_args, options=load_plans.FOLLOWER)
+    return jsonify(followers.dump(FollowerSchema(many=True))), 200
 
 @followers.route('/following/<int:follower_id>', methods=['GET'])
+@cache.conditional(tags.FOLLOWERS)
 def get_following(follower_id, follower_service: FollowerService = FollowerService()):
     """
     Get all users that a given user is following.
@@ -174,10 +211,61 @@ def get_following(follower_id, follower_service: FollowerService = FollowerServi
     follower_service : FollowerService, optional
         The follower service instance (default is a new instance of FollowerService).
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of users to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
+    Returns:
+    --------
+    Response
+        JSON response containing a page of users the specified user is following and the next cursor.
+    """
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    following = follower_service.get_following(follower_id, **page_args, options=load_plans.FOLLOWER)
+    return jsonify(following.dump(FollowerSchema(many=True))), 200
+
+@followers.route('/relationship', methods=['GET'])
+@jwt_required()
+def get_relationships(follower_service: FollowerService = FollowerService()):
+    """
+    Get whether the current user follows, and is followed by, each of several users.
+
+    This route answers every ID with one indexed query, so clients rendering a list of users
+    can show their follow buttons without a request per user.
+
+    Authentication: Required (JWT).
+
+    Parameters:
+    -----------
+    follower_service : FollowerService, optional
+        The follower service instance (default is a new instance of FollowerService).
+
+    Query Parameters:
+    -----------------
+    ids : str
+        Comma-separated IDs of the other users.
+
     Returns:
     --------
     Response
-        JSON response containing a list of users the specified user is following.
+        JSON response containing the id, following and followed_by flags of each user.
     """
-    following = follower_service.get_following(follower_id)
-    return jsonify(FollowerSchema(many=True).dump(following)), 200
+    try:
+        args = RelationshipArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    max_ids = current_app.config['FOLLOWER_RELATIONSHIP_MAX_IDS']
+    if len(args['ids']) > max_ids:
+        return jsonify({'ids': [f'At most {max_ids} user IDs may be given.']}), 400
+
+    relationships = follower_service.get_relationships(int(get_jwt_identity()), args['ids'])
+    return jsonify(RelationshipSchema(many=True).dump(relationships)), 200
+
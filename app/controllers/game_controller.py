@@ -1,7 +1,11 @@
 from flask import Blueprint, request, jsonify
+from app import cache
+from app.cache import tags
 from marshmallow import ValidationError
-from app.schemas.game_schema import GameSchema
+from app.schemas.game_schema import GameSchema, GameDetailSchema, TopRatedGameSchema, TopRatedArgsSchema, GameSearchArgsSchema, SimilarGameSchema, GameBrowseArgsSchema
 from app.services.game_service import GameService
+from app.services.recommendation_service import RecommendationService
+from app.repositories import load_plans
 
 
 """
@@ -13,7 +17,7 @@ It uses Flask's Blueprint to organize the routes and Marshmallow for data valida
 Routes:
 -------
 GET /games/<int:game_id>:
-    Get a game by its ID.
+    Get a game by its ID, including its rating aggregates.
     - Authentication: Not required.
     - Path Parameters:
         - game_id (int): The ID of the game to retrieve.
@@ -22,18 +26,47 @@ GET /games/<int:game_id>:
         - 404: Game not found.
 
 GET /games/:
-    Get a list of all games.
+    Browse games, with the game counts of every facet for the current filters.
     - Authentication: Not required.
+    - Query Parameters:
+        - genre, platform, developer, publisher (int, optional): Only games with this ID.
+        - year_from, year_to (int, optional): Only games released within these years.
+        - sort (str, optional): 'title' (default), 'release_date' or '-release_date'.
+        - limit (int, optional): The maximum number of games to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: List of games returned successfully.
+        - 200: Page of games, the next cursor and the facet counts returned successfully.
+        - 400: Invalid query parameters.
 
-GET /games/title:
-    Get games by their title.
+GET /games/top-rated:
+    Get a page of games ordered by average review score, best first.
     - Authentication: Not required.
-    - Request Body:
-        - title (str): The title of the game to retrieve.
+    - Query Parameters:
+        - min_reviews (int, optional): The minimum number of reviews a game needs to be ranked (default is 1).
+        - limit (int, optional): The maximum number of games to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: Game(s) found and returned successfully.
+        - 200: Page of rated games and the next cursor returned successfully.
+        - 400: Invalid query parameters.
+
+GET /games/search:
+    Search games by title and description, most relevant first.
+    - Authentication: Not required.
+    - Query Parameters:
+        - q (str): The search text. The last word also matches as a prefix.
+        - limit (int, optional): The maximum number of games to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+    - Responses:
+        - 200: Page of matching games and the next cursor returned successfully.
+        - 400: Invalid query parameters.
+
+GET /games/<int:game_id>/similar:
+    Get the games most similar to a game, from review and backlog co-occurrence.
+    - Authentication: Not required.
+    - Path Parameters:
+        - game_id (int): The ID of the game.
+    - Responses:
+        - 200: Similar games returned successfully (empty until flask recommendations compute has run).
         - 404: Game not found.
 
 Attributes:
@@ -47,11 +80,14 @@ games = Blueprint('games', __name__)
 
 # Games Controller Routes
 @games.route('/<int:game_id>', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.RATINGS)
+@cache.cached(tags.GAMES, tags.RATINGS)
 def get_game(game_id, game_service: GameService = GameService()):
     """
     Get a game by ID.
 
-    This route retrieves a game using its unique ID.
+    This route retrieves a game using its unique ID, along with its average score,
+    review count and score histogram.
 
     Authentication: Not required.
 
@@ -67,18 +103,24 @@ def get_game(game_id, game_service: GameService = GameService()):
     Response
         JSON response containing the game details if the game is found, or a 404 error message if not found.
     """
-    game = game_service.get(game_id)
+    game = game_service.get(game_id, options=load_plans.GAME_DETAIL)
     if not game:
         return jsonify({'message': 'Game not found'}), 404
 
-    return jsonify(GameSchema().dump(game)), 200
+    return jsonify(GameDetailSchema().dump(game)), 200
 
 @games.route('/', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.PLATFORMS)
+@cache.cached(tags.GAMES, tags.PLATFORMS)
 def get_all_games(game_service: GameService = GameService()):
     """
-    Get all games.
+    Browse games.
 
-    This route retrieves a list of all available games.
+    This route retrieves a page of the games matching the optional filters, ordered by title
+    or release date. Pass the returned next_cursor as the cursor query parameter to fetch the
+    following page. The response also carries, for each facet (genre, platform, developer,
+    publisher and release year), the number of games each value would show with the other
+    filters applied; the counts are cached per filter set.
 
     Authentication: Not required.
 
@@ -87,20 +129,42 @@ def get_all_games(game_service: GameService = GameService()):
     game_service : GameService, optional
         The game service instance (default is a new instance of GameService).
 
+    Query Parameters:
+    -----------------
+    genre, platform, developer, publisher : int, optional
+        Only games with this genre, platform, developer or publisher ID.
+    year_from, year_to : int, optional
+        Only games released from year_from through year_to.
+    sort : str, optional
+        'title' (default), 'release_date' or '-release_date'.
+    limit : int, optional
+        The maximum number of games to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of all games.
+        JSON response containing a page of games, the next cursor and the facet counts.
     """
-    games = game_service.get_all()
-    return jsonify(GameSchema(many=True).dump(games)), 200
+    try:
+        args = GameBrowseArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    filters = {name: args.get(name) for name in ('genre', 'platform', 'developer', 'publisher', 'year_from', 'year_to')}
+    games = game_service.browse(filters, args['sort'], args.get('limit'), args.get('cursor'), options=load_plans.GAME)
+    return jsonify({**games.dump(GameSchema(many=True)), 'facets': game_service.get_facets(filters)}), 200
 
-@games.route('/title', methods=['GET'])
-def get_games_by_title(game_service: GameService = GameService()):
+@games.route('/top-rated', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.RATINGS)
+@cache.cached(tags.GAMES, tags.RATINGS)
+def get_top_rated_games(game_service: GameService = GameService()):
     """
-    Get games by their title.
+    Get the top-rated games.
 
-    This route retrieves games based on their title. The title is passed in the request body.
+    This route retrieves a page of games ordered by their average review score, best first.
+    The ranking reads the precomputed rating aggregates, so it never scans the reviews.
 
     Authentication: Not required.
 
@@ -109,19 +173,100 @@ def get_games_by_title(game_service: GameService = GameService()):
     game_service : GameService, optional
         The game service instance (default is a new instance of GameService).
 
-    Request Body:
-    -------------
-    title : str
-        The title of the game to retrieve.
+    Query Parameters:
+    -----------------
+    min_reviews : int, optional
+        The minimum number of reviews a game needs to be ranked (default is 1).
+    limit : int, optional
+        The maximum number of games to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
 
     Returns:
     --------
     Response
-        JSON response containing the game(s) if found, or a 404 error message if no games are found with the given title.
+        JSON response containing a page of games with their rating aggregates and the next cursor.
     """
-    title = request.get_json().get('title')
-    game = game_service.get_by_title(title)
-    if not game:
+    try:
+        args = TopRatedArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    top_rated = game_service.get_top_rated(**args, options=load_plans.TOP_RATED_GAME)
+    return jsonify(top_rated.dump(TopRatedGameSchema(many=True))), 200
+
+@games.route('/search', methods=['GET'])
+@cache.conditional(tags.GAMES)
+@cache.cached(tags.GAMES)
+def search_games(game_service: GameService = GameService()):
+    """
+    Search games.
+
+    This route runs a ranked full-text search over the title and description of games.
+    Every word must match and the last word also matches as a prefix, so it can back
+    search-as-you-type inputs. The search text is read from the query string, which keeps
+    responses cacheable.
+
+    Authentication: Not required.
+
+    Parameters:
+    -----------
+    game_service : GameService, optional
+        The game service instance (default is a new instance of GameService).
+
+    Query Parameters:
+    -----------------
+    q : str
+        The search text.
+    limit : int, optional
+        The maximum number of games to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
+    Returns:
+    --------
+    Response
+        JSON response containing a page of matching games and the next cursor.
+    """
+    try:
+        args = GameSearchArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    games = game_service.search(args.pop('q'), **args, options=load_plans.GAME)
+    return jsonify(games.dump(GameSchema(many=True))), 200
+
+@games.route('/<int:game_id>/similar', methods=['GET'])
+@cache.conditional(tags.GAMES)
+@cache.cached(tags.GAMES)
+def get_similar_games(game_id,
+                      game_service: GameService = GameService(),
+                      recommendation_service: RecommendationService = RecommendationService()):
+    """
+    Get the games most similar to a game.
+
+    This route reads the neighbours precomputed by flask recommendations compute from the
+    reviews and backlog entries users share between games, most similar first.
+
+    Authentication: Not required.
+
+    Parameters:
+    -----------
+    game_id : int
+        The ID of the game.
+    game_service : GameService, optional
+        The game service instance (default is a new instance of GameService).
+    recommendation_service : RecommendationService, optional
+        The recommendation service instance (default is a new instance of RecommendationService).
+
+    Returns:
+    --------
+    Response
+        JSON response containing the similar games and their scores, or a 404 error message if the game is not found.
+    """
+    if not game_service.get(game_id):
         return jsonify({'message': 'Game not found'}), 404
 
-    return jsonify(GameSchema(many=True).dump(game)), 200
+    similar = recommendation_service.get_similar(game_id, options=load_plans.SIMILAR_GAME)
+    return jsonify(SimilarGameSchema(many=True).dump(similar)), 200
+
@@ -1,7 +1,11 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from app import cache
+from app.cache import tags
 from app.services.game_platform_service import GamePlatformService
-from app.schemas.game_platform_schema import GamePlatformSchema, CreateOrDeleteGamePlatform
+from app.schemas.game_platform_schema import PlatformLinkSchema, GamePlatformsSchema, PlatformGameSchema, GameIdsArgsSchema, GamePlatformLinksSchema
+from app.schemas.pagination_schema import PageArgsSchema
 from marshmallow import ValidationError
+from flask_jwt_extended import jwt_required
 
 """
 Game Platform Controller
@@ -19,13 +23,44 @@ GET /game_platforms/games/<int:game_id>:
     - Responses:
         - 200: List of platforms returned successfully.
 
+GET /game_platforms/games:
+    Get the platforms of several games with one query.
+    - Authentication: Not required.
+    - Query Parameters:
+        - ids (str): Comma-separated game IDs, at most GAME_PLATFORM_MAX_IDS of them.
+    - Responses:
+        - 200: The game_id and platforms of each game, in the order given.
+        - 400: Missing, malformed or too many IDs.
+
 GET /game_platforms/platforms/<int:platform_id>:
-    Get all games for a given platform.
+    Get a page of the games for a given platform.
     - Authentication: Not required.
     - Path Parameters:
         - platform_id (int): The ID of the platform to retrieve games for.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of games to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: List of games returned successfully.
+        - 200: Page of games returned successfully.
+
+POST /game_platforms/links:
+    Link games to platforms.
+    - Authentication: Required (JWT).
+    - Request Body:
+        - links (list): The game_id and platform_id of each link, at most GAME_PLATFORM_MAX_LINKS.
+    - Responses:
+        - 201: The number of links created; existing links are skipped.
+        - 400: Validation error for input data.
+        - 404: Some of the games or platforms do not exist.
+
+DELETE /game_platforms/links:
+    Unlink games from platforms.
+    - Authentication: Required (JWT).
+    - Request Body:
+        - links (list): The game_id and platform_id of each link, at most GAME_PLATFORM_MAX_LINKS.
+    - Responses:
+        - 200: The number of links deleted.
+        - 400: Validation error for input data.
 
 Attributes:
 -----------
@@ -36,8 +71,29 @@ game_platforms : Blueprint
 # Blueprint for game platforms
 game_platforms = Blueprint('game_platforms', __name__)
 
+def _load_links():
+    '''
+    Validate the body of the bulk link and unlink endpoints.
+
+    Returns:
+    -------
+    tuple[list[dict], Response]
+        The links, or None and the 400 response describing the errors.
+    '''
+    try:
+        links = GamePlatformLinksSchema().load(request.get_json(silent=True) or {})['links']
+    except ValidationError as err:
+        return None, (jsonify(err.messages), 400)
+
+    max_links = current_app.config['GAME_PLATFORM_MAX_LINKS']
+    if len(links) > max_links:
+        return None, (jsonify({'links': [f'At most {max_links} links may be given.']}), 400)
+    return links, None
+
 # Game Platform Controller Routes
 @game_platforms.route('/games/<int:game_id>', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.PLATFORMS)
+@cache.cached(tags.GAMES, tags.PLATFORMS)
 def get_platform_by_game(game_id: int, game_platform_service: GamePlatformService = GamePlatformService()):
     """
     Get all platforms for a given game.
@@ -56,17 +112,58 @@ def get_platform_by_game(game_id: int, game_platform_service: GamePlatformServic
     Returns:
     --------
     Response
-        JSON response containing the list of platforms for the specified game.
+        JSON response containing the id and name of each platform for the specified game.
     """
     platforms = game_platform_service.get_platform_by_game(game_id)
-    return jsonify(GamePlatformSchema(many=True).dump(platforms)), 200
+    return jsonify(PlatformLinkSchema(many=True).dump(platforms)), 200
+
+@game_platforms.route('/games', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.PLATFORMS)
+@cache.cached(tags.GAMES, tags.PLATFORMS)
+def get_platforms_by_games(game_platform_service: GamePlatformService = GamePlatformService()):
+    """
+    Get the platforms of several games.
+
+    This route answers every ID with one query, so clients rendering a list of games can
+    show their platforms without a request per game.
+
+    Authentication: Not required.
+
+    Parameters:
+    -----------
+    game_platform_service : GamePlatformService, optional
+        The game platform service instance (default is a new instance of GamePlatformService).
+
+    Query Parameters:
+    -----------------
+    ids : str
+        Comma-separated IDs of the games.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the game_id and platforms of each game.
+    """
+    try:
+        args = GameIdsArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    max_ids = current_app.config['GAME_PLATFORM_MAX_IDS']
+    if len(args['ids']) > max_ids:
+        return jsonify({'ids': [f'At most {max_ids} game IDs may be given.']}), 400
+
+    platforms = game_platform_service.get_platforms_by_games(args['ids'])
+    return jsonify(GamePlatformsSchema(many=True).dump(platforms)), 200
 
 @game_platforms.route('/platforms/<int:platform_id>', methods=['GET'])
+@cache.conditional(tags.GAMES, tags.PLATFORMS)
+@cache.cached(tags.GAMES, tags.PLATFORMS)
 def get_game_by_platform(platform_id: int, game_platform_service: GamePlatformService = GamePlatformService()):
     """
     Get all games for a given platform.
 
-    This route retrieves all games associated with a specific platform by its ID.
+    This route retrieves a page of the games associated with a specific platform by its ID.
 
     Authentication: Not required.
 
@@ -77,10 +174,90 @@ def get_game_by_platform(platform_id: int, game_platform_service: GamePlatformSe
     game_platform_service : GamePlatformService, optional
         The game platform service instance (default is a new instance of GamePlatformService).
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of games to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing the list of games for the specified platform.
+        JSON response containing a page of the id and title of the games for the specified platform.
     """
-    games = game_platform_service.get_game_by_platform(platform_id)
-    return jsonify(GamePlatformSchema(many=True).dump(games)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    games = game_platform_service.get_game_by_platform(platform_id, **page_args)
+    return jsonify(games.dump(PlatformGameSchema(many=True))), 200
+
+@game_platforms.route('/links', methods=['POST'])
+@jwt_required()
+def link(game_platform_service: GamePlatformService = GamePlatformService()):
+    """
+    Link games to platforms.
+
+    This route creates every missing link of the request body with one statement.
+
+    Authentication: Required (JWT).
+
+    Parameters:
+    -----------
+    game_platform_service : GamePlatformService, optional
+        The game platform service instance (default is a new instance of GamePlatformService).
+
+    Request Body:
+    -------------
+    links : list
+        The game_id and platform_id of each link.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the number of links created, or the IDs that were not found.
+    """
+    links, error = _load_links()
+    if error:
+        return error
+
+    try:
+        created = game_platform_service.link(links)
+    except ValueError as err:
+        return jsonify({'message': 'Games or platforms not found', **err.args[0]}), 404
+
+    return jsonify({'created': created}), 201
+
+@game_platforms.route('/links', methods=['DELETE'])
+@jwt_required()
+def unlink(game_platform_service: GamePlatformService = GamePlatformService()):
+    """
+    Unlink games from platforms.
+
+    This route deletes every link of the request body with one statement.
+
+    Authentication: Required (JWT).
+
+    Parameters:
+    -----------
+    game_platform_service : GamePlatformService, optional
+        The game platform service instance (default is a new instance of GamePlatformService).
+
+    Request Body:
+    -------------
+    links : list
+        The game_id and platform_id of each link.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the number of links deleted.
+    """
+    links, error = _load_links()
+    if error:
+        return error
+
+    deleted = game_platform_service.unlink(links)
+    return jsonify({'deleted': deleted}), 200
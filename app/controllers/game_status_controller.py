@@ -1,4 +1,6 @@
 from flask import Blueprint, jsonify
+from app import cache
+from app.cache import tags
 from app.services.game_status_service import GameStatusService
 from app.schemas.game_status_schema import GameStatusSchema
 
@@ -36,6 +38,7 @@ game_statuses = Blueprint('game_statuses', __name__)
 
 # Game Status Controller Routes
 @game_statuses.route('/<int:game_status_id>', methods=['GET'])
+@cache.conditional(tags.GAME_STATUSES)
 def get_game_status(game_status_id, game_status_service: GameStatusService = GameStatusService()):
     """
     Get a game status by ID.
@@ -63,6 +66,7 @@ def get_game_status(game_status_id, game_status_service: GameStatusService = Gam
     return jsonify(GameStatusSchema().dump(game_status)), 200
 
 @game_statuses.route('/', methods=['GET'])
+@cache.conditional(tags.GAME_STATUSES)
 def get_all_game_statuses(game_status_service: GameStatusService = GameStatusService()):
     """
     Get all game statuses.
@@ -1,4 +1,6 @@
 from flask import Blueprint, request, jsonify
+from app import cache
+from app.cache import tags
 from marshmallow import ValidationError
 from app.schemas.genre_schema import GenreSchema
 from app.services.genre_service import GenreService
@@ -38,6 +40,8 @@ genres = Blueprint('genres', __name__)
 
 # Genre Controller Routes
 @genres.route('/<int:genre_id>', methods=['GET'])
+@cache.conditional(tags.GENRES)
+@cache.cached(tags.GENRES)
 def get_genre(genre_id, genre_service: GenreService = GenreService()):
     """
     Get a genre by ID.
@@ -65,6 +69,8 @@ def get_genre(genre_id, genre_service: GenreService = GenreService()):
     return jsonify(GenreSchema().dump(genre)), 200
 
 @genres.route('/', methods=['GET'])
+@cache.conditional(tags.GENRES)
+@cache.cached(tags.GENRES)
 def get_all_genres(genre_service: GenreService = GenreService()):
     """
     Get all genres.
@@ -0,0 +1,83 @@
+from flask import Blueprint, Response, current_app, jsonify, request
+from app import db
+
+
+"""
+Internal Controller
+
+This module defines operational endpoints that are not part of the public API. They are
+mounted outside /api/v1 and only answer requests from the addresses listed in the
+INTERNAL_ALLOWED_IPS configuration; everyone else gets a 404.
+
+Routes:
+-------
+GET /internal/db/pool:
+    Get the connection pool metrics.
+    - Responses:
+        - 200: Pool status, event counters and the checkout wait histogram.
+        - 404: Caller is not allowed.
+
+GET /metrics:
+    Get the request, SQL, serialization and pool metrics in Prometheus text format.
+    - Responses:
+        - 200: Metrics rendered in the text exposition format.
+        - 404: Caller is not allowed, or metrics are disabled.
+
+Attributes:
+-----------
+internal : Blueprint
+    The Blueprint instance for internal routes.
+"""
+
+# Blueprint for internal routes
+internal = Blueprint('internal', __name__)
+
+@internal.before_request
+def restrict_to_internal_addresses():
+    '''
+    Hide the internal routes from addresses that are not explicitly allowed.
+    '''
+    if request.remote_addr not in current_app.config['INTERNAL_ALLOWED_IPS']:
+        return jsonify({'message': 'Not found'}), 404
+
+# Internal Controller Routes
+@internal.route('/internal/db/pool', methods=['GET'])
+def get_pool_metrics():
+    """
+    Get the connection pool metrics.
+
+    This route reports how many connections are checked out and in overflow, how many
+    were opened, checked out and invalidated, and a cumulative histogram of the time
+    checkouts waited for a free connection.
+
+    Authentication: Internal addresses only.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the pool metrics.
+    """
+    metrics = current_app.extensions['pool_metrics']
+    return jsonify(metrics.snapshot(db.engine.pool)), 200
+
+@internal.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Get the application metrics.
+
+    This route renders per-endpoint request counts, latency histograms, SQL statement
+    counts, database and serialization time, and connection pool metrics in the
+    Prometheus text exposition format.
+
+    Authentication: Internal addresses only.
+
+    Returns:
+    --------
+    Response
+        The metrics in text/plain exposition format, or a 404 error message if metrics are disabled.
+    """
+    registry = current_app.extensions.get('metrics')
+    if registry is None:
+        return jsonify({'message': 'Not found'}), 404
+
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4'), 200
@@ -1,4 +1,6 @@
 from flask import Blueprint, jsonify
+from app import cache
+from app.cache import tags
 from app.schemas.platform_schema import PlatformSchema
 from app.services.platform_service import PlatformService
 
@@ -43,6 +45,8 @@ platforms = Blueprint('platforms', __name__)
 
 # Platform Controller Routes
 @platforms.route('/<int:platform_id>', methods=['GET'])
+@cache.conditional(tags.PLATFORMS)
+@cache.cached(tags.PLATFORMS)
 def get_platform(platform_id, platform_service: PlatformService = PlatformService()):
     """
     Get a platform by ID.
@@ -70,6 +74,8 @@ def get_platform(platform_id, platform_service: PlatformService = PlatformServic
     return jsonify(PlatformSchema().dump(platform)), 200
 
 @platforms.route('/', methods=['GET'])
+@cache.conditional(tags.PLATFORMS)
+@cache.cached(tags.PLATFORMS)
 def get_all_platforms(platform_service: PlatformService = PlatformService()):
     """
     Get all platforms.
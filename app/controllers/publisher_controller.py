@@ -1,4 +1,6 @@
 from flask import Blueprint, jsonify
+from app import cache
+from app.cache import tags
 from app.schemas.publisher_schema import PublisherSchema
 from app.services.publisher_service import PublisherService
 
@@ -43,6 +45,7 @@ publishers = Blueprint('publishers', __name__)
 
 # Publisher Controller Routes
 @publishers.route('/<int:publisher_id>', methods=['GET'])
+@cache.conditional(tags.PUBLISHERS)
 def get_publisher(publisher_id, publisher_service: PublisherService = PublisherService()):
     """
     Get a publisher by ID.
@@ -70,6 +73,7 @@ def get_publisher(publisher_id, publisher_service: PublisherService = PublisherS
     return jsonify(PublisherSchema().dump(publisher)), 200
 
 @publishers.route('/', methods=['GET'])
+@cache.conditional(tags.PUBLISHERS)
 def get_all_publishers(publisher_service: PublisherService = PublisherService()):
     """
     Get all publishers.
@@ -1,7 +1,11 @@
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
+from app import cache
+from app.cache import tags
 from app.services.user_backlog_service import UserBacklogService
 from app.schemas.user_backlog_schema import UserBacklogSchema, CreateOrDeleteUserBacklogSchema
+from app.schemas.pagination_schema import PageArgsSchema
+from app.repositories import load_plans
 from flask_jwt_extended import jwt_required
 
 
@@ -44,12 +48,16 @@ DELETE /:
         - 404: User backlog entry not found.
 
 GET /<int:user_id>:
-    Get all games in a user's backlog.
+    Get a page of games in a user's backlog, most recently added first.
     - Authentication: Not required.
     - Path Parameters:
         - user_id (int): The ID of the user.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of entries to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: List of all games in the user's backlog returned successfully.
+        - 200: Page of games in the user's backlog and the next cursor returned successfully.
+        - 400: Invalid pagination parameters.
 
 Attributes:
 -----------
@@ -75,6 +83,7 @@ get_user_backlog_list(user_id: int, user_backlog_service: UserBacklogService = U
 user_backlogs = Blueprint('user_backlog', __name__)
 
 # User Backlog Controller Routes
+# Not cached: the entry is selected by the JSON body, which the cache keys and ETags ignore
 @user_backlogs.route('/', methods=['GET'])
 def get_user_backlog(user_backlog_service: UserBacklogService = UserBacklogService()):
     """
@@ -98,7 +107,7 @@ def get_user_backlog(user_backlog_service: UserBacklogService = UserBacklogServi
     """
     data = request.get_json()
     user_id, game_id = data.get('user_id'), data.get('game_id')
-    user_backlog = user_backlog_service.get(user_id, game_id)
+    user_backlog = user_backlog_service.get(user_id, game_id, options=load_plans.USER_BACKLOG)
     if not user_backlog:
         return jsonify({'message': 'User backlog entry not found'}), 404
 
@@ -177,6 +186,8 @@ def delete_user_backlog(user_backlog_service: UserBacklogService = UserBacklogSe
     return jsonify({'message': 'User backlog entry deleted successfully'}), 204
 
 @user_backlogs.route('/<int:user_id>', methods=['GET'])
+@cache.conditional(tags.USER_BACKLOGS, tags.GAMES)
+@cache.cached(tags.USER_BACKLOGS, tags.GAMES)
 def get_user_backlog_list(user_id, user_backlog_service: UserBacklogService = UserBacklogService()):
     """
     Get all games in a user's backlog.
@@ -190,10 +201,22 @@ def get_user_backlog_list(user_id, user_backlog_service: UserBacklogService = Us
     user_id : int
         The ID of the user whose backlog will be retrieved.
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of entries to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of games in the user's backlog.
+        JSON response containing a page of games in the user's backlog and the next cursor.
     """
-    user_backlog = user_backlog_service.get_backlog(user_id)
-    return jsonify(UserBacklogSchema(many=True).dump(user_backlog)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    user_backlog = user_backlog_service.get_backlog(user_id, **page_args, options=load_plans.USER_BACKLOG)
+    return jsonify(user_backlog.dump(UserBacklogSchema(many=True))), 200
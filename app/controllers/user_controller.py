@@ -1,7 +1,16 @@
 from flask import Blueprint, request, jsonify
+from app import cache, limiter
+from app.cache import tags
 from marshmallow import ValidationError
-from app.schemas.user_schema import UserSchema, CreateOrDeleteUserSchema, ChangeUserPasswordSchema
+from app.schemas.user_schema import UserSchema, UserStatsSchema, CreateOrDeleteUserSchema, ChangeUserPasswordSchema
+from app.schemas.activity_schema import ActivitySchema
+from app.schemas.user_suggestion_schema import UserSuggestionSchema
+from app.repositories import load_plans
 from app.services.user_service import UserService
+from app.services.user_suggestion_service import UserSuggestionService
+from app.services.recommendation_service import RecommendationService
+from app.schemas.game_schema import RecommendedGameSchema, RecommendationArgsSchema
+from app.schemas.pagination_schema import PageArgsSchema
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 
@@ -22,6 +31,7 @@ POST /:
     - Responses:
         - 201: User created successfully.
         - 400: Validation error in the request body.
+        - 429: Too many accounts created from this client, see Retry-After.
 
 GET /<int:user_id>:
     Get a user by ID.
@@ -32,11 +42,49 @@ GET /<int:user_id>:
         - 200: User found and returned successfully.
         - 404: User not found.
 
+GET /<int:user_id>/stats:
+    Get the follower and following counts of a user.
+    - Authentication: Not required.
+    - Path Parameters:
+        - user_id (int): The ID of the user.
+    - Responses:
+        - 200: Counts returned successfully.
+        - 404: User not found.
+
 GET /:
-    Get all users.
+    Get a page of users ordered by username.
     - Authentication: Not required.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of users to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+    - Responses:
+        - 200: Page of users and the next cursor returned successfully.
+        - 400: Invalid pagination parameters.
+
+GET /me/feed:
+    Get a page of the reviews and backlog additions of the users the authenticated user follows, newest first.
+    - Authentication: Required (JWT).
+    - Query Parameters:
+        - limit (int, optional): The maximum number of activities to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+    - Responses:
+        - 200: Page of activities and the next cursor returned successfully.
+        - 400: Invalid pagination parameters.
+
+GET /me/suggestions:
+    Get the "people you may know" suggestions of the authenticated user, best first.
+    - Authentication: Required (JWT).
+    - Responses:
+        - 200: Suggestions returned successfully (empty until flask suggestions compute has run).
+
+GET /me/recommendations:
+    Get games recommended to the authenticated user from the games they liked, leaving out the games they already have.
+    - Authentication: Required (JWT).
+    - Query Parameters:
+        - limit (int, optional): The maximum number of games to return, 1 to 100 (default 20).
     - Responses:
-        - 200: List of all users returned successfully.
+        - 200: Recommended games returned successfully (empty until flask recommendations compute has run).
+        - 400: Invalid query parameters.
 
 PATCH /:
     Update a user.
@@ -81,9 +129,21 @@ create_user(user_service: UserService = UserService()) -> Response:
 get_user(user_id: int, user_service: UserService = UserService()) -> Response:
     Get a user by ID.
 
+get_user_stats(user_id: int, user_service: UserService = UserService()) -> Response:
+    Get the follower and following counts of a user.
+
 get_all_users(user_service: UserService = UserService()) -> Response:
     Get all users.
 
+get_feed(user_service: UserService = UserService()) -> Response:
+    Get the activity feed of the authenticated user.
+
+get_suggestions(user_suggestion_service: UserSuggestionService = UserSuggestionService()) -> Response:
+    Get the suggestions of the authenticated user.
+
+get_recommendations(recommendation_service: RecommendationService = RecommendationService()) -> Response:
+    Get the game recommendations of the authenticated user.
+
 update_user(user_id: int, user_service: UserService = UserService()) -> Response:
     Update a user.
 
@@ -99,6 +159,7 @@ users = Blueprint('users', __name__)
 
 # User Controller Routes
 @users.route('/', methods=['POST'])
+@limiter.limit('register')
 def create_user(user_service: UserService = UserService()):
     """
     Create a new user.
@@ -131,6 +192,7 @@ def create_user(user_service: UserService = UserService()):
     return jsonify(UserSchema().dump(user)), 201
 
 @users.route('/<int:user_id>', methods=['GET'])
+@cache.conditional(tags.USERS)
 def get_user(user_id, user_service: UserService = UserService()):
     """
     Get a user by ID.
@@ -155,22 +217,144 @@ def get_user(user_id, user_service: UserService = UserService()):
 
     return jsonify(UserSchema().dump(user)), 200
 
+@users.route('/<int:user_id>/stats', methods=['GET'])
+@cache.conditional(tags.USERS)
+def get_user_stats(user_id, user_service: UserService = UserService()):
+    """
+    Get the follower and following counts of a user.
+
+    This route reads the counters maintained on the user row, so it costs one primary key
+    lookup however many followers the user has.
+
+    Authentication: Not required.
+
+    Path Parameters:
+    ----------------
+    user_id : int
+        The ID of the user.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the counts if the user is found, or a 404 error message if not found.
+    """
+    user = user_service.get(user_id)
+    if not user:
+        return jsonify({'message': 'User not found'}), 404
+
+    return jsonify(UserStatsSchema().dump(user)), 200
+
 @users.route('/', methods=['GET'])
+@cache.conditional(tags.USERS)
 def get_all_users(user_service: UserService = UserService()):
     """
     Get all users.
 
-    This route retrieves a list of all registered users.
+    This route retrieves a page of registered users ordered by username.
 
     Authentication: Not required.
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of users to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of all users.
+        JSON response containing a page of users and the next cursor.
     """
-    users = user_service.get_all() 
-    return jsonify(UserSchema(many=True).dump(users)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    users = user_service.get_all(**page_args)
+    return jsonify(users.dump(UserSchema(many=True))), 200
+
+@users.route('/me/feed', methods=['GET'])
+@jwt_required()
+def get_feed(user_service: UserService = UserService()):
+    """
+    Get the activity feed of the authenticated user.
+
+    This route retrieves a page of the reviews and backlog additions of the users the
+    authenticated user follows, newest first.
+
+    Authentication: Required (JWT).
+
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of activities to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
+    Returns:
+    --------
+    Response
+        JSON response containing a page of activities and the next cursor.
+    """
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    feed = user_service.get_feed(int(get_jwt_identity()), **page_args, options=load_plans.ACTIVITY)
+    return jsonify(feed.dump(ActivitySchema(many=True))), 200
+
+@users.route('/me/suggestions', methods=['GET'])
+@jwt_required()
+def get_suggestions(user_suggestion_service: UserSuggestionService = UserSuggestionService()):
+    """
+    Get the "people you may know" suggestions of the authenticated user.
+
+    This route reads the suggestions precomputed by flask suggestions compute: users followed by
+    the users the authenticated user follows, ranked by mutual connections and shared games.
+
+    Authentication: Required (JWT).
+
+    Returns:
+    --------
+    Response
+        JSON response containing the suggested users, best first.
+    """
+    suggestions = user_suggestion_service.get_for_user(int(get_jwt_identity()), options=load_plans.USER_SUGGESTION)
+    return jsonify(UserSuggestionSchema(many=True).dump(suggestions)), 200
+
+@users.route('/me/recommendations', methods=['GET'])
+@jwt_required()
+def get_recommendations(recommendation_service: RecommendationService = RecommendationService()):
+    """
+    Get the game recommendations of the authenticated user.
+
+    This route sums the precomputed neighbours of the games the authenticated user recently
+    reviewed well or added to their backlog, and leaves out the games they reviewed, have in
+    their backlog or in one of their lists.
+
+    Authentication: Required (JWT).
+
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of games to return.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the recommended games and their scores, best first.
+    """
+    try:
+        args = RecommendationArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    recommendations = recommendation_service.get_recommendations(
+        int(get_jwt_identity()), args['limit'], options=load_plans.GAME
+    )
+    return jsonify(RecommendedGameSchema(many=True).dump(recommendations)), 200
 
 @users.route('/', methods=['PATCH'])
 @jwt_required()
@@ -0,0 +1,409 @@
+from flask import Blueprint, current_app, request, jsonify
+from marshmallow import ValidationError
+from app import cache
+from app.cache import tags
+from app.services.user_gamelist_service import UserGameListService
+from app.schemas.user_gamelist_schema import (
+    UserGameListSchema, CreateOrUpdateUserGameListSchema, GameListEntrySchema, GameListGamesSchema, GameListPositionsSchema
+)
+from app.schemas.pagination_schema import PageArgsSchema
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+"""
+User Game List Controller
+
+This module defines the routes and request handlers for user game list operations.
+It uses Flask's Blueprint to organize the routes, Marshmallow for data validation, and Flask-JWT-Extended for authentication.
+
+Routes:
+-------
+POST /:
+    Create a game list owned by the authenticated user.
+    - Authentication: Required (JWT).
+    - Request Body:
+        - name (str): The name of the list.
+    - Responses:
+        - 201: Game list created successfully.
+        - 400: Validation error in the request body.
+
+GET /user/<int:user_id>:
+    Get a page of the game lists of a user, in creation order.
+    - Authentication: Not required.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of lists to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+    - Responses:
+        - 200: Page of game lists returned successfully.
+
+GET /<int:gamelist_id>:
+    Get a game list.
+    - Authentication: Not required.
+    - Responses:
+        - 200: Game list found and returned successfully.
+        - 404: Game list not found.
+
+PUT /<int:gamelist_id>:
+    Rename a game list.
+    - Authentication: Required (JWT, owner).
+    - Request Body:
+        - name (str): The new name of the list.
+    - Responses:
+        - 200: Game list renamed successfully.
+        - 400: Validation error in the request body.
+        - 403: The list belongs to another user.
+        - 404: Game list not found.
+
+DELETE /<int:gamelist_id>:
+    Delete a game list and its games.
+    - Authentication: Required (JWT, owner).
+    - Responses:
+        - 204: Game list deleted successfully.
+        - 403: The list belongs to another user.
+        - 404: Game list not found.
+
+GET /<int:gamelist_id>/games:
+    Get a page of the games of a list, in list order.
+    - Authentication: Not required.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of games to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+    - Responses:
+        - 200: Page of games with their positions returned successfully.
+        - 404: Game list not found.
+
+POST /<int:gamelist_id>/games:
+    Append games to the end of a list.
+    - Authentication: Required (JWT, owner).
+    - Request Body:
+        - game_ids (list[int]): The games to add, at most GAMELIST_MAX_GAMES of them.
+    - Responses:
+        - 201: The number of games added; games already in the list are skipped.
+        - 400: Validation error in the request body.
+        - 403: The list belongs to another user.
+        - 404: Game list or some of the games not found.
+
+DELETE /<int:gamelist_id>/games:
+    Remove games from a list.
+    - Authentication: Required (JWT, owner).
+    - Request Body:
+        - game_ids (list[int]): The games to remove, at most GAMELIST_MAX_GAMES of them.
+    - Responses:
+        - 200: The number of games removed.
+        - 400: Validation error in the request body.
+        - 403: The list belongs to another user.
+        - 404: Game list not found.
+
+PUT /<int:gamelist_id>/games/order:
+    Move games to new 0-based positions in a list, shifting the games after them.
+    - Authentication: Required (JWT, owner).
+    - Request Body:
+        - positions (list): The game_id and position of each game, at most GAMELIST_MAX_GAMES of them.
+    - Responses:
+        - 200: The number of games moved.
+        - 400: Validation error in the request body.
+        - 403: The list belongs to another user.
+        - 404: Game list not found.
+
+Attributes:
+-----------
+user_gamelists : Blueprint
+    The Blueprint instance for user game list routes.
+"""
+
+# User Game List Blueprint
+user_gamelists = Blueprint('user_gamelists', __name__)
+
+def _owned_gamelist(gamelist_id, user_gamelist_service):
+    '''
+    Get a game list the authenticated user may change.
+
+    Returns:
+    -------
+    tuple[UserGameList, Response]
+        The list, or None and the 404 or 403 response.
+    '''
+    gamelist = user_gamelist_service.get(gamelist_id)
+    if not gamelist:
+        return None, (jsonify({'message': 'Game list not found'}), 404)
+    if gamelist.user_id != int(get_jwt_identity()):
+        return None, (jsonify({'message': 'Game list belongs to another user'}), 403)
+    return gamelist, None
+
+def _load_body(schema, field):
+    '''
+    Validate the body of a bulk route and enforce GAMELIST_MAX_GAMES on its list field.
+
+    Returns:
+    -------
+    tuple[list, Response]
+        The validated list, or None and the 400 response describing the errors.
+    '''
+    try:
+        items = schema.load(request.get_json(silent=True) or {})[field]
+    except ValidationError as err:
+        return None, (jsonify(err.messages), 400)
+
+    max_games = current_app.config['GAMELIST_MAX_GAMES']
+    if len(items) > max_games:
+        return None, (jsonify({field: [f'At most {max_games} games may be given.']}), 400)
+    return items, None
+
+# User Game List Controller Routes
+@user_gamelists.route('/', methods=['POST'])
+@jwt_required()
+def create_gamelist(user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Create a game list.
+
+    This route creates an empty game list owned by the authenticated user.
+
+    Authentication: Required (JWT).
+
+    Request Body:
+    -------------
+    name : str
+        The name of the list.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the created list, or a 400 error if validation fails.
+    """
+    try:
+        validated_data = CreateOrUpdateUserGameListSchema().load(request.get_json(silent=True) or {})
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    gamelist = user_gamelist_service.create({**validated_data, 'user_id': int(get_jwt_identity())})
+    return jsonify(UserGameListSchema().dump(gamelist)), 201
+
+@user_gamelists.route('/user/<int:user_id>', methods=['GET'])
+@cache.conditional(tags.USER_GAMELISTS)
+@cache.cached(tags.USER_GAMELISTS)
+def get_user_gamelists(user_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Get the game lists of a user.
+
+    This route retrieves a page of the game lists of a user, in creation order, with the
+    number of games in each.
+
+    Authentication: Not required.
+
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of lists to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
+    Returns:
+    --------
+    Response
+        JSON response containing a page of game lists and the next cursor.
+    """
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    gamelists = user_gamelist_service.get_by_user(user_id, **page_args)
+    return jsonify(gamelists.dump(UserGameListSchema(many=True))), 200
+
+@user_gamelists.route('/<int:gamelist_id>', methods=['GET'])
+@cache.conditional(tags.USER_GAMELISTS)
+@cache.cached(tags.USER_GAMELISTS)
+def get_gamelist(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Get a game list.
+
+    Authentication: Not required.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the list, or a 404 error message if not found.
+    """
+    gamelist = user_gamelist_service.get(gamelist_id)
+    if not gamelist:
+        return jsonify({'message': 'Game list not found'}), 404
+
+    return jsonify(UserGameListSchema().dump(gamelist)), 200
+
+@user_gamelists.route('/<int:gamelist_id>', methods=['PUT'])
+@jwt_required()
+def update_gamelist(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Rename a game list.
+
+    Authentication: Required (JWT, owner).
+
+    Request Body:
+    -------------
+    name : str
+        The new name of the list.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the renamed list, or the validation, ownership or not found error.
+    """
+    gamelist, error = _owned_gamelist(gamelist_id, user_gamelist_service)
+    if error:
+        return error
+
+    try:
+        validated_data = CreateOrUpdateUserGameListSchema().load(request.get_json(silent=True) or {})
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    gamelist = user_gamelist_service.update(gamelist, validated_data)
+    return jsonify(UserGameListSchema().dump(gamelist)), 200
+
+@user_gamelists.route('/<int:gamelist_id>', methods=['DELETE'])
+@jwt_required()
+def delete_gamelist(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Delete a game list and its games.
+
+    Authentication: Required (JWT, owner).
+
+    Returns:
+    --------
+    Response
+        An empty response, or the ownership or not found error.
+    """
+    gamelist, error = _owned_gamelist(gamelist_id, user_gamelist_service)
+    if error:
+        return error
+
+    user_gamelist_service.delete(gamelist)
+    return '', 204
+
+@user_gamelists.route('/<int:gamelist_id>/games', methods=['GET'])
+@cache.conditional(tags.USER_GAMELISTS, tags.GAMES)
+@cache.cached(tags.USER_GAMELISTS, tags.GAMES)
+def get_gamelist_games(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Get the games of a list.
+
+    This route retrieves a page of the games of a list in list order, so lists with thousands
+    of games are read one page at a time.
+
+    Authentication: Not required.
+
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of games to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
+    Returns:
+    --------
+    Response
+        JSON response containing a page of the id, title and position of the games and the next cursor.
+    """
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    if not user_gamelist_service.get(gamelist_id):
+        return jsonify({'message': 'Game list not found'}), 404
+
+    games = user_gamelist_service.get_games(gamelist_id, **page_args)
+    return jsonify(games.dump(GameListEntrySchema(many=True))), 200
+
+@user_gamelists.route('/<int:gamelist_id>/games', methods=['POST'])
+@jwt_required()
+def add_games(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Append games to the end of a list, in the order given.
+
+    Authentication: Required (JWT, owner).
+
+    Request Body:
+    -------------
+    game_ids : list[int]
+        The IDs of the games to add.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the number of games added, or the IDs of the games not found.
+    """
+    gamelist, error = _owned_gamelist(gamelist_id, user_gamelist_service)
+    if error:
+        return error
+
+    game_ids, error = _load_body(GameListGamesSchema(), 'game_ids')
+    if error:
+        return error
+
+    try:
+        added = user_gamelist_service.add_games(gamelist.id, game_ids)
+    except ValueError as err:
+        return jsonify({'message': 'Games not found', 'game_ids': err.args[0]}), 404
+
+    return jsonify({'added': added}), 201
+
+@user_gamelists.route('/<int:gamelist_id>/games', methods=['DELETE'])
+@jwt_required()
+def remove_games(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Remove games from a list.
+
+    Authentication: Required (JWT, owner).
+
+    Request Body:
+    -------------
+    game_ids : list[int]
+        The IDs of the games to remove.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the number of games removed.
+    """
+    gamelist, error = _owned_gamelist(gamelist_id, user_gamelist_service)
+    if error:
+        return error
+
+    game_ids, error = _load_body(GameListGamesSchema(), 'game_ids')
+    if error:
+        return error
+
+    removed = user_gamelist_service.remove_games(gamelist.id, game_ids)
+    return jsonify({'removed': removed}), 200
+
+@user_gamelists.route('/<int:gamelist_id>/games/order', methods=['PUT'])
+@jwt_required()
+def move_games(gamelist_id, user_gamelist_service: UserGameListService = UserGameListService()):
+    """
+    Move games to new positions in a list.
+
+    Each game, in the order given, is taken out of the list and put back at its position, a
+    0-based index, shifting the games from there on; positions past the end move it to the end.
+
+    Authentication: Required (JWT, owner).
+
+    Request Body:
+    -------------
+    positions : list
+        The game_id and new position of each game to move.
+
+    Returns:
+    --------
+    Response
+        JSON response containing the number of games moved.
+    """
+    gamelist, error = _owned_gamelist(gamelist_id, user_gamelist_service)
+    if error:
+        return error
+
+    positions, error = _load_body(GameListPositionsSchema(), 'positions')
+    if error:
+        return error
+
+    moved = user_gamelist_service.move_games(gamelist.id, positions)
+    return jsonify({'moved': moved}), 200
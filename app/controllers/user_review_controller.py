@@ -1,7 +1,13 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+from app import cache
+from app.cache import tags
 from app.schemas.user_review_schema import UserReviewSchema
 from app.services.user_review_service import UserReviewService
+from app.schemas.pagination_schema import PageArgsSchema
+from app.repositories import load_plans
+from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.query_budget import query_budget
 
 
 """
@@ -22,10 +28,14 @@ GET /<int:user_review_id>:
         - 404: User review not found.
 
 GET /:
-    Get all user reviews.
+    Get a page of user reviews, newest first.
     - Authentication: Not required.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of reviews to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: All user reviews returned successfully.
+        - 200: Page of user reviews and the next cursor returned successfully.
+        - 400: Invalid pagination parameters.
 
 POST /:
     Create a new user review.
@@ -36,6 +46,15 @@ POST /:
         - 201: User review created successfully.
         - 400: Validation error in the request body.
 
+POST /batch:
+    Create several user reviews in one transaction.
+    - Authentication: Required (JWT).
+    - Request Body Parameters:
+        - A list of review objects by the authenticated user, at most REVIEW_BATCH_MAX_ITEMS long.
+    - Responses:
+        - 200: Per-item results (created, duplicate or invalid) and their counts.
+        - 400: The body is not a list or is too long.
+
 PUT /<int:user_review_id>:
     Update a user review by its ID.
     - Authentication: Required (JWT).
@@ -58,20 +77,28 @@ DELETE /<int:user_review_id>:
         - 404: User review not found.
 
 GET /game/<int:game_id>:
-    Get all user reviews for a specific game.
+    Get a page of user reviews for a specific game, newest first.
     - Authentication: Not required.
     - Path Parameters:
         - game_id (int): The ID of the game to retrieve reviews for.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of reviews to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: List of user reviews for the game.
+        - 200: Page of user reviews for the game and the next cursor.
+        - 400: Invalid pagination parameters.
 
 GET /user/<int:user_id>:
-    Get all user reviews by a specific user.
+    Get a page of user reviews by a specific user, newest first.
     - Authentication: Not required.
     - Path Parameters:
         - user_id (int): The ID of the user whose reviews to retrieve.
+    - Query Parameters:
+        - limit (int, optional): The maximum number of reviews to return.
+        - cursor (str, optional): The next_cursor returned by the previous page.
     - Responses:
-        - 200: List of reviews by the user.
+        - 200: Page of reviews by the user and the next cursor.
+        - 400: Invalid pagination parameters.
 
 Attributes:
 -----------
@@ -89,6 +116,9 @@ get_all_user_reviews(user_review_service: UserReviewService = UserReviewService(
 create_user_review(user_review_service: UserReviewService = UserReviewService()) -> Response:
     Create a new user review.
 
+create_user_reviews_batch(user_review_service: UserReviewService = UserReviewService()) -> Response:
+    Create several user reviews in one transaction.
+
 update_user_review(user_review_id: int, user_review_service: UserReviewService = UserReviewService()) -> Response:
     Update a user review by its ID.
 
@@ -107,6 +137,8 @@ user_reviews = Blueprint('user_reviews', __name__)
 
 # User Review Controller Routes
 @user_reviews.route('/<int:user_review_id>', methods=['GET'])
+@cache.conditional(tags.USER_REVIEWS)
+@cache.cached(tags.USER_REVIEWS)
 def get_user_review(user_review_id, user_review_service: UserReviewService = UserReviewService()):
     """
     Get a user review by ID.
@@ -125,28 +157,42 @@ def get_user_review(user_review_id, user_review_service: UserReviewService = Use
     Response
         JSON response containing the user review details if found, or a 404 error message if not found.
     """
-    user_review = user_review_service.get(user_review_id)
+    user_review = user_review_service.get(user_review_id, options=load_plans.USER_REVIEW)
     if not user_review:
         return jsonify({'message': 'User review not found'}), 404
 
     return jsonify(UserReviewSchema().dump(user_review)), 200
 
 @user_reviews.route('/', methods=['GET'])
+@cache.conditional(tags.USER_REVIEWS)
+@cache.cached(tags.USER_REVIEWS)
 def get_all_user_reviews(user_review_service: UserReviewService = UserReviewService()):
     """
     Get all user reviews.
 
-    This route retrieves a list of all user reviews.
+    This route retrieves a page of user reviews, newest first.
 
     Authentication: Not required.
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of user reviews to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of all user reviews.
+        JSON response containing a page of user reviews and the next cursor.
     """
-    user_reviews = user_review_service.get_all()
-    return jsonify(UserReviewSchema(many=True).dump(user_reviews)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    user_reviews = user_review_service.get_all(**page_args, options=load_plans.USER_REVIEW)
+    return jsonify(user_reviews.dump(UserReviewSchema(many=True))), 200
 
 @user_reviews.route('/', methods=['POST'])
 @jwt_required()
@@ -168,8 +214,70 @@ def create_user_review(user_review_service: UserReviewService = UserReviewServic
         JSON response containing the created user review, or a 400 error if validation fails.
     """
     data = request.get_json()
-    result = user_review_service.create(data)
-    return jsonify(result), 201 if 'id' in result else 400
+    user_review_schema = UserReviewSchema()
+
+    try:
+        validated_data = user_review_schema.load(data)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    result = user_review_service.create(validated_data)
+    if isinstance(result, dict):
+        return jsonify(result), 400
+
+    return jsonify(user_review_schema.dump(result)), 201
+
+# Reference and duplicate checks, the reviews, their aggregates and their activities, one
+# statement each whatever the batch size (measured: 11)
+@user_reviews.route('/batch', methods=['POST'])
+@query_budget(11)
+@jwt_required()
+def create_user_reviews_batch(user_review_service: UserReviewService = UserReviewService()):
+    """
+    Create several user reviews.
+
+    This route validates a list of user reviews and creates the valid, non-duplicate ones
+    in a single transaction. Invalid or duplicate items do not prevent the others from
+    being created. Items whose user_id is not the authenticated user are invalid.
+
+    Authentication: Required (JWT).
+
+    Request Body Parameters:
+    ------------------------
+    A list of user review objects.
+
+    Returns:
+    --------
+    Response
+        JSON response containing one result per item, ordered by index, and the number of
+        created, duplicate and invalid items, or a 400 error if the body is not a list.
+    """
+    data = request.get_json()
+    if not isinstance(data, list):
+        return jsonify({'message': 'Expected a list of user reviews.'}), 400
+
+    max_items = current_app.config['REVIEW_BATCH_MAX_ITEMS']
+    if len(data) > max_items:
+        return jsonify({'message': f'A batch may contain at most {max_items} user reviews.'}), 400
+
+    try:
+        validated_data, errors = UserReviewSchema(many=True).load(data), {}
+    except ValidationError as err:
+        validated_data, errors = err.valid_data, err.messages
+
+    # Reviews may only be posted as the authenticated user
+    user_id = int(get_jwt_identity())
+    for index, item in enumerate(validated_data):
+        if index not in errors and item['user_id'] != user_id:
+            errors[index] = {'user_id': ['Must be the authenticated user.']}
+
+    results = [{'index': index, 'status': 'invalid', 'errors': messages} for index, messages in errors.items()]
+    items = [(index, item) for index, item in enumerate(validated_data) if index not in errors]
+    results += user_review_service.create_batch(items)
+    results.sort(key=lambda result: result['index'])
+
+    summary = {status: sum(result['status'] == status for result in results) for status in ('created', 'duplicate', 'invalid')}
+    return jsonify({**summary, 'results': results}), 200
 
 @user_reviews.route('/<int:user_review_id>', methods=['PUT'])
 @jwt_required()
@@ -195,13 +303,20 @@ def update_user_review(user_review_id, user_review_service: UserReviewService =
     Response
         JSON response containing the updated user review, or a 404 error if not found, or a 400 error if validation fails.
     """
-    data = request.get_json()
     user_review = user_review_service.get(user_review_id)
     if not user_review:
         return jsonify({'message': 'User review not found'}), 404
 
-    result = user_review_service.update(user_review, data)
-    return jsonify(result), 200 if 'id' in result else 400
+    data = request.get_json()
+    user_review_schema = UserReviewSchema(partial=True)
+
+    try:
+        validated_data = user_review_schema.load(data)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    updated_user_review = user_review_service.update(user_review, validated_data)
+    return jsonify(user_review_schema.dump(updated_user_review)), 200
 
 @user_reviews.route('/<int:user_review_id>', methods=['DELETE'])
 @jwt_required()
@@ -227,10 +342,12 @@ def delete_user_review(user_review_id, user_review_service: UserReviewService =
     if not user_review:
         return jsonify({'message': 'User review not found'}), 404
 
-    result = user_review_service.delete(user_review)
-    return jsonify(result), 200 if 'message' in result else 400
+    user_review_service.delete(user_review)
+    return jsonify({'message': 'User review deleted successfully'}), 200
 
 @user_reviews.route('/game/<int:game_id>', methods=['GET'])
+@cache.conditional(tags.USER_REVIEWS)
+@cache.cached(tags.USER_REVIEWS)
 def get_user_reviews_by_game(game_id, user_review_service: UserReviewService = UserReviewService()):
     """
     Get all user reviews for a specific game.
@@ -244,15 +361,29 @@ def get_user_reviews_by_game(game_id, user_review_service: UserReviewService = U
     game_id : int
         The ID of the game for which to retrieve reviews.
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of user reviews to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of user reviews for the game.
+        JSON response containing a page of user reviews for the game and the next cursor.
     """
-    user_reviews = user_review_service.get_by_game(game_id)
-    return jsonify(UserReviewSchema(many=True).dump(user_reviews)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    user_reviews = user_review_service.get_by_game(game_id, **page_args, options=load_plans.USER_REVIEW)
+    return jsonify(user_reviews.dump(UserReviewSchema(many=True))), 200
 
 @user_reviews.route('/user/<int:user_id>', methods=['GET'])
+@cache.conditional(tags.USER_REVIEWS)
+@cache.cached(tags.USER_REVIEWS)
 def get_user_reviews_by_user(user_id, user_review_service: UserReviewService = UserReviewService()):
     """
     Get all user reviews by a specific user.
@@ -266,10 +397,22 @@ def get_user_reviews_by_user(user_id, user_review_service: UserReviewService = U
     user_id : int
         The ID of the user whose reviews to retrieve.
 
+    Query Parameters:
+    -----------------
+    limit : int, optional
+        The maximum number of user reviews to return.
+    cursor : str, optional
+        The next_cursor returned by the previous page.
+
     Returns:
     --------
     Response
-        JSON response containing a list of reviews made by the user.
+        JSON response containing a page of reviews made by the user and the next cursor.
     """
-    user_reviews = user_review_service.get_by_user(user_id)
-    return jsonify(UserReviewSchema(many=True).dump(user_reviews)), 200
+    try:
+        page_args = PageArgsSchema().load(request.args)
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    user_reviews = user_review_service.get_by_user(user_id, **page_args, options=load_plans.USER_REVIEW)
+    return jsonify(user_reviews.dump(UserReviewSchema(many=True))), 200
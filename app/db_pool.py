@@ -0,0 +1,214 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+"""
+Database Connection Pool
+
+This module turns the DB_* settings of the configuration into the engine options of
+Flask-SQLAlchemy and instruments the connection pool of the resulting engine.
+
+Connections are drawn from an InstrumentedQueuePool, which records how long every checkout
+waited for a free connection. Together with the pool's own counters (checked out, overflow)
+these are exposed by the internal pool endpoint, so connection storms and checkout stalls
+show up before they become timeouts.
+"""
+
+# Upper bounds, in milliseconds, of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def engine_options(config):
+    '''
+    Build SQLALCHEMY_ENGINE_OPTIONS from the DB_* settings.
+
+    In-memory SQLite databases use a single static connection, so they only get the options
+    that do not apply to a queue pool.
+
+    Parameters:
+    ----------
+    config : Config
+        The application configuration.
+
+    Returns:
+    -------
+    dict
+        The keyword arguments passed to create_engine.
+    '''
+    if not config.get('SQLALCHEMY_DATABASE_URI'):
+        return {}
+
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return options
+
+    options.update({
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE']
+    })
+
+    timeout = config['DB_STATEMENT_TIMEOUT_MS']
+    if timeout:
+        if url.get_backend_name() == 'postgresql':
+            options['connect_args'] = {'options': f'-c statement_timeout={int(timeout)}'}
+        elif url.get_backend_name() == 'mysql':
+            options['connect_args'] = {'init_command': f'SET SESSION max_execution_time={int(timeout)}'}
+
+    return options
+
+
+class PoolMetrics:
+    '''
+    Counters and checkout wait histogram of one connection pool.
+
+    Methods:
+    -------
+    count(event: str) -> None:
+        Increments the counter of a pool event (connects, checkouts, checkins, invalidations).
+    observe_wait(seconds: float, timed_out: bool) -> None:
+        Records how long a checkout waited for a connection.
+    snapshot(pool: Pool) -> dict:
+        Returns the current metrics together with the pool's own counters.
+    '''
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def count(self, event):
+        with self._lock:
+            setattr(self, event, getattr(self, event) + 1)
+
+    def observe_wait(self, seconds, timed_out=False):
+        index = bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.wait_buckets[index] += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool):
+        '''
+        Return the current metrics of the pool.
+
+        Parameters:
+        ----------
+        pool : Pool
+            The pool the metrics were recorded for.
+
+        Returns:
+        -------
+        dict
+            The pool status, event counters and the cumulative checkout wait histogram.
+        '''
+        with self._lock:
+            buckets, cumulative = [], 0
+            for bound, count in zip(WAIT_BUCKETS_MS + ('+Inf',), self.wait_buckets):
+                cumulative += count
+                buckets.append({'le': str(bound), 'count': cumulative})
+
+            snapshot = {
+                'pool': type(pool).__name__,
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts,
+                'checkout_wait': {
+                    'count': self.wait_count,
+                    'sum_seconds': round(self.wait_sum, 6),
+                    'buckets_ms': buckets
+                }
+            }
+
+        if isinstance(pool, QueuePool):
+            snapshot.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': max(pool.overflow(), 0),
+                'max_overflow': pool._max_overflow
+            })
+        else:
+            snapshot['checked_out'] = self.checkouts - self.checkins
+
+        return snapshot
+
+
+class InstrumentedQueuePool(QueuePool):
+    '''
+    QueuePool recording the time every checkout waits for a connection.
+    '''
+
+    metrics = None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def init_pool_metrics(app, db):
+    '''
+    Record connection pool metrics of the application's engine.
+
+    Parameters:
+    ----------
+    app : Flask
+        The Flask application. The metrics are stored in app.extensions['pool_metrics'].
+    db : SQLAlchemy
+        The SQLAlchemy database instance whose engine is instrumented.
+    '''
+    with app.app_context():
+        engine = db.engine
+
+    metrics = PoolMetrics()
+    app.extensions['pool_metrics'] = metrics
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+
+    @event.listens_for(engine, 'connect')
+    def count_connect(dbapi_connection, connection_record):
+        metrics.count('connects')
+
+    @event.listens_for(engine, 'checkout')
+    def count_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.count('checkouts')
+
+    @event.listens_for(engine, 'checkin')
+    def count_checkin(dbapi_connection, connection_record):
+        metrics.count('checkins')
+
+    @event.listens_for(engine, 'invalidate')
+    def count_invalidation(dbapi_connection, connection_record, exception):
+        metrics.count('invalidations')
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict, namedtuple
+from flask import Flask, current_app, jsonify
+from flask_jwt_extended import JWTManager
+from flask_sqlalchemy import SQLAlchemy
+from app.cache import Cache, tags
+from app.models.user import User
+
+"""
+Identity Claims
+
+Access and refresh tokens carry the token_version of their user in the VERSION_CLAIM claim. A
+token is accepted while its version matches users.token_version: changing the password bumps
+the version and deleting the user removes the row, so both revoke every token issued before.
+
+Confirmed (user ID, token version) pairs are kept in a per-process LRU of IDENTITY_CACHE_SIZE
+entries, so authenticated requests normally skip the users table. The LRU is also keyed by
+the version of the IDENTITIES cache tag, which every revoking write invalidates, so a pair
+revoked through one worker stops being trusted by every worker sharing the cache backend on
+their next request. Checking it costs one read of the cache backend instead of a query.
+
+Routes read the confirmed identity from flask_jwt_extended.current_user.
+"""
+
+# Claim holding the token_version of the user a token was issued to
+VERSION_CLAIM = 'ver'
+
+# The user ID and token version of a confirmed token
+Identity = namedtuple('Identity', ['id', 'token_version'])
+
+
+class _ConfirmedIdentities:
+    def __init__(self, max_entries) -> None:
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def __contains__(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return False
+            self.entries.move_to_end(key)
+            return True
+
+    def add(self, key):
+        with self.lock:
+            self.entries[key] = True
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+def identity_claims(user):
+    '''
+    Build the additional claims of the tokens issued to a user.
+
+    Parameters:
+    ----------
+    user : User | Identity
+        The user, or the identity of the token being refreshed.
+
+    Returns:
+    -------
+    dict
+        The claims to pass to create_access_token and create_refresh_token.
+    '''
+    return {VERSION_CLAIM: user.token_version}
+
+
+def init_identity(app: Flask, jwt: JWTManager, db: SQLAlchemy, cache: Cache) -> None:
+    '''
+    Confirm the identity claim of every token accepted by jwt_required.
+
+    Parameters:
+    ----------
+    app : Flask
+        The Flask application.
+    jwt : JWTManager
+        The JWT extension whose user lookup is installed.
+    db : SQLAlchemy
+        The SQLAlchemy database instance read on a miss.
+    cache : Cache
+        The shared cache holding the IDENTITIES tag.
+    '''
+    app.extensions['identity_cache'] = _ConfirmedIdentities(app.config['IDENTITY_CACHE_SIZE'])
+
+    @jwt.user_lookup_loader
+    def load_identity(jwt_header, jwt_data):
+        # Tokens issued before versioned claims were introduced carry version 0
+        identity = Identity(int(jwt_data['sub']), jwt_data.get(VERSION_CLAIM, 0))
+        key = (*identity, cache.version(tags.IDENTITIES))
+        confirmed = current_app.extensions['identity_cache']
+        if key in confirmed:
+            return identity
+
+        # Runs before the view on LRU misses; routes are budgeted for their own statements only
+        token_version = db.session.scalar(
+            db.select(User.token_version).where(User.id == identity.id)
+                .execution_options(count_in_query_budget=False)
+        )
+        if token_version is None or token_version != identity.token_version:
+            return None
+
+        confirmed.add(key)
+        return identity
+
+    @jwt.user_lookup_error_loader
+    def identity_revoked(jwt_header, jwt_data):
+        return jsonify({'message': 'Token has been revoked'}), 401
@@ -0,0 +1,275 @@
+import bisect
+import random
+import threading
+import time
+
+from flask import g, has_request_context, request, request_finished, request_started
+from sqlalchemy import event
+
+from app.db_pool import WAIT_BUCKETS_MS
+
+"""
+Metrics
+
+This module implements a small, dependency-free metrics registry and the hooks that feed it:
+Flask's request_started/request_finished signals for per-endpoint latency, SQLAlchemy's
+before/after_cursor_execute events for per-endpoint query counts and database time, and
+BaseSchema.dump (app/schemas/base_schema.py) for serialization time. The registry is rendered
+in the Prometheus text exposition format by the /metrics route.
+
+Every request is counted, but only a METRICS_SAMPLE_RATE fraction of them is timed, so
+the cost of the SQL and serialization hooks can be bounded in production. Each worker
+process keeps its own registry; scrape every worker, or aggregate by instance.
+"""
+
+# Bucket upper bounds, in seconds, of the latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bucket upper bounds of the queries per request histogram
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _format_labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    '''
+    Monotonically increasing value per label set.
+    '''
+
+    type = 'counter'
+
+    def __init__(self, name, help, labels=()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, *labels, value):
+        '''
+        Replace the value of a label set, e.g. with a total kept elsewhere.
+        '''
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f'{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}'
+
+
+class Gauge(Counter):
+    '''
+    Value per label set that can go up and down.
+    '''
+
+    type = 'gauge'
+
+
+class Histogram:
+    '''
+    Distribution of observations per label set, with cumulative buckets, sum and count.
+    '''
+
+    type = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def observe(self, *labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(labels, (None, 0.0))
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._values[labels] = (counts, total + value)
+
+    def set(self, *labels, cumulative_counts, total):
+        '''
+        Replace the state of a label set with cumulative bucket counts recorded elsewhere.
+        '''
+        counts = [count - previous for previous, count in zip([0] + cumulative_counts, cumulative_counts)]
+        with self._lock:
+            self._values[labels] = (counts, total)
+
+    def samples(self):
+        with self._lock:
+            values = {labels: (list(counts), total) for labels, (counts, total) in self._values.items()}
+        for labels, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                yield f'{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}'
+            yield f'{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(float(total))}'
+            yield f'{self.name}_count{_format_labels(self.labels, labels)} {cumulative}'
+
+
+class Registry:
+    '''
+    Collection of metrics rendered together.
+
+    Methods:
+    -------
+    counter(name: str, help: str, labels: tuple) -> Counter:
+        Registers a counter.
+    gauge(name: str, help: str, labels: tuple) -> Gauge:
+        Registers a gauge.
+    histogram(name: str, help: str, labels: tuple, buckets: tuple) -> Histogram:
+        Registers a histogram.
+    collector(callback: Callable) -> None:
+        Registers a callback that refreshes metrics right before they are rendered.
+    render() -> str:
+        Renders every metric in the Prometheus text exposition format.
+    '''
+
+    def __init__(self) -> None:
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, help, labels=()):
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name, help, labels=()):
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def collector(self, callback):
+        self._collectors.append(callback)
+
+    def render(self):
+        for callback in self._collectors:
+            callback()
+
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+
+def init_metrics(app, db):
+    '''
+    Record request, SQL, serialization and connection pool metrics of the application.
+
+    Parameters:
+    ----------
+    app : Flask
+        The Flask application. The registry is stored in app.extensions['metrics'].
+    db : SQLAlchemy
+        The SQLAlchemy database instance whose engine is instrumented.
+    '''
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    registry = Registry()
+    app.extensions['metrics'] = registry
+    sample_rate = app.config['METRICS_SAMPLE_RATE']
+
+    requests_total = registry.counter(
+        'http_requests_total', 'Requests handled.', ('method', 'endpoint', 'status'))
+    latency = registry.histogram(
+        'http_request_duration_seconds', 'Request latency of sampled requests.', ('method', 'endpoint'))
+    queries = registry.histogram(
+        'http_request_sql_queries', 'SQL statements issued by sampled requests.', ('endpoint',), QUERY_BUCKETS)
+    db_time = registry.counter(
+        'http_request_db_seconds_total', 'Time sampled requests spent executing SQL.', ('endpoint',))
+    serialization_time = registry.counter(
+        'http_request_serialization_seconds_total', 'Time sampled requests spent in marshmallow dumps.', ('endpoint',))
+
+    pool_checked_out = registry.gauge('db_pool_checked_out', 'Connections currently checked out.')
+    pool_overflow = registry.gauge('db_pool_overflow', 'Connections currently open beyond the pool size.')
+    pool_timeouts = registry.counter('db_pool_timeouts_total', 'Checkouts that timed out waiting for a connection.')
+    pool_wait = registry.histogram(
+        'db_pool_checkout_wait_seconds', 'Time checkouts waited for a connection.',
+        buckets=tuple(bound / 1000 for bound in WAIT_BUCKETS_MS))
+
+    def endpoint():
+        return request.endpoint or 'unmatched'
+
+    def start_request(sender, **extra):
+        g.metrics_sampled = sample_rate >= 1 or random.random() < sample_rate
+        if g.metrics_sampled:
+            g.metrics_start = time.perf_counter()
+            g.metrics_queries = 0
+            g.metrics_db_time = 0.0
+            g.metrics_serialization = 0.0
+            g.metrics_dump_depth = 0
+
+    def finish_request(sender, response, **extra):
+        requests_total.inc(request.method, endpoint(), str(response.status_code))
+        if not g.get('metrics_sampled'):
+            return
+
+        name = endpoint()
+        latency.observe(request.method, name, value=time.perf_counter() - g.metrics_start)
+        queries.observe(name, value=g.metrics_queries)
+        db_time.inc(name, amount=g.metrics_db_time)
+        serialization_time.inc(name, amount=g.metrics_serialization)
+
+    request_started.connect(start_request, app, weak=False)
+    request_finished.connect(finish_request, app, weak=False)
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and g.get('metrics_sampled'):
+            conn.info.setdefault('metrics_statement_start', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def finish_statement(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('metrics_statement_start')
+        if starts and has_request_context() and g.get('metrics_sampled'):
+            g.metrics_db_time += time.perf_counter() - starts.pop()
+            g.metrics_queries += 1
+
+
+    def collect_pool():
+        metrics = app.extensions.get('pool_metrics')
+        if metrics is None:
+            return
+        with app.app_context():
+            snapshot = metrics.snapshot(db.engine.pool)
+        pool_checked_out.set(value=snapshot['checked_out'])
+        pool_overflow.set(value=snapshot.get('overflow', 0))
+        pool_timeouts.set(value=snapshot['timeouts'])
+
+        wait = snapshot['checkout_wait']
+        pool_wait.set(cumulative_counts=[bucket['count'] for bucket in wait['buckets_ms']], total=wait['sum_seconds'])
+
+    registry.collector(collect_pool)
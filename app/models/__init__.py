@@ -1,8 +1,12 @@
+from app.models.activity import Activity, timeline_entry
 from app.models.developer import Developer
 from app.models.follower import Follower
 from app.models.game_platform import game_platform
 from app.models.game_status import GameStatus
 from app.models.game import Game
+from app.models.game_rating_stats import GameRatingStats
+from app.models.game_search_index import create_search_index
+from app.models.game_similarity import GameSimilarity
 from app.models.genre import Genre
 from app.models.platform import Platform
 from app.models.publisher import Publisher
@@ -10,4 +14,5 @@ from app.models.user_backlog import UserBacklog
 from app.models.user_gamelist_has_game import user_gamelist_has_game
 from app.models.user_gamelist import UserGameList
 from app.models.user_review import UserReview
+from app.models.user_suggestion import UserSuggestion
 from app.models.user import User
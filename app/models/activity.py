@@ -0,0 +1,77 @@
+from app import db
+
+
+# Kinds of activity shown in feeds
+REVIEW = 'review'
+BACKLOG = 'backlog'
+
+
+class Activity(db.Model):
+    """
+    Something a user did that is shown in the feeds of their followers.
+
+    Activities of users with at most FEED_FANOUT_MAX_FOLLOWERS followers are copied into the
+    timeline of every follower when they are recorded (fan-out on write). Activities of users
+    with more followers are left out of timelines and merged into feeds when they are read
+    (fan-out on read).
+
+    Attributes:
+    ----------
+    id : int
+        Primary key; feeds are ordered by it, newest first.
+    actor_id : int
+        Foreign key referencing the user who acted.
+    kind : str
+        What happened, 'review' or 'backlog'.
+    subject_id : int
+        The ID of the user review or backlog entry the activity is about.
+    game_id : int
+        Foreign key referencing the game the activity is about.
+    score : int
+        The review score, for review activities.
+    fanned_out : bool
+        Whether the activity was copied into the followers' timelines.
+    created_at : datetime
+        When the activity happened.
+
+    Relationships:
+    -------------
+    actor : User
+        Many-to-one relationship with the users table.
+    game : Game
+        Many-to-one relationship with the games table.
+    """
+    __tablename__ = 'activities'
+
+    # Columns
+    id = db.Column(db.Integer, primary_key=True)
+    actor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    subject_id = db.Column(db.Integer, nullable=False)
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False)
+    score = db.Column(db.Integer, nullable=True)
+    fanned_out = db.Column(db.Boolean, nullable=False, default=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    # Relationships
+    actor = db.relationship('User', foreign_keys=[actor_id])
+    game = db.relationship('Game', foreign_keys=[game_id])
+
+    # Indexes for the subject lookups of deletes, and for pulling the activities of an actor
+    __table_args__ = (
+        db.Index('uq_activities_kind_subject_id', 'kind', 'subject_id', unique=True),
+        db.Index('ix_activities_actor_id_fanned_out_id', 'actor_id', 'fanned_out', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Activity {self.kind} {self.subject_id}>'
+
+
+# Precomputed feed of each user: the activities fanned out to them, newest first by activity_id
+timeline_entry = db.Table(
+    'timeline_entries',
+    db.Column('user_id', db.Integer, db.ForeignKey('users.id'), primary_key=True),
+    db.Column('activity_id', db.Integer, db.ForeignKey('activities.id'), primary_key=True),
+    # Deletes of an activity find its entries through this index
+    db.Index('ix_timeline_entries_activity_id', 'activity_id')
+)
@@ -6,4 +6,4 @@ class Developer(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), unique=True, nullable=False)
 
-    games = db.relationship('Game', backref='developer', lazy=True)
\ No newline at end of file
+    games = db.relationship('Game', back_populates='developer', lazy=True)
\ No newline at end of file
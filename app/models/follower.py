@@ -7,6 +7,11 @@ class Follower(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     follower_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
 
+    # The primary key serves the followers of a user; this index serves the users a user follows
+    __table_args__ = (
+        db.Index('ix_followers_follower_id_user_id', 'follower_id', 'user_id'),
+    )
+
     # Relationships
     user = db.relationship('User', foreign_keys=[user_id], backref='user_followers')
     follower = db.relationship('User', foreign_keys=[follower_id], backref='user_following')
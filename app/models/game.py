@@ -22,6 +22,8 @@ class Game(db.Model):
         Foreign key referencing the publishers table, not null.
     cover_image : str
         URL or path to the cover image of the game, can be null.
+    search_rank : float
+        Relevance of the game to a full-text search, only loaded by search queries.
 
     Relationships:
     -------------
@@ -31,6 +33,8 @@ class Game(db.Model):
         Many-to-many relationship with the user_gamelist_has_game table.
     user_reviews : list of UserReview
         One-to-many relationship with the user_reviews table.
+    rating_stats : GameRatingStats
+        One-to-one relationship with the game_rating_stats table.
 
     Methods:
     -------
@@ -43,16 +47,18 @@ class Game(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), unique=True, nullable=False)
     description = db.Column(db.String(255), nullable=False)
-    release_date = db.Column(db.Date, nullable=False)
-    genre_id = db.Column(db.Integer, db.ForeignKey('genres.id'), nullable=False)
-    developer_id = db.Column(db.Integer, db.ForeignKey('developers.id'), nullable=False)
-    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False)
+    release_date = db.Column(db.Date, nullable=False, index=True)
+    genre_id = db.Column(db.Integer, db.ForeignKey('genres.id'), nullable=False, index=True)
+    developer_id = db.Column(db.Integer, db.ForeignKey('developers.id'), nullable=False, index=True)
+    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False, index=True)
     cover_image = db.Column(db.String(255), nullable=True)
+    search_rank = db.query_expression()
 
     # Relationships
-    genre = db.relationship('Genre', foreign_keys=[genre_id], backref='games')
-    developer = db.relationship('Developer', foreign_keys=[developer_id], backref='games')
-    publisher = db.relationship('Publisher', foreign_keys=[publisher_id], backref='games')
+    genre = db.relationship('Genre', foreign_keys=[genre_id], back_populates='games')
+    developer = db.relationship('Developer', foreign_keys=[developer_id], back_populates='games')
+    publisher = db.relationship('Publisher', foreign_keys=[publisher_id], back_populates='games')
+    rating_stats = db.relationship('GameRatingStats', back_populates='game', uselist=False, cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<Game {self.title}>'
\ No newline at end of file
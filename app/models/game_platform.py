@@ -3,5 +3,7 @@ from app import db
 game_platform = db.Table(
     'game_platforms',
     db.Column('game_id', db.Integer, db.ForeignKey('games.id'), primary_key=True),
-    db.Column('platform_id', db.Integer, db.ForeignKey('platforms.id'), primary_key=True)
+    db.Column('platform_id', db.Integer, db.ForeignKey('platforms.id'), primary_key=True),
+    # The primary key serves the platforms of a game; this index serves the games of a platform
+    db.Index('ix_game_platforms_platform_id_game_id', 'platform_id', 'game_id')
 )
\ No newline at end of file
@@ -0,0 +1,60 @@
+from app import db
+
+
+# Review scores are constrained to 1..10 by the user_reviews table
+SCORES = range(1, 11)
+
+
+class GameRatingStats(db.Model):
+    """
+    Denormalized rating aggregates for a game, kept up to date on review writes.
+
+    Attributes:
+    ----------
+    game_id : int
+        Primary key, foreign key referencing the games table.
+    score_sum : int
+        Sum of all review scores for the game.
+    score_count : int
+        Number of reviews for the game.
+    average : float
+        score_sum / score_count, or null when the game has no reviews.
+    score_1 ... score_10 : int
+        Number of reviews with each score.
+
+    Relationships:
+    -------------
+    game : Game
+        One-to-one relationship with the games table.
+    """
+    __tablename__ = 'game_rating_stats'
+
+    # Columns
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), primary_key=True)
+    score_sum = db.Column(db.Integer, nullable=False, default=0)
+    score_count = db.Column(db.Integer, nullable=False, default=0)
+    average = db.Column(db.Float, nullable=True)
+    score_1 = db.Column(db.Integer, nullable=False, default=0)
+    score_2 = db.Column(db.Integer, nullable=False, default=0)
+    score_3 = db.Column(db.Integer, nullable=False, default=0)
+    score_4 = db.Column(db.Integer, nullable=False, default=0)
+    score_5 = db.Column(db.Integer, nullable=False, default=0)
+    score_6 = db.Column(db.Integer, nullable=False, default=0)
+    score_7 = db.Column(db.Integer, nullable=False, default=0)
+    score_8 = db.Column(db.Integer, nullable=False, default=0)
+    score_9 = db.Column(db.Integer, nullable=False, default=0)
+    score_10 = db.Column(db.Integer, nullable=False, default=0)
+
+    # Relationships
+    game = db.relationship('Game', back_populates='rating_stats')
+
+    __table_args__ = (
+        db.Index('ix_game_rating_stats_average', 'average', 'game_id'),
+    )
+
+    @property
+    def histogram(self):
+        return {str(score): getattr(self, f'score_{score}') for score in SCORES}
+
+    def __repr__(self):
+        return f'<GameRatingStats {self.game_id}>'
@@ -0,0 +1,86 @@
+from sqlalchemy import DDL, event
+from app.models.game import Game
+
+"""
+Game Search Index
+
+Full-text index over the title and description of games, created together with the games table.
+
+SQLite:
+    An external-content FTS5 table (games_fts) kept in sync with games by triggers,
+    with prefix indexes so as-you-type queries do not scan the vocabulary.
+
+PostgreSQL:
+    A generated, weighted tsvector column (games.search_vector) with a GIN index, plus a
+    pg_trgm index on the title for typo-tolerant matching. Generated columns are maintained
+    by the database on every insert and update.
+"""
+
+SQLITE_DDL = [
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+        title, description,
+        content='games', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS games_fts_insert AFTER INSERT ON games BEGIN
+        INSERT INTO games_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS games_fts_delete AFTER DELETE ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS games_fts_update AFTER UPDATE OF title, description ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO games_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    "INSERT INTO games_fts(games_fts) VALUES ('rebuild')"
+]
+
+POSTGRES_DDL = [
+    '''
+    ALTER TABLE games ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    ''',
+    'CREATE INDEX IF NOT EXISTS ix_games_search_vector ON games USING GIN (search_vector)',
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS ix_games_title_trgm ON games USING GIN (title gin_trgm_ops)'
+]
+
+
+def create_search_index(connection):
+    '''
+    Create the search index for the connection's dialect, if it does not exist yet.
+    Safe to run repeatedly; on SQLite it also rebuilds the index from the games table.
+
+    Parameters:
+    ----------
+    connection : Connection
+        An open SQLAlchemy connection.
+    '''
+    statements = {
+        'sqlite': SQLITE_DDL,
+        'postgresql': POSTGRES_DDL
+    }.get(connection.dialect.name, [])
+
+    for statement in statements:
+        connection.execute(DDL(statement))
+
+
+@event.listens_for(Game.__table__, 'after_create')
+def games_after_create(target, connection, **kw):
+    create_search_index(connection)
+
+
+@event.listens_for(Game.__table__, 'before_drop')
+def games_before_drop(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        connection.execute(DDL('DROP TABLE IF EXISTS games_fts'))
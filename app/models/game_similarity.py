@@ -0,0 +1,45 @@
+from app import db
+
+
+class GameSimilarity(db.Model):
+    """
+    A precomputed neighbour of a game, written by the similar games job.
+
+    Attributes:
+    ----------
+    game_id : int
+        Primary key, foreign key referencing the game.
+    similar_game_id : int
+        Primary key, foreign key referencing the similar game.
+    rank : int
+        Position of the neighbour in the game's list, starting at 1.
+    score : float
+        Cosine similarity of the two games' interaction vectors, shrunk towards 0 for games
+        that few users share.
+    users : int
+        Number of users who interacted with both games.
+
+    Relationships:
+    -------------
+    similar_game : Game
+        Many-to-one relationship with the games table.
+    """
+    __tablename__ = 'game_similarities'
+
+    # Columns
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), primary_key=True)
+    similar_game_id = db.Column(db.Integer, db.ForeignKey('games.id'), primary_key=True)
+    rank = db.Column(db.Integer, nullable=False)
+    score = db.Column(db.Float, nullable=False)
+    users = db.Column(db.Integer, nullable=False)
+
+    # Relationships
+    similar_game = db.relationship('Game', foreign_keys=[similar_game_id])
+
+    # Neighbours are read per game in rank order
+    __table_args__ = (
+        db.Index('ix_game_similarities_game_id_rank', 'game_id', 'rank'),
+    )
+
+    def __repr__(self):
+        return f'<GameSimilarity {self.similar_game_id} for {self.game_id}>'
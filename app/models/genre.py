@@ -8,7 +8,7 @@ class Genre(db.Model):
     name = db.Column(db.String(255), unique=True, nullable=False)
 
     # Relationships
-    games = db.relationship('Game', backref='genre', lazy=True)
+    games = db.relationship('Game', back_populates='genre', lazy=True)
     
     def __repr__(self):
         return f'<Genre {self.name}>'
\ No newline at end of file
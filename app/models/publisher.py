@@ -8,7 +8,7 @@ class Publisher(db.Model):
     name = db.Column(db.String(255), unique=True, nullable=False)
 
     # Relationships
-    games = db.relationship('Game', backref='publisher', lazy=True)
+    games = db.relationship('Game', back_populates='publisher', lazy=True)
     
     def __repr__(self):
         return f'<Publisher {self.name}>'
\ No newline at end of file
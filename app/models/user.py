@@ -13,6 +13,16 @@ class User(db.Model):
     photo = db.Column(db.String(255), nullable=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    # Follow counters, kept up to date by FollowerRepository writes
+    followers_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    following_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # Version of the identity claim of the user's tokens; bumping it revokes every token issued before
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # Set when the user's follow graph changed since the suggestions job last ran for them
+    suggestions_stale = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     
     # Relationships
     user_gamelists = db.relationship('UserGameList')
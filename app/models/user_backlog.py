@@ -10,6 +10,12 @@ class UserBacklog(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    # Indexes matching the backlog pages, and one entry per user and game
+    __table_args__ = (
+        db.Index('ix_user_backlogs_user_id_id', 'user_id', 'id'),
+        db.Index('uq_user_backlogs_user_id_game_id', 'user_id', 'game_id', unique=True),
+    )
+
     # Relationships
     game = db.relationship('Game', foreign_keys=[game_id], backref='user_backlogs')
     user = db.relationship('User', foreign_keys=[user_id], backref='user_backlogs')
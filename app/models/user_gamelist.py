@@ -10,9 +10,18 @@ class UserGameList(db.Model):
     name = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    # Number of games in the list, kept up to date by UserGameListRepository writes
+    games_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
     # Relationships
     user = db.relationship('User', lazy=True)
-    games = db.relationship('Game', secondary=user_gamelist_has_game)
+    # Lists can hold thousands of games: page through UserGameListRepository.get_games instead
+    games = db.relationship('Game', secondary=user_gamelist_has_game, lazy='raise', viewonly=True)
+
+    # The lists of a user are paged by id through this index
+    __table_args__ = (
+        db.Index('ix_user_gamelists_user_id_id', 'user_id', 'id'),
+    )
 
     def __repr__(self):
-        return f'<UserGameList {self.user_id}>'
\ No newline at end of file
+        return f'<UserGameList {self.user_id}>'
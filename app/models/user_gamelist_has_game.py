@@ -3,5 +3,10 @@ from app import db
 user_gamelist_has_game = db.Table(
     'user_gamelist_has_game',
     db.Column('gamelist_id', db.Integer, db.ForeignKey('user_gamelists.id'), primary_key=True),
-    db.Column('game_id', db.Integer, db.ForeignKey('games.id'), primary_key=True)
-)
\ No newline at end of file
+    db.Column('game_id', db.Integer, db.ForeignKey('games.id'), primary_key=True),
+    # Order of the game in the list, unique within it; removals may leave gaps until a move
+    # renumbers the list
+    db.Column('position', db.Integer, nullable=False, default=0, server_default='0'),
+    # Membership pages are read in (position, game_id) order through this index
+    db.Index('ix_user_gamelist_has_game_gamelist_id_position', 'gamelist_id', 'position', 'game_id')
+)
@@ -17,6 +17,13 @@ class UserReview(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), server_onupdate=db.func.now())
 
+    # Indexes matching the reviews by game and by user pages, and one review per user and game
+    __table_args__ = (
+        db.Index('ix_user_reviews_game_id_id', 'game_id', 'id'),
+        db.Index('ix_user_reviews_user_id_id', 'user_id', 'id'),
+        db.Index('uq_user_reviews_user_id_game_id', 'user_id', 'game_id', unique=True),
+    )
+
     # Relationships
     game = db.relationship('Game',foreign_keys=[game_id], backref='user_reviews')
     user = db.relationship('User', foreign_keys=[user_id], backref='user_reviews')
@@ -0,0 +1,47 @@
+from app import db
+
+
+class UserSuggestion(db.Model):
+    """
+    A precomputed "people you may know" suggestion, written by the suggestions job.
+
+    Attributes:
+    ----------
+    user_id : int
+        Primary key, foreign key referencing the user the suggestion is for.
+    suggested_id : int
+        Primary key, foreign key referencing the suggested user.
+    rank : int
+        Position of the suggestion in the user's list, starting at 1.
+    score : float
+        Mutual connections weighted by the overlap in reviewed and backlogged games.
+    mutual_count : int
+        Number of users the user follows who follow the suggested user.
+    shared_games : int
+        Number of games both users reviewed or added to their backlog.
+
+    Relationships:
+    -------------
+    suggested : User
+        Many-to-one relationship with the users table.
+    """
+    __tablename__ = 'user_suggestions'
+
+    # Columns
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    suggested_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    rank = db.Column(db.Integer, nullable=False)
+    score = db.Column(db.Float, nullable=False)
+    mutual_count = db.Column(db.Integer, nullable=False)
+    shared_games = db.Column(db.Integer, nullable=False)
+
+    # Relationships
+    suggested = db.relationship('User', foreign_keys=[suggested_id])
+
+    # Suggestions are read per user in rank order
+    __table_args__ = (
+        db.Index('ix_user_suggestions_user_id_rank', 'user_id', 'rank'),
+    )
+
+    def __repr__(self):
+        return f'<UserSuggestion {self.suggested_id} for {self.user_id}>'
@@ -0,0 +1,227 @@
+import base64
+import json
+from datetime import date, datetime
+
+from flask import current_app
+from sqlalchemy import and_, or_
+
+
+"""
+Keyset Pagination
+
+This module implements cursor-based (keyset) pagination shared by every list endpoint.
+Instead of OFFSET, each page filters on the sort key of the last row of the previous page,
+so fetching page N+1 costs the same as fetching page 1.
+
+Cursors are opaque to clients: they are the url-safe base64 encoding of the sort key values
+of the last row returned, ending with the row's unique ID as a tie-breaker.
+"""
+
+
+class InvalidCursorError(ValueError):
+    '''
+    Raised when a cursor cannot be decoded or does not match the query it is used with.
+    '''
+
+
+class Page:
+    '''
+    A single page of results from a keyset-paginated query.
+
+    Attributes:
+    ----------
+    items : list
+        The rows in this page.
+    next_cursor : str
+        The cursor for the following page, or None if this is the last page.
+
+    Methods:
+    -------
+    dump(schema: Schema) -> dict:
+        Serializes the page with the given (many=True) schema.
+    '''
+
+    def __init__(self, items, next_cursor=None) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def dump(self, schema):
+        '''
+        Serialize the page.
+
+        Parameters:
+        ----------
+        schema : Schema
+            A marshmallow schema instantiated with many=True.
+
+        Returns:
+        -------
+        dict
+            A dictionary with the serialized items and the next cursor.
+        '''
+        return {
+            'items': schema.dump(self.items),
+            'next_cursor': self.next_cursor
+        }
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        raise InvalidCursorError('Invalid cursor')
+    # Sort keys are strings and numbers; anything else (lists, null, booleans) was forged
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise InvalidCursorError('Invalid cursor')
+    return value
+
+
+def _matches_column(column, value):
+    try:
+        expected = column.type.python_type
+    except NotImplementedError:
+        return True
+    if expected is float:
+        return isinstance(value, (int, float))
+    if expected is date:
+        return isinstance(value, date) and not isinstance(value, datetime)
+    return isinstance(value, expected)
+
+
+def encode_cursor(values):
+    '''
+    Encode the sort key values of a row into an opaque cursor.
+
+    Parameters:
+    ----------
+    values : list
+        The values of the sort key columns, ending with the unique ID.
+
+    Returns:
+    -------
+    str
+        The url-safe cursor.
+    '''
+    payload = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    '''
+    Decode an opaque cursor back into sort key values.
+
+    Parameters:
+    ----------
+    cursor : str
+        The cursor returned by a previous page.
+
+    Returns:
+    -------
+    list
+        The sort key values encoded in the cursor.
+
+    Raises:
+    ------
+    InvalidCursorError
+        If the cursor is malformed.
+    '''
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(values, list) or not values:
+            raise InvalidCursorError('Invalid cursor')
+        # Dates are decoded here too, so a tampered timestamp is a bad cursor and not a 500
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError) as err:
+        raise InvalidCursorError('Invalid cursor') from err
+
+
+def keyset_filter(columns, values, descending=False):
+    '''
+    Build the row-value comparison (columns) > (values) as portable boolean SQL.
+
+    Parameters:
+    ----------
+    columns : list
+        The sort key columns, ending with a unique column.
+    values : list
+        The values of the last row of the previous page.
+    descending : bool, optional
+        Whether the query is sorted in descending order (default is False).
+
+    Returns:
+    -------
+    ColumnElement
+        The filter expression selecting the rows after the cursor.
+    '''
+    clauses = []
+    for index, column in enumerate(columns):
+        equal = [col == value for col, value in zip(columns[:index], values[:index])]
+        after = column < values[index] if descending else column > values[index]
+        clauses.append(and_(*equal, after))
+    return or_(*clauses)
+
+
+def resolve_limit(limit=None):
+    '''
+    Apply the configured default and maximum page sizes to a requested limit.
+    '''
+    if limit is None:
+        return current_app.config['PAGINATION_DEFAULT_LIMIT']
+    return max(1, min(limit, current_app.config['PAGINATION_MAX_LIMIT']))
+
+
+def paginate(query, order_by, limit=None, cursor=None, descending=False):
+    '''
+    Fetch one page of a query using keyset pagination.
+
+    Parameters:
+    ----------
+    query : Query
+        The filtered query to paginate.
+    order_by : list
+        The sort key columns. The last column must be unique (usually the primary key).
+    limit : int, optional
+        The maximum number of rows to return (default is PAGINATION_DEFAULT_LIMIT).
+    cursor : str, optional
+        The cursor returned by the previous page (default is the first page).
+    descending : bool, optional
+        Whether to sort in descending order (default is False).
+
+    Returns:
+    -------
+    Page
+        The requested page and the cursor for the next one.
+
+    Raises:
+    ------
+    InvalidCursorError
+        If the cursor is malformed, or its values do not match the types of the sort key.
+    '''
+    limit = resolve_limit(limit)
+
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        if len(values) != len(order_by) or not all(map(_matches_column, order_by, values)):
+            raise InvalidCursorError('Invalid cursor')
+        query = query.filter(keyset_filter(order_by, values, descending))
+
+    ordering = [column.desc() if descending else column.asc() for column in order_by]
+    rows = query.order_by(*ordering).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in order_by])
+
+    return Page(rows, next_cursor)
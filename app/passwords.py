@@ -0,0 +1,112 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+from flask import Flask, current_app
+
+"""
+Password Hashing
+
+This module hashes and checks passwords with bcrypt in a pool of PASSWORD_HASH_WORKERS
+processes, so a burst of logins costs the request threads a wait on a pipe instead of
+~250ms of CPU each, and cheap requests keep being served. At most PASSWORD_HASH_MAX_PENDING
+hashes may be running or queued per application process; beyond that PasswordHasherBusyError
+is raised and the API answers 503, which sheds a login storm instead of queueing it until
+every client times out.
+
+The workers are spawned, so like any multiprocessing user they import the __main__ module of
+the application process: scripts that create the application and hash passwords with
+PASSWORD_HASH_WORKERS above 0 must guard their entry point with if __name__ == '__main__'.
+The flask CLI, app.py and WSGI servers already do.
+
+New hashes use PASSWORD_HASH_ROUNDS; needs_rehash tells whether a stored hash was made with a
+different cost, so logins can upgrade it while the plain password is at hand.
+"""
+
+
+class PasswordHasherBusyError(RuntimeError):
+    '''
+    Raised when PASSWORD_HASH_MAX_PENDING hashes are already running or queued.
+    '''
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check(password, hashed):
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:
+        # Not a bcrypt hash
+        return False
+
+
+class _Pool:
+    def __init__(self, workers, max_pending) -> None:
+        self.workers = workers
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def run(self, function, *args):
+        if not self.slots.acquire(blocking=False):
+            raise PasswordHasherBusyError('Too many password hashes pending')
+        try:
+            if not self.workers:
+                return function(*args)
+            return self._executor().submit(function, *args).result()
+        except BrokenProcessPool:
+            # A worker died; the next call starts a fresh pool
+            with self.lock:
+                self.executor = None
+            raise
+        finally:
+            self.slots.release()
+
+    def _executor(self):
+        with self.lock:
+            if self.executor is None:
+                # Spawned rather than forked: the workers only run bcrypt and must not inherit
+                # the threads, locks and database connections of the application process
+                self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+            return self.executor
+
+
+class PasswordHasher:
+    '''
+    Flask extension hashing and checking passwords in a bounded process pool.
+
+    Methods:
+    -------
+    hash(password: str) -> str:
+        Hashes a password with the configured cost.
+    check(hashed: str, password: str) -> bool:
+        Checks a password against a stored hash.
+    needs_rehash(hashed: str) -> bool:
+        Tells whether a stored hash was made with a different cost than the configured one.
+
+    Raises:
+    ------
+    PasswordHasherBusyError
+        From hash and check, when too many hashes are already pending.
+    '''
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['password_hasher'] = _Pool(app.config['PASSWORD_HASH_WORKERS'], app.config['PASSWORD_HASH_MAX_PENDING'])
+
+    def hash(self, password: str) -> str:
+        rounds = current_app.config['PASSWORD_HASH_ROUNDS']
+        return self._pool().run(_hash, password.encode('utf-8'), rounds).decode('utf-8')
+
+    def check(self, hashed: str, password: str) -> bool:
+        return self._pool().run(_check, password.encode('utf-8'), hashed.encode('utf-8'))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        # Modular crypt format: $2b$<cost>$<salt and digest>
+        parts = hashed.split('$')
+        return len(parts) != 4 or parts[2] != f'{current_app.config["PASSWORD_HASH_ROUNDS"]:02d}'
+
+    def _pool(self) -> _Pool:
+        return current_app.extensions['password_hasher']
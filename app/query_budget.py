@@ -0,0 +1,91 @@
+from flask import g, has_request_context, jsonify, request
+from sqlalchemy import event
+
+"""
+SQL Query Budget
+
+This module implements a debug assertion that fails any request issuing more SQL statements
+than the configured SQL_QUERY_BUDGET, so N+1 query patterns are caught during development
+instead of silently reaching production. It is disabled when SQL_QUERY_BUDGET is not set.
+
+Only requests that did not commit are failed with a 500. A request that committed has
+already written its changes, and answering it with an error would make clients retry a
+write that succeeded, so it is logged as a warning and its response is kept.
+
+Routes that legitimately need more statements can raise their own budget with the
+query_budget decorator. Statements executed with the count_in_query_budget=False execution
+option are left out of every count; they belong to the request machinery rather than to the
+route, like the token check of jwt_required.
+"""
+
+
+def query_budget(statements):
+    '''
+    Override the SQL statement budget of a single route.
+
+    Parameters:
+    ----------
+    statements : int
+        The maximum number of SQL statements the route may issue per request.
+    '''
+    def decorator(view):
+        view.query_budget = statements
+        return view
+    return decorator
+
+
+def init_query_budget(app, db):
+    '''
+    Count the SQL statements of each request and fail requests that exceed the budget.
+
+    Parameters:
+    ----------
+    app : Flask
+        The Flask application.
+    db : SQLAlchemy
+        The SQLAlchemy database instance whose engine is instrumented.
+    '''
+    budget = app.config.get('SQL_QUERY_BUDGET')
+    if not budget:
+        return
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'commit')
+    def record_commit(conn):
+        if has_request_context():
+            g.sql_committed = True
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and context.execution_options.get('count_in_query_budget', True):
+            g.setdefault('sql_statements', []).append(statement)
+
+    @app.before_request
+    def reset_query_budget():
+        g.sql_statements = []
+        g.sql_committed = False
+
+    @app.after_request
+    def check_query_budget(response):
+        statements = g.get('sql_statements', [])
+        view = app.view_functions.get(request.endpoint)
+        allowed = getattr(view, 'query_budget', budget)
+
+        if len(statements) <= allowed:
+            return response
+
+        if g.get('sql_committed'):
+            app.logger.warning(
+                '%s %s issued %d SQL statements, the budget is %d:\n%s',
+                request.method, request.path, len(statements), allowed, '\n'.join(statements)
+            )
+        else:
+            response = jsonify({
+                'message': f'Request issued {len(statements)} SQL statements, the budget is {allowed}',
+                'statements': statements
+            })
+            response.status_code = 500
+
+        return response
@@ -0,0 +1,305 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Optional, Tuple
+from flask import Flask, current_app, request
+
+"""
+Rate Limiting
+
+This module throttles requests with token buckets. A policy, configured by name in
+RATE_LIMITS, is a list of rules such as {'by': 'ip', 'burst': 10, 'per_minute': 10}: each rule
+gives every client IP (or every username in the JSON body) a bucket of burst tokens refilled
+at per_minute tokens a minute, and a request takes one token from each bucket of its policy.
+When one is empty RateLimitExceededError is raised, carrying the seconds until a token is
+back, and the API answers 429 with a Retry-After header.
+
+Rules marked 'failures_only' are only checked by requests, and charged by the view through
+RateLimiter.penalize when the request fails, e.g. on wrong credentials: a user who logs in
+successfully does not use up the attempts of their account, and neither does a client
+already rejected by the other rules of the policy.
+
+The buckets live in the store selected by RATE_LIMIT_BACKEND:
+
+- MemoryBucketStore: a bounded dictionary private to one process.
+- SharedMemoryBucketStore: a fixed table of buckets in a memory-mapped file, shared by every
+  worker on the host.
+- RedisBucketStore: any server speaking the Redis protocol, updated by a Lua script.
+
+Client IPs are read from request.remote_addr; behind a reverse proxy the application must be
+wrapped in werkzeug's ProxyFix, or every client shares the proxy's buckets.
+"""
+
+
+class RateLimitExceededError(RuntimeError):
+    '''
+    Raised when a bucket of the policy of a request is empty.
+
+    Attributes:
+    ----------
+    retry_after : float
+        The number of seconds until the request would be allowed.
+    '''
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f'Rate limit exceeded, retry after {retry_after:.1f}s')
+        self.retry_after = retry_after
+
+
+def _take(tokens, updated_at, now, rate, burst, cost):
+    # Refill since the last update, then take cost tokens (0 only checks) if there is one
+    tokens = min(burst, tokens + (now - updated_at) * rate)
+    if tokens >= 1:
+        return tokens - cost, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBucketStore:
+    '''
+    In-process bucket store.
+
+    Full buckets are indistinguishable from missing ones, so when more than max_entries
+    buckets are kept the full ones are dropped first, then the least recently used.
+
+    Attributes:
+    ----------
+    max_entries : int
+        The number of buckets kept before they are pruned.
+    '''
+
+    def __init__(self, max_entries: int = 100000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict = OrderedDict()
+
+    def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        now = time.time()
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.pop(key, (burst, now, now))
+            tokens, retry_after = _take(tokens, updated_at, now, rate, burst, cost)
+            self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+            if len(self._buckets) > self.max_entries:
+                self._prune(now)
+            return retry_after
+
+    def _prune(self, now: float) -> None:
+        # Down to three quarters, so the scan is amortized over the next max_entries / 4 keys
+        for key in [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+            del self._buckets[key]
+        while len(self._buckets) > self.max_entries * 3 // 4:
+            self._buckets.popitem(last=False)
+
+
+class SharedMemoryBucketStore:
+    '''
+    Bucket store shared by the worker processes of one host.
+
+    The buckets are slots of a memory-mapped file (under /dev/shm it never touches a disk),
+    found by the hash of their key among WAYS consecutive slots. A key without a slot takes
+    an empty or refilled one, or else the one closest to being refilled, so the table never
+    grows; updates are serialized by an exclusive lock on the file.
+
+    Attributes:
+    ----------
+    path : str
+        The file holding the table. It is created and sized if it does not exist.
+    slots : int
+        The number of buckets in the table.
+    '''
+
+    # Slot: key hash (0 when empty), tokens, time of the last update, time the bucket is full
+    _SLOT = struct.Struct('=Qddd')
+    WAYS = 4
+
+    def __init__(self, path: str, slots: int = 65536) -> None:
+        self.path = path
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _open(self) -> None:
+        # Per process: workers forked after the application was created must not share the
+        # open file description, or their flocks would not exclude each other
+        if self._pid == os.getpid():
+            return
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = self.slots * self._SLOT.size
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._pid = os.getpid()
+
+    def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        digest = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+        first = digest % self.slots
+        now = time.time()
+
+        # flock excludes other processes; threads of this one share the descriptor
+        with self._lock:
+            self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                offset, tokens, updated_at = self._find(digest, first, now, burst)
+                tokens, retry_after = _take(tokens, updated_at, now, rate, burst, cost)
+                self._SLOT.pack_into(self._map, offset, digest, tokens, now, now + (burst - tokens) / rate)
+                return retry_after
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _find(self, digest: int, first: int, now: float, burst: int) -> Tuple[int, float, float]:
+        victim, victim_full_at = None, None
+        for way in range(self.WAYS):
+            offset = ((first + way) % self.slots) * self._SLOT.size
+            slot_digest, tokens, updated_at, full_at = self._SLOT.unpack_from(self._map, offset)
+            if slot_digest == digest:
+                return offset, tokens, updated_at
+            if victim is None or full_at < victim_full_at:
+                victim, victim_full_at = offset, full_at
+        # Empty slots have full_at 0, so they are taken before any bucket is evicted
+        return victim, burst, now
+
+
+class RedisBucketStore:
+    '''
+    Bucket store for any server speaking the Redis protocol.
+
+    Requires the redis package, installed by requirements-redis.txt, unless a client is passed
+    in. Buckets are hashes updated by a Lua script against the server clock, and expire once
+    they would be full again.
+
+    Attributes:
+    ----------
+    client : redis.Redis
+        The client the buckets are read from and written to.
+    '''
+
+    _PREFIX = 'rate:'
+    _SCRIPT = '''
+        local rate, burst, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+        local clock = redis.call('TIME')
+        local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+        local tokens = tonumber(bucket[1]) or burst
+        local updated_at = tonumber(bucket[2]) or now
+        tokens = math.min(burst, tokens + (now - updated_at) * rate)
+        local retry_after = 0
+        if tokens >= 1 then
+            tokens = tokens - cost
+        else
+            retry_after = (1 - tokens) / rate
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+        redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1)
+        return tostring(retry_after)
+    '''
+
+    def __init__(self, url: Optional[str] = None, client=None) -> None:
+        if client is None:
+            try:
+                import redis
+            except ImportError as err:
+                raise RuntimeError('The redis rate limit store requires the redis package') from err
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self._script = client.register_script(self._SCRIPT)
+
+    def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        return float(self._script(keys=[self._PREFIX + key], args=[rate, burst, cost]))
+
+
+def create_store(config):
+    '''
+    Build the bucket store selected by RATE_LIMIT_BACKEND.
+
+    Parameters:
+    ----------
+    config : Config
+        The application configuration.
+
+    Returns:
+    -------
+    MemoryBucketStore | SharedMemoryBucketStore | RedisBucketStore
+        The configured store.
+    '''
+    if config['RATE_LIMIT_BACKEND'] == 'memory':
+        return MemoryBucketStore(config['RATE_LIMIT_MAX_ENTRIES'])
+    if config['RATE_LIMIT_BACKEND'] == 'shared':
+        return SharedMemoryBucketStore(config['RATE_LIMIT_SHM_PATH'], config['RATE_LIMIT_MAX_ENTRIES'])
+    if config['RATE_LIMIT_BACKEND'] == 'redis':
+        return RedisBucketStore(config['RATE_LIMIT_REDIS_URL'])
+    raise ValueError(f"Unknown rate limit backend: {config['RATE_LIMIT_BACKEND']}")
+
+
+class RateLimiter:
+    '''
+    Flask extension applying the token bucket policies of RATE_LIMITS.
+
+    Methods:
+    -------
+    limit(policy: str) -> Callable:
+        Decorator checking a policy before the view runs.
+    check(policy: str) -> None:
+        Takes a token from every bucket of a policy for the current request, and checks the
+        buckets of its failures_only rules.
+    penalize(policy: str) -> None:
+        Takes a token from the buckets of the failures_only rules of a policy.
+
+    Raises:
+    ------
+    RateLimitExceededError
+        From check, and from the views decorated with limit, when a bucket is empty.
+    '''
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['rate_limiter'] = create_store(app.config)
+
+    @property
+    def store(self):
+        return current_app.extensions['rate_limiter']
+
+    def limit(self, policy: str):
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                self.check(policy)
+                return view(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def check(self, policy: str) -> None:
+        rules = current_app.config['RATE_LIMITS'].get(policy, ())
+        # Charged rules first, so a rejected client never touches the failures_only buckets
+        self._charge(policy, [rule for rule in rules if not rule.get('failures_only')], 1)
+        self._charge(policy, [rule for rule in rules if rule.get('failures_only')], 0)
+
+    def penalize(self, policy: str) -> None:
+        rules = current_app.config['RATE_LIMITS'].get(policy, ())
+        self._charge(policy, [rule for rule in rules if rule.get('failures_only')], 1, raise_error=False)
+
+    def _charge(self, policy: str, rules: list, cost: int, raise_error: bool = True) -> None:
+        retry_after = 0.0
+        for rule in rules:
+            client = self._client(rule['by'])
+            if client is None:
+                continue
+            key = f'{policy}:{rule["by"]}:{client}'
+            retry_after = max(retry_after, self.store.take(key, rule['per_minute'] / 60, rule['burst'], cost))
+
+        if retry_after and raise_error:
+            raise RateLimitExceededError(retry_after)
+
+    @staticmethod
+    def _client(by: str) -> Optional[str]:
+        if by == 'ip':
+            return request.remote_addr or 'unknown'
+        if by == 'username':
+            data = request.get_json(silent=True)
+            username = data.get('username') if isinstance(data, dict) else None
+            return username.strip().lower() if isinstance(username, str) and username.strip() else None
+        raise ValueError(f'Unknown rate limit key: {by}')
@@ -0,0 +1,123 @@
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Type
+
+from flask import Flask, current_app, g
+from flask_sqlalchemy import SQLAlchemy
+
+from app.cache import Cache
+
+"""
+Reference Cache
+
+This module implements an in-process, read-through cache for the small reference tables
+(genres, platforms, publishers, developers and game statuses). Each table is loaded whole
+into immutable ReferenceRow tuples on first use and served from memory until its TTL expires
+or a repository write invalidates it.
+
+Each worker process keeps its own copy, so tables are keyed on the version of their tag in
+the shared response cache (the table name, e.g. tags.GENRES for genres): a write in any
+worker bumps it, and every other worker reloads the table on its next read instead of
+rendering stale names into responses cached under the new version. The version is read once
+per table and app context, so serializing a page does not query the shared cache per row.
+"""
+
+
+class ReferenceRow(NamedTuple):
+    '''
+    Read-only snapshot of a reference table row.
+    '''
+    id: int
+    name: str
+
+
+class _Entry(NamedTuple):
+    rows: Dict[int, ReferenceRow]
+    version: str
+    expires_at: float
+
+
+class _Tables:
+    '''
+    Cached tables of one application.
+    '''
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: Dict[Type, _Entry] = {}
+
+
+class ReferenceCache:
+    '''
+    Read-through cache for (id, name) reference tables.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance used to load the tables.
+    cache : Cache
+        The shared cache whose tag versions the tables are keyed on.
+
+    Methods:
+    -------
+    init_app(app: Flask) -> None:
+        Creates the cache of an application, expiring after its REFERENCE_CACHE_TTL.
+    get(model: Type, id: int) -> ReferenceRow:
+        Retrieves a row by its ID, or None if it does not exist.
+    get_all(model: Type) -> list[ReferenceRow]:
+        Retrieves all rows of a table, ordered by ID.
+    name(model: Type, id: int) -> str:
+        Retrieves the name of a row, or None if it does not exist.
+    invalidate(model: Type) -> None:
+        Drops a table from the cache after it was written to.
+    '''
+
+    def __init__(self, db: SQLAlchemy, cache: Cache) -> None:
+        self.db = db
+        self.cache = cache
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['reference_cache'] = _Tables(app.config['REFERENCE_CACHE_TTL'])
+
+    def get(self, model: Type, id: int) -> Optional[ReferenceRow]:
+        return self._rows(model).get(id)
+
+    def get_all(self, model: Type) -> List[ReferenceRow]:
+        return list(self._rows(model).values())
+
+    def name(self, model: Type, id: int) -> Optional[str]:
+        row = self._rows(model).get(id)
+        return row.name if row else None
+
+    def invalidate(self, model: Type) -> None:
+        '''
+        Drop a table from the cache. Call after the write that changed it is committed, and
+        before its tag is invalidated in the shared cache, which other workers follow.
+        '''
+        tables = current_app.extensions['reference_cache']
+        with tables.lock:
+            tables.entries.pop(model, None)
+        g.pop('reference_versions', None)
+
+    def _rows(self, model: Type) -> Dict[int, ReferenceRow]:
+        tables = current_app.extensions['reference_cache']
+        version = self._version(model)
+        entry = tables.entries.get(model)
+        if entry is not None and entry.version == version and entry.expires_at > time.monotonic():
+            return entry.rows
+
+        # A write committed during the load bumps the version, so the entry is not used again
+        result = self.db.session.execute(self.db.select(model.id, model.name).order_by(model.id))
+        rows = {id: ReferenceRow(id, name) for id, name in result}
+
+        with tables.lock:
+            tables.entries[model] = _Entry(rows, version, time.monotonic() + tables.ttl)
+
+        return rows
+
+    def _version(self, model: Type) -> str:
+        versions = g.setdefault('reference_versions', {})
+        if model not in versions:
+            versions[model] = self.cache.version(model.__tablename__)
+        return versions[model]
@@ -0,0 +1,258 @@
+from flask import current_app
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, delete, insert, literal, union_all, update
+from app import db
+from app.models.activity import REVIEW, Activity, timeline_entry
+from app.models.follower import Follower
+from app.models.user import User
+from app.pagination import Page, decode_cursor, encode_cursor, resolve_limit, InvalidCursorError
+
+class ActivityRepository:
+    '''
+    Repository layer for Activity model and the per-user timelines.
+
+    This class records activities and fans them out to the timelines of the actor's followers
+    with one INSERT ... SELECT, unless the actor has more than FEED_FANOUT_MAX_FOLLOWERS
+    followers; those activities are pulled into feeds at read time instead. Feeds merge the
+    timeline with the pulled activities of followed users, each read through an index in
+    activity ID order, so a page costs O(page size) however many users are followed.
+
+    None of the write methods commit; they run in the transaction of the write that caused
+    them.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+
+    Methods:
+    -------
+    record(actor_id: int, kind: str, subject_id: int, game_id: int, score: int) -> None:
+        Records an activity and fans it out.
+    record_many(rows: list[dict]) -> None:
+        Records several activities and fans them out.
+    update_review(subject_id: int, game_id: int, score: int) -> None:
+        Updates the game and score shown by a review activity.
+    remove(kind: str, subject_id: int) -> None:
+        Removes an activity from every timeline.
+    backfill(user_id: int, follower_id: int) -> None:
+        Copies a user's recent activities into the timeline of a new follower.
+    prune(user_id: int, follower_id: int) -> None:
+        Removes a user's activities from the timeline of a former follower.
+    get_feed(user_id: int, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of the activities of the users a user follows, newest first.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db) -> None:
+        '''
+        Initializes the ActivityRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        '''
+        self.db = db
+
+    def record(self, actor_id, kind, subject_id, game_id, score=None):
+        '''
+        Record an activity and fan it out to the timelines of the actor's followers.
+
+        Parameters:
+        ----------
+        actor_id : int
+            The ID of the user who acted.
+        kind : str
+            The kind of activity.
+        subject_id : int
+            The ID of the user review or backlog entry.
+        game_id : int
+            The ID of the game.
+        score : int, optional
+            The review score, for review activities.
+        '''
+        self.record_many([{
+            'actor_id': actor_id,
+            'kind': kind,
+            'subject_id': subject_id,
+            'game_id': game_id,
+            'score': score
+        }])
+
+    def record_many(self, rows):
+        '''
+        Record several activities of the same kind with one executemany, and fan them out with
+        one INSERT ... SELECT.
+
+        Parameters:
+        ----------
+        rows : list[dict]
+            The actor_id, kind, subject_id, game_id and score of each activity.
+        '''
+        if not rows:
+            return
+
+        # Actors with more than FEED_FANOUT_MAX_FOLLOWERS followers are decided in the INSERT
+        # itself, from the maintained followers_count, instead of by a separate count query
+        fanned_out = db.select(
+            User.followers_count <= current_app.config['FEED_FANOUT_MAX_FOLLOWERS']
+        ).where(User.id == bindparam('b_actor_id')).scalar_subquery()
+        self.db.session.connection().execute(
+            insert(Activity.__table__).values(fanned_out=fanned_out),
+            [{**row, 'b_actor_id': row['actor_id']} for row in rows]
+        )
+
+        # Fan out: every follower of each non-celebrity actor gets an entry per new activity
+        fan_out = db.select(Follower.follower_id, Activity.id).join(
+            Follower, Follower.user_id == Activity.actor_id
+        ).where(
+            Activity.kind == rows[0]['kind'],
+            Activity.subject_id.in_([row['subject_id'] for row in rows]),
+            Activity.fanned_out.is_(True)
+        )
+        self.db.session.execute(
+            insert(timeline_entry).from_select(['user_id', 'activity_id'], fan_out)
+        )
+
+    def update_review(self, subject_id, game_id, score):
+        '''
+        Update the game and score shown by the activity of an edited review.
+
+        Parameters:
+        ----------
+        subject_id : int
+            The ID of the user review.
+        game_id : int
+            The ID of the reviewed game.
+        score : int
+            The review score.
+        '''
+        self.db.session.execute(
+            update(Activity).where(Activity.kind == REVIEW, Activity.subject_id == subject_id)
+                .values(game_id=game_id, score=score)
+        )
+
+    def remove(self, kind, subject_id):
+        '''
+        Remove the activity of a deleted review or backlog entry from every timeline.
+
+        Parameters:
+        ----------
+        kind : str
+            The kind of activity.
+        subject_id : int
+            The ID of the user review or backlog entry.
+        '''
+        activity_id = self.db.session.scalar(
+            db.select(Activity.id).where(Activity.kind == kind, Activity.subject_id == subject_id)
+        )
+        if activity_id is None:
+            return
+
+        self.db.session.execute(delete(timeline_entry).where(timeline_entry.c.activity_id == activity_id))
+        self.db.session.execute(delete(Activity).where(Activity.id == activity_id))
+
+    def backfill(self, user_id, follower_id):
+        '''
+        Copy the most recent fanned-out activities of a user into the timeline of a new follower.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the followed user.
+        follower_id : int
+            The ID of the new follower.
+        '''
+        recent = db.select(literal(follower_id), Activity.id).where(
+            Activity.actor_id == user_id, Activity.fanned_out.is_(True)
+        ).order_by(Activity.id.desc()).limit(current_app.config['FEED_BACKFILL_SIZE'])
+        self.db.session.execute(
+            insert(timeline_entry).from_select(['user_id', 'activity_id'], recent.subquery().select())
+        )
+
+    def prune(self, user_id, follower_id):
+        '''
+        Remove the activities of a user from the timeline of a former follower.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the unfollowed user.
+        follower_id : int
+            The ID of the former follower.
+        '''
+        self.db.session.execute(delete(timeline_entry).where(
+            timeline_entry.c.user_id == follower_id,
+            timeline_entry.c.activity_id.in_(db.select(Activity.id).where(Activity.actor_id == user_id))
+        ))
+
+    def get_feed(self, user_id, limit=None, cursor=None, options=()):
+        '''
+        Get a page of the activities of the users a user follows, newest first.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user whose feed to retrieve.
+        limit : int, optional
+            The maximum number of activities to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        Page
+            A page of Activity objects and the cursor for the next one.
+
+        Raises:
+        ------
+        InvalidCursorError
+            If the cursor is malformed.
+        '''
+        limit = resolve_limit(limit)
+        before = None
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            if len(values) != 1 or not isinstance(values[0], int):
+                raise InvalidCursorError('Invalid cursor')
+            before = values[0]
+
+        # Followed users whose activities are pulled rather than fanned out
+        pulled = db.select(Activity.id).where(
+            Activity.actor_id == Follower.user_id, Activity.fanned_out.is_(False)
+        ).exists()
+        celebrities = self.db.session.scalars(
+            db.select(Follower.user_id).where(Follower.follower_id == user_id, pulled)
+        ).all()
+
+        # Each source is read in ID order through its index and cut at the page size
+        sources = [
+            db.select(timeline_entry.c.activity_id.label('id')).where(timeline_entry.c.user_id == user_id)
+                .order_by(timeline_entry.c.activity_id.desc())
+        ]
+        sources += [
+            db.select(Activity.id).where(Activity.actor_id == actor_id, Activity.fanned_out.is_(False))
+                .order_by(Activity.id.desc())
+            for actor_id in celebrities
+        ]
+        if before is not None:
+            sources[0] = sources[0].where(timeline_entry.c.activity_id < before)
+            sources[1:] = [source.where(Activity.id < before) for source in sources[1:]]
+
+        merged = union_all(*(source.limit(limit + 1).subquery().select() for source in sources)).subquery()
+        ids = self.db.session.scalars(
+            db.select(merged.c.id).distinct().order_by(merged.c.id.desc()).limit(limit + 1)
+        ).all()
+
+        next_cursor = None
+        if len(ids) > limit:
+            ids = ids[:limit]
+            next_cursor = encode_cursor([ids[-1]])
+
+        if not ids:
+            return Page([], next_cursor)
+
+        activities = Activity.query.options(*options).filter(Activity.id.in_(ids)).order_by(Activity.id.desc()).all()
+        return Page(activities, next_cursor)
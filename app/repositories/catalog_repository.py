@@ -0,0 +1,202 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, insert, update
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
+from app.models.developer import Developer
+from app.models.game import Game
+from app.models.game_platform import game_platform
+from app.models.game_rating_stats import GameRatingStats
+from app.models.genre import Genre
+from app.models.platform import Platform
+from app.models.publisher import Publisher
+
+# Response cache tags of each reference table the import can add names to
+REFERENCE_TAGS = {
+    Genre: tags.GENRES,
+    Developer: tags.DEVELOPERS,
+    Publisher: tags.PUBLISHERS,
+    Platform: tags.PLATFORMS
+}
+
+
+class CatalogRepository:
+    '''
+    Repository layer for bulk catalog imports.
+
+    This class writes whole chunks of games, reference names and game_platforms links with
+    a constant number of set-based statements per chunk, instead of one ORM flush and commit
+    per row. Nothing is committed until commit() is called.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+    reference_cache : ReferenceCache
+        The cache of the reference tables names are resolved against.
+    cache : Cache
+        The response cache invalidated by commits.
+
+    Methods:
+    -------
+    get_name_map(model: Type) -> dict[str, int]:
+        Retrieves the IDs of every row of a reference table, by name.
+    create_names(model: Type, names: set[str]) -> dict[str, int]:
+        Inserts missing reference names.
+    upsert_games(rows: list[dict]) -> tuple[dict[str, int], int]:
+        Inserts new games and updates existing ones, matched by title.
+    link_platforms(pairs: set[tuple[int, int]]) -> int:
+        Inserts the missing game_platforms links.
+    commit(models: set[Type]) -> None:
+        Commits the chunk and invalidates the caches it affected.
+    '''
+
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
+        '''
+        Initializes the CatalogRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        reference_cache : ReferenceCache, optional
+            The cache of the reference tables (default is the reference_cache instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
+        '''
+        self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
+
+    def get_name_map(self, model):
+        '''
+        Get the IDs of every row of a reference table, by name.
+
+        Parameters:
+        ----------
+        model : Type
+            The reference model (Genre, Developer, Publisher or Platform).
+
+        Returns:
+        -------
+        dict[str, int]
+            The ID of each name.
+        '''
+        return {row.name: row.id for row in self.reference_cache.get_all(model)}
+
+    def create_names(self, model, names):
+        '''
+        Insert reference names with one executemany, without committing.
+
+        Parameters:
+        ----------
+        model : Type
+            The reference model (Genre, Developer, Publisher or Platform).
+        names : set[str]
+            The names to insert. They must not exist yet.
+
+        Returns:
+        -------
+        dict[str, int]
+            The ID of each inserted name.
+        '''
+        if not names:
+            return {}
+
+        self.db.session.execute(insert(model), [{'name': name} for name in names])
+        rows = self.db.session.execute(db.select(model.name, model.id).where(model.name.in_(names)))
+        return {name: id for name, id in rows}
+
+    def upsert_games(self, rows):
+        '''
+        Insert new games and update existing ones, matched by title, without committing.
+
+        Existing titles are looked up with one query; updates and inserts are each sent as a
+        single executemany, and every new game gets an empty rating aggregate row.
+
+        Parameters:
+        ----------
+        rows : list[dict]
+            The game column values. Titles must be unique within the list.
+
+        Returns:
+        -------
+        tuple[dict[str, int], int]
+            The ID of each game by title, and the number of games that were created.
+        '''
+        if not rows:
+            return {}, 0
+
+        titles = [row['title'] for row in rows]
+        existing = self.db.session.execute(db.select(Game.title, Game.id).where(Game.title.in_(titles)))
+        ids = {title: id for title, id in existing}
+
+        updates = [
+            {'b_id': ids[row['title']], **{f'b_{key}': value for key, value in row.items()}}
+            for row in rows if row['title'] in ids
+        ]
+        if updates:
+            columns = [key for key in rows[0] if key != 'title']
+            statement = update(Game.__table__).where(Game.__table__.c.id == bindparam('b_id')).values(
+                {column: bindparam(f'b_{column}') for column in columns}
+            )
+            self.db.session.connection().execute(statement, updates)
+
+        new_rows = [row for row in rows if row['title'] not in ids]
+        if new_rows:
+            self.db.session.execute(insert(Game), new_rows)
+            created = self.db.session.execute(
+                db.select(Game.title, Game.id).where(Game.title.in_([row['title'] for row in new_rows]))
+            )
+            new_ids = {title: id for title, id in created}
+            self.db.session.execute(insert(GameRatingStats), [{'game_id': id} for id in new_ids.values()])
+            ids.update(new_ids)
+
+        return ids, len(new_rows)
+
+    def link_platforms(self, pairs):
+        '''
+        Insert the missing game_platforms links with one executemany, without committing.
+
+        Parameters:
+        ----------
+        pairs : set[tuple[int, int]]
+            The (game ID, platform ID) links the games should have.
+
+        Returns:
+        -------
+        int
+            The number of links inserted.
+        '''
+        if not pairs:
+            return 0
+
+        existing = self.db.session.execute(
+            db.select(game_platform.c.game_id, game_platform.c.platform_id).where(
+                game_platform.c.game_id.in_({game_id for game_id, _ in pairs})
+            )
+        )
+        missing = pairs - {tuple(row) for row in existing}
+        if missing:
+            self.db.session.execute(
+                game_platform.insert(),
+                [{'game_id': game_id, 'platform_id': platform_id} for game_id, platform_id in missing]
+            )
+        return len(missing)
+
+    def commit(self, models=()):
+        '''
+        Commit the current chunk and invalidate the caches it affected.
+
+        Parameters:
+        ----------
+        models : set[Type], optional
+            The reference models new names were inserted into.
+        '''
+        self.db.session.commit()
+        for model in models:
+            self.reference_cache.invalidate(model)
+        self.cache.invalidate(tags.GAMES, tags.USER_REVIEWS, *(REFERENCE_TAGS[model] for model in models))
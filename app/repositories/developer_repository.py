@@ -1,23 +1,29 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
 from app.models.developer import Developer
 
 class DeveloperRepository:
     def __init__(self,
-                 db: SQLAlchemy = db) -> None:
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
         self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
     
     def get(self, id):
         '''
         Get a developer by ID
         '''
-        return Developer.query.get(id)
+        return self.reference_cache.get(Developer, id)
     
     def get_all(self):
         '''
         List all developers
         '''
-        return Developer.query.all()
+        return self.reference_cache.get_all(Developer)
     
     def create(self, developer):
         '''
@@ -27,23 +33,36 @@ class DeveloperRepository:
 
         self.db.session.add(developer)
         self.db.session.commit()
+        self.reference_cache.invalidate(Developer)
+        self.cache.invalidate(tags.DEVELOPERS, tags.GAMES)
         return developer
     
-    def update(self, developer, data):
+    def update(self, id, data):
         '''
         Update a developer
         '''
+        developer = self.db.session.get(Developer, id)
+        if developer is None:
+            return None
 
         for key, value in data.items():
             setattr(developer, key, value)
 
         self.db.session.commit()
+        self.reference_cache.invalidate(Developer)
+        self.cache.invalidate(tags.DEVELOPERS, tags.GAMES)
 
-    def delete(self, developer):
+    def delete(self, id):
         '''
         Delete a developer
         '''
+        developer = self.db.session.get(Developer, id)
+        if developer is None:
+            return None
+
         self.db.session.delete(developer)
         self.db.session.commit()
+        self.reference_cache.invalidate(Developer)
+        self.cache.invalidate(tags.DEVELOPERS, tags.GAMES)
 
         
\ No newline at end of file
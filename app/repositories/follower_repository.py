@@ -1,18 +1,29 @@
 from flask_sqlalchemy import SQLAlchemy
+from collections import Counter
+from sqlalchemy import bindparam, func, insert, literal, union_all, update
 from app.models.follower import Follower
-from app import db
+from app.models.user import User
+from app import db, cache
+from app.cache import Cache, tags
+from app.pagination import paginate
+from app.repositories.activity_repository import ActivityRepository
 
 class FollowerRepository:
     '''
     Repository layer for Follower model.
 
     This class provides methods to interact with the Follower table in the database.
-    It includes methods to create, retrieve, update, and delete followers.
+    It includes methods to create, retrieve, update, and delete followers, and keeps the
+    followers_count and following_count columns of both users in step with every write.
+    Writes also flag the users whose friend-of-friend suggestions they change, so the
+    suggestions job only recomputes those.
 
     Attributes:
     ----------
     db : SQLAlchemy
         The SQLAlchemy database instance.
+    activity_repository : ActivityRepository
+        The repository used to keep the follower's feed in step with the relation.
 
     Methods:
     -------
@@ -20,15 +31,24 @@ class FollowerRepository:
         Retrieves a follower relationship.
     create(data: dict) -> Follower:
         Creates a new follower with the provided data.
+    create_many(rows: list[dict]) -> None:
+        Creates several follower relations in one transaction.
     delete(follower: Follower) -> Follower:
         Deletes the provided follower.
-    get_followers(user_id: int) -> list[Follower]:
-        Retrieves all followers for a given user.
-    get_following(follower_id: int) -> list[Follower]:
-        Retrieves all users that a given user is following.
+    get_relationships(user_id: int, other_ids: list[int]) -> dict[int, dict]:
+        Retrieves whether a user follows, and is followed by, each of several users.
+    rebuild_counts() -> None:
+        Recomputes the follow counters of every user.
+    get_followers(user_id: int, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of followers for a given user.
+    get_following(follower_id: int, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of users that a given user is following.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 cache: Cache = cache,
+                 activity_repository: ActivityRepository = ActivityRepository()) -> None:
         '''
         Initializes the FollowerRepository with the given SQLAlchemy database instance.
 
@@ -36,8 +56,14 @@ class FollowerRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
+        activity_repository : ActivityRepository, optional
+            The feed activity repository (default is a new ActivityRepository instance).
         '''
         self.db = db
+        self.cache = cache
+        self.activity_repository = activity_repository
 
 
     def get(self, user_id, follower_id):
@@ -74,9 +100,34 @@ class FollowerRepository:
         '''
         follower = Follower(**data)
         self.db.session.add(follower)
+        self.db.session.flush()
+        self._count({follower.user_id: 1}, {follower.follower_id: 1})
+        self._mark_stale({follower.follower_id})
+        self.activity_repository.backfill(follower.user_id, follower.follower_id)
         self.db.session.commit()
+        self.cache.invalidate(tags.FOLLOWERS, tags.USERS)
         return follower
 
+    def create_many(self, rows):
+        '''
+        Create several follower relations with one executemany and a single commit.
+
+        Parameters:
+        ----------
+        rows : list[dict]
+            The user_id and follower_id of each relation. None may exist yet.
+        '''
+        if not rows:
+            return
+
+        self.db.session.execute(insert(Follower), rows)
+        self._count(
+            Counter(row['user_id'] for row in rows),
+            Counter(row['follower_id'] for row in rows)
+        )
+        self._mark_stale({row['follower_id'] for row in rows})
+        self.db.session.commit()
+        self.cache.invalidate(tags.FOLLOWERS, tags.USERS)
     
     def delete(self, relation):
         '''
@@ -91,39 +142,120 @@ class FollowerRepository:
         relation = Follower.query.filter_by(user_id=relation.get('user_id'), follower_id=relation.get('follower_id')).first()
 
         if relation:
+            self.activity_repository.prune(relation.user_id, relation.follower_id)
+            self._count({relation.user_id: -1}, {relation.follower_id: -1})
+            self._mark_stale({relation.follower_id})
             self.db.session.delete(relation)
             self.db.session.commit()
+            self.cache.invalidate(tags.FOLLOWERS, tags.USERS)
         else:
             return 
 
-    def get_followers(self, user_id):
+    def get_followers(self, user_id, limit=None, cursor=None, options=()):
         '''
-        Get all followers for a given user.
+        Get a page of followers for a given user, ordered by follower ID.
 
         Parameters:
         ----------
         user_id : int
             The ID of the user to retrieve followers for.
+        limit : int, optional
+            The maximum number of followers to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[Follower]
-            A list of all followers for the specified user.
+        Page
+            A page of followers for the specified user.
         '''
-        return Follower.query.filter_by(user_id=user_id).all()
+        query = Follower.query.options(*options).filter_by(user_id=user_id)
+        return paginate(query, [Follower.follower_id], limit, cursor)
     
-    def get_following(self, follower_id):
+    def get_following(self, follower_id, limit=None, cursor=None, options=()):
         '''
-        Get all users that a given user is following.
+        Get a page of users that a given user is following, ordered by user ID.
 
         Parameters:
         ----------
         follower_id : int
             The ID of the user who is following.
+        limit : int, optional
+            The maximum number of relationships to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[Follower]
-            A list of all users that the specified user is following.
+        Page
+            A page of users that the specified user is following.
         '''
-        return Follower.query.filter_by(follower_id=follower_id).all()
\ No newline at end of file
+        query = Follower.query.options(*options).filter_by(follower_id=follower_id)
+        return paginate(query, [Follower.user_id], limit, cursor)
+
+    def get_relationships(self, user_id, other_ids):
+        '''
+        Get whether a user follows, and is followed by, each of several users.
+
+        Both directions are answered by one statement: the users followed are read through
+        ix_followers_follower_id_user_id and the followers through the primary key.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user the relationships are seen from.
+        other_ids : list[int]
+            The IDs of the other users.
+
+        Returns:
+        -------
+        dict[int, dict]
+            The 'following' and 'followed_by' flags of every ID in other_ids.
+        '''
+        relationships = {id: {'following': False, 'followed_by': False} for id in other_ids}
+        if not other_ids:
+            return relationships
+
+        following = db.select(Follower.user_id.label('other_id'), literal('following').label('direction')).where(
+            Follower.follower_id == user_id, Follower.user_id.in_(other_ids)
+        )
+        followed_by = db.select(Follower.follower_id, literal('followed_by')).where(
+            Follower.user_id == user_id, Follower.follower_id.in_(other_ids)
+        )
+        for other_id, direction in self.db.session.execute(union_all(following, followed_by)):
+            relationships[other_id][direction] = True
+        return relationships
+
+    def rebuild_counts(self):
+        '''
+        Recompute the followers_count and following_count of every user from the followers table and commit.
+        '''
+        followers = db.select(func.count()).where(Follower.user_id == User.id).scalar_subquery()
+        following = db.select(func.count()).where(Follower.follower_id == User.id).scalar_subquery()
+        self.db.session.execute(update(User).values(followers_count=followers, following_count=following))
+        self.db.session.commit()
+        self.cache.invalidate(tags.USERS)
+
+    def _count(self, followers, following):
+        # Apply counter deltas by user ID, one executemany per column
+        users = User.__table__
+        for column, deltas in ((users.c.followers_count, followers), (users.c.following_count, following)):
+            if deltas:
+                statement = users.update().where(users.c.id == bindparam('b_id')).values(
+                    {column: column + bindparam('b_delta')}
+                )
+                self.db.session.connection().execute(
+                    statement, [{'b_id': id, 'b_delta': delta} for id, delta in deltas.items()]
+                )
+
+    def _mark_stale(self, follower_ids):
+        # A follow changes the second-degree connections of the follower and of their followers
+        followers_of = db.select(Follower.follower_id).where(Follower.user_id.in_(follower_ids))
+        self.db.session.execute(
+            update(User).where(User.id.in_(follower_ids) | User.id.in_(followers_of))
+                .values(suggestions_stale=True).execution_options(synchronize_session=False)
+        )
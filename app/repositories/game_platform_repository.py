@@ -1,35 +1,47 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from sqlalchemy import delete, insert, tuple_
+from app import db, cache
+from app.cache import Cache, tags
+from app.models.game import Game
 from app.models.game_platform import game_platform
-from sqlalchemy import text
+from app.models.platform import Platform
+from app.pagination import paginate
 
 class GamePlatformRepository:
     '''
-    Repository layer for GamePlatform model.
+    Repository layer for the game_platforms association table.
 
-    This class provides methods to interact with the GamePlatform table in the database.
-    It includes methods to create, retrieve, update, and delete game platforms.
+    This class reads and writes the links between games and platforms with Core statements
+    that return lightweight row mappings instead of ORM objects. Reads by game go through the
+    primary key and reads by platform through ix_game_platforms_platform_id_game_id; bulk
+    writes take any number of links in one statement.
 
     Attributes:
     ----------
     db : SQLAlchemy
         The SQLAlchemy database instance.
+    cache : Cache
+        The response cache invalidated by writes.
 
     Methods:
     -------
-    create(data: dict) -> GamePlatform:
-        Creates a new game platform with the provided data.
-    get(id: int) -> GamePlatform:
-        Retrieves a game platform by its ID.
-    get_all() -> list[GamePlatform]:
-        Retrieves all game platforms.
-    update(game_platform: GamePlatform, data: dict) -> GamePlatform:
-        Updates an existing game platform with the provided data.
-    delete(game_platform: GamePlatform) -> GamePlatform:
-        Deletes the provided game platform.
+    get(game_id: int, platform_id: int) -> RowMapping:
+        Retrieves a link by its game and platform IDs.
+    get_all_platforms(game_id: int) -> list[RowMapping]:
+        Retrieves the platforms of a game.
+    get_platforms_for_games(game_ids: list[int]) -> dict[int, list[RowMapping]]:
+        Retrieves the platforms of several games with one query.
+    get_all_games(platform_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the games of a platform.
+    get_missing_ids(game_ids: set[int], platform_ids: set[int]) -> tuple[list[int], list[int]]:
+        Retrieves the given game and platform IDs that do not exist.
+    create_many(links: set[tuple[int, int]]) -> int:
+        Creates the links that do not exist yet.
+    delete_many(links: set[tuple[int, int]]) -> int:
+        Deletes the given links.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self, db: SQLAlchemy = db, cache: Cache = cache) -> None:
         '''
         Initializes the GamePlatformRepository with the given SQLAlchemy database instance.
 
@@ -37,110 +49,184 @@ class GamePlatformRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         '''
         self.db = db
+        self.cache = cache
 
-    def create(self, data):
+    def get(self, game_id, platform_id):
         '''
-        Create a new game platform relation.
+        Retrieve a game platform relation by its game and platform IDs.
 
         Parameters:
         ----------
-        data : dict
-            A dictionary containing the game platform data.
+        game_id : int
+            The ID of the game to retrieve.
+        platform_id : int
+            The ID of the platform to retrieve.
 
         Returns:
         -------
-        GamePlatform
-            The created GamePlatform object.
+        RowMapping
+            The game_id and platform_id of the relation, or None if not found.
         '''
-        new_entry = game_platform.insert().values(data)
-        self.db.session.execute(new_entry)
-        self.db.session.commit()
-        return game_platform
-    
-    def get(self, game_id, platform_id):
+        return self.db.session.execute(
+            db.select(game_platform.c.game_id, game_platform.c.platform_id).where(
+                game_platform.c.game_id == game_id, game_platform.c.platform_id == platform_id
+            )
+        ).mappings().first()
+
+    def get_all_platforms(self, game_id):
         '''
-        Retrieve a game platform relation by its game and platform IDs.
+        Retrieve all platforms for a given game.
 
         Parameters:
         ----------
         game_id : int
-            The ID of the game to retrieve.
-        platform_id : int
-            The ID of the platform to retrieve.
+            The ID of the game to retrieve platforms for.
 
         Returns:
         -------
-        dict
-            A dictionary representing the game platform relation, or None if not found.
+        list[RowMapping]
+            The id and name of each platform of the game, ordered by name.
         '''
-        query = text(f'''
-        SELECT * FROM game_platforms 
-        WHERE game_id = :game_id AND platform_id = :platform_id
-        ''')
-        result = self.db.session.execute(query, {'game_id': game_id, 'platform_id': platform_id}).fetchone()
-        return dict(result) if result else None
+        return self.get_platforms_for_games([game_id]).get(game_id, [])
 
-    def delete(self, game_id, platform_id):
+    def get_platforms_for_games(self, game_ids):
         '''
-        Delete a game platform relation by its game and platform IDs.
+        Retrieve the platforms of several games with one query.
+
+        Parameters:
+        ----------
+        game_ids : list[int]
+            The IDs of the games to retrieve platforms for.
+
+        Returns:
+        -------
+        dict[int, list[RowMapping]]
+            The id and name of each platform, ordered by name, keyed by game ID. Games without
+            platforms are left out.
+        '''
+        if not game_ids:
+            return {}
+
+        rows = self.db.session.execute(
+            db.select(game_platform.c.game_id, Platform.id, Platform.name).join(
+                Platform, Platform.id == game_platform.c.platform_id
+            ).where(game_platform.c.game_id.in_(game_ids)).order_by(
+                game_platform.c.game_id, Platform.name, Platform.id
+            )
+        ).mappings()
+
+        platforms = {}
+        for row in rows:
+            platforms.setdefault(row['game_id'], []).append(row)
+        return platforms
+
+    def get_all_games(self, platform_id, limit=None, cursor=None):
+        '''
+        Retrieve a page of the games for a given platform, in game ID order.
 
         Parameters:
         ----------
-        game_id : int
-            The ID of the game.
         platform_id : int
-            The ID of the platform.
+            The ID of the platform to retrieve games for.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+
+        Returns:
+        -------
+        Page
+            A page of rows with the game_id and title of each game, and the cursor for the next one.
+
+        Raises:
+        ------
+        InvalidCursorError
+            If the cursor is malformed.
         '''
-        query = game_platform.delete().where(
-            game_platform.c.game_id == game_id and game_platform.c.platform_id == platform_id
-        )
-        self.db.session.execute(query)
-        self.db.session.commit()
+        query = self.db.session.query(game_platform.c.game_id, Game.title).join(
+            Game, Game.id == game_platform.c.game_id
+        ).filter(game_platform.c.platform_id == platform_id)
+        return paginate(query, [game_platform.c.game_id], limit, cursor)
 
-    def get_all_platforms(self, game_id):
+    def get_missing_ids(self, game_ids, platform_ids):
         '''
-        Retrieve all platforms for a given game.
+        Retrieve the given game and platform IDs that do not exist.
 
         Parameters:
         ----------
-        game_id : int
-            The ID of the game to retrieve platforms for.
+        game_ids : set[int]
+            The game IDs to check.
+        platform_ids : set[int]
+            The platform IDs to check.
 
         Returns:
         -------
-        list[dict]
-            A list of platforms associated with the given game as dictionaries.
+        tuple[list[int], list[int]]
+            The sorted game IDs and platform IDs that were not found.
         '''
-        query = text('''
-        SELECT p.* FROM platforms p 
-        JOIN game_platforms gp ON p.id = gp.platform_id 
-        WHERE gp.game_id = :game_id
-        ''')
-        results = self.db.session.execute(query, {'game_id': game_id}).fetchall()
-        return [dict(row) for row in results]
-    
-    def get_all_games(self, platform_id):
+        games = set(self.db.session.scalars(db.select(Game.id).where(Game.id.in_(game_ids))))
+        platforms = set(self.db.session.scalars(db.select(Platform.id).where(Platform.id.in_(platform_ids))))
+        return sorted(set(game_ids) - games), sorted(set(platform_ids) - platforms)
+
+    def create_many(self, links):
         '''
-        Retrieve all games for a given platform.
+        Create the links that do not exist yet with one executemany and commit.
 
         Parameters:
         ----------
-        platform_id : int
-            The ID of the platform to retrieve games for.
+        links : set[tuple[int, int]]
+            The (game ID, platform ID) links to create.
 
         Returns:
         -------
-        list[dict]
-            A list of games associated with the given platform as dictionaries.
-        '''
-        query = text('''
-        SELECT g.* FROM games g 
-        JOIN game_platforms gp ON g.id = gp.game_id 
-        WHERE gp.platform_id = :platform_id
-        ''')
-        results = self.db.session.execute(query, {'platform_id': platform_id}).fetchall()
-        return [dict(row) for row in results]
-    
-    
\ No newline at end of file
+        int
+            The number of links created.
+        '''
+        if not links:
+            return 0
+
+        existing = self.db.session.execute(
+            db.select(game_platform.c.game_id, game_platform.c.platform_id).where(
+                tuple_(game_platform.c.game_id, game_platform.c.platform_id).in_(list(links))
+            )
+        )
+        missing = set(links) - {tuple(row) for row in existing}
+        if missing:
+            self.db.session.execute(
+                insert(game_platform),
+                [{'game_id': game_id, 'platform_id': platform_id} for game_id, platform_id in sorted(missing)]
+            )
+            self.db.session.commit()
+            self.cache.invalidate(tags.GAMES, tags.PLATFORMS)
+        return len(missing)
+
+    def delete_many(self, links):
+        '''
+        Delete the given links with one statement and commit.
+
+        Parameters:
+        ----------
+        links : set[tuple[int, int]]
+            The (game ID, platform ID) links to delete.
+
+        Returns:
+        -------
+        int
+            The number of links deleted.
+        '''
+        if not links:
+            return 0
+
+        deleted = self.db.session.execute(
+            delete(game_platform).where(
+                tuple_(game_platform.c.game_id, game_platform.c.platform_id).in_(list(links))
+            )
+        ).rowcount
+        self.db.session.commit()
+        if deleted:
+            self.cache.invalidate(tags.GAMES, tags.PLATFORMS)
+        return deleted
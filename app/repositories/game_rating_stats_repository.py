@@ -0,0 +1,236 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Float, bindparam, cast, func, insert, update
+from app import db, cache
+from app.cache import Cache, tags
+from app.models.game import Game
+from app.models.game_rating_stats import GameRatingStats, SCORES
+from app.models.user_review import UserReview
+from app.pagination import paginate
+
+class GameRatingStatsRepository:
+    '''
+    Repository layer for GameRatingStats model.
+
+    This class maintains the denormalized rating aggregates of each game. The write methods
+    only add statements to the current transaction; the caller is responsible for committing,
+    so the aggregates are always written together with the review that changed them.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+
+    Methods:
+    -------
+    get(game_id: int) -> GameRatingStats:
+        Retrieves the rating aggregates of a game.
+    get_top_rated(min_reviews: int, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of rating aggregates ordered by average score.
+    apply(game_id: int, added: int, removed: int) -> None:
+        Adds and/or removes a review score from the aggregates of a game.
+    add_scores(scores_by_game: dict[int, list[int]]) -> None:
+        Adds the scores of many new reviews to the aggregates of their games.
+    rebuild() -> int:
+        Recomputes the aggregates of every game from the user_reviews table.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db, cache: Cache = cache) -> None:
+        '''
+        Initializes the GameRatingStatsRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by rebuild (default is the cache instance from app).
+        '''
+        self.db = db
+        self.cache = cache
+
+    def get(self, game_id):
+        '''
+        Get the rating aggregates of a game.
+
+        Parameters:
+        ----------
+        game_id : int
+            The ID of the game.
+
+        Returns:
+        -------
+        GameRatingStats
+            The GameRatingStats object, or None if the game does not exist.
+        '''
+        return self.db.session.get(GameRatingStats, game_id)
+
+    def get_top_rated(self, min_reviews=1, limit=None, cursor=None, options=()):
+        '''
+        Get a page of rating aggregates ordered by average score, best first.
+
+        Parameters:
+        ----------
+        min_reviews : int, optional
+            The minimum number of reviews a game needs to be ranked (default is 1).
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        Page
+            A page of GameRatingStats objects.
+        '''
+        query = GameRatingStats.query.options(*options).filter(
+            GameRatingStats.average.isnot(None),
+            GameRatingStats.score_count >= min_reviews
+        )
+        return paginate(query, [GameRatingStats.average, GameRatingStats.game_id], limit, cursor, descending=True)
+
+    def apply(self, game_id, added=None, removed=None):
+        '''
+        Add and/or remove a review score from the aggregates of a game, without committing.
+
+        Parameters:
+        ----------
+        game_id : int
+            The ID of the reviewed game.
+        added : int, optional
+            The score of a review that was created or the new score of an updated review.
+        removed : int, optional
+            The score of a review that was deleted or the old score of an updated review.
+        '''
+        if added == removed:
+            return
+
+        histogram = {}
+        if added is not None:
+            histogram[added] = 1
+        if removed is not None:
+            histogram[removed] = histogram.get(removed, 0) - 1
+        self._apply_histogram(game_id, histogram)
+
+    def add_scores(self, scores_by_game):
+        '''
+        Add the scores of many new reviews to the aggregates of their games with one
+        executemany, without committing.
+
+        Parameters:
+        ----------
+        scores_by_game : dict[int, list[int]]
+            The scores of the created reviews, by the ID of the reviewed game.
+        '''
+        if not scores_by_game:
+            return
+
+        existing = set(self.db.session.scalars(
+            db.select(GameRatingStats.game_id).where(GameRatingStats.game_id.in_(scores_by_game))
+        ))
+
+        # First reviews of games created before the aggregates existed: empty rows, one
+        # executemany, so the update below covers every game
+        missing = [{'game_id': game_id} for game_id in scores_by_game if game_id not in existing]
+        if missing:
+            self.db.session.connection().execute(GameRatingStats.__table__.insert(), missing)
+
+        params = []
+        for game_id, scores in scores_by_game.items():
+            histogram = {score: scores.count(score) for score in SCORES}
+            params.append({
+                'b_game_id': game_id,
+                'b_sum': sum(scores),
+                'b_count': len(scores),
+                **{f'b_score_{score}': count for score, count in histogram.items()}
+            })
+
+        new_sum = GameRatingStats.score_sum + bindparam('b_sum')
+        new_count = GameRatingStats.score_count + bindparam('b_count')
+        values = {
+            'score_sum': new_sum,
+            'score_count': new_count,
+            'average': cast(new_sum, Float) / func.nullif(new_count, 0),
+            **{
+                f'score_{score}': getattr(GameRatingStats, f'score_{score}') + bindparam(f'b_score_{score}')
+                for score in SCORES
+            }
+        }
+        statement = GameRatingStats.__table__.update().where(
+            GameRatingStats.__table__.c.game_id == bindparam('b_game_id')
+        ).values(values)
+        self.db.session.connection().execute(statement, params)
+
+    def _apply_histogram(self, game_id, histogram):
+        '''
+        Shift the aggregates of a game by the given number of reviews per score.
+        '''
+        delta_sum = sum(score * delta for score, delta in histogram.items())
+        delta_count = sum(histogram.values())
+
+        new_sum = GameRatingStats.score_sum + delta_sum
+        new_count = GameRatingStats.score_count + delta_count
+        values = {
+            GameRatingStats.score_sum: new_sum,
+            GameRatingStats.score_count: new_count,
+            GameRatingStats.average: cast(new_sum, Float) / func.nullif(new_count, 0)
+        }
+        for score, delta in histogram.items():
+            if delta:
+                column = getattr(GameRatingStats, f'score_{score}')
+                values[column] = column + delta
+
+        result = self.db.session.execute(
+            update(GameRatingStats).where(GameRatingStats.game_id == game_id).values(values)
+        )
+
+        # First reviews of a game created before the aggregates existed
+        if result.rowcount == 0 and delta_count > 0:
+            stats = GameRatingStats(
+                game_id=game_id,
+                score_sum=delta_sum,
+                score_count=delta_count,
+                average=delta_sum / delta_count
+            )
+            for score in SCORES:
+                setattr(stats, f'score_{score}', max(histogram.get(score, 0), 0))
+            self.db.session.add(stats)
+
+    def rebuild(self):
+        '''
+        Recompute the aggregates of every game from the user_reviews table and commit.
+
+        Every game gets a row, with zero counts if it has no reviews, as GameRepository.create
+        and the migration that added the table give them.
+
+        Returns:
+        -------
+        int
+            The number of games.
+        '''
+        columns = [
+            Game.id,
+            func.coalesce(func.sum(UserReview.score), 0),
+            func.count(UserReview.id)
+        ] + [func.coalesce(func.sum(cast(UserReview.score == score, db.Integer)), 0) for score in SCORES]
+        rows = self.db.session.execute(
+            db.select(*columns).outerjoin(UserReview, UserReview.game_id == Game.id).group_by(Game.id)
+        ).all()
+
+        self.db.session.execute(db.delete(GameRatingStats))
+        if rows:
+            self.db.session.execute(insert(GameRatingStats), [
+                {
+                    'game_id': game_id,
+                    'score_sum': score_sum,
+                    'score_count': score_count,
+                    'average': score_sum / score_count if score_count else None,
+                    **{f'score_{score}': count for score, count in zip(SCORES, histogram)}
+                }
+                for game_id, score_sum, score_count, *histogram in rows
+            ])
+
+        self.db.session.commit()
+        self.cache.invalidate(tags.RATINGS)
+        return len(rows)
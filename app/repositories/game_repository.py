@@ -1,35 +1,104 @@
+from datetime import date
+from urllib.parse import urlencode
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from sqlalchemy import extract, func, literal, union_all
+from app import db, cache, reference_cache
+from app.cache import tags
+from app.models.developer import Developer
 from app.models.game import Game
+from app.models.game_platform import game_platform
+from app.models.game_rating_stats import GameRatingStats
+from app.models.genre import Genre
+from app.models.platform import Platform
+from app.models.publisher import Publisher
+from app.pagination import paginate
+
+# Browse filters on a column of games, and the reference table naming their values
+FACET_COLUMNS = {
+    'genre': (Game.genre_id, Genre),
+    'developer': (Game.developer_id, Developer),
+    'publisher': (Game.publisher_id, Publisher)
+}
+
+# Browse sort orders: the keyset pagination columns and whether they are descending
+BROWSE_SORTS = {
+    'title': ([Game.title, Game.id], False),
+    'release_date': ([Game.release_date, Game.id], False),
+    '-release_date': ([Game.release_date, Game.id], True)
+}
 
 class GameRepository:
     '''
     Repository layer for Game model.
     '''
-    def __init__(self, db = db) -> None:
+    def __init__(self, db = db, cache = cache) -> None:
         self.db = db
+        self.cache = cache
 
     def create(self, data):
         '''
         Create a new game.
         '''
-        game = Game(**data)
+        game = Game(**data, rating_stats=GameRatingStats())
         self.db.session.add(game)
         self.db.session.commit()
+        self.cache.invalidate(tags.GAMES, tags.USER_REVIEWS)
         return game
     
-    def get(self, id):
+    def get(self, id, options=()):
         '''
-        Get a game by ID.
+        Get a game by ID, applying the given loader options.
         '''
-        return Game.query.get(id)
+        return self.db.session.get(Game, id, options=options)
     
-    def get_all(self):
+    def get_all(self, limit=None, cursor=None, options=()):
         '''
-        Get all games.
+        Get a page of games ordered by title, applying the given loader options.
         '''
-        return Game.query.all()
+        return paginate(Game.query.options(*options), [Game.title, Game.id], limit, cursor)
     
+    def browse(self, filters, sort='title', limit=None, cursor=None, options=()):
+        '''
+        Get a page of the games matching the given filters, with one composed query.
+
+        Only a platform filter joins game_platforms; every other filter is a condition on an
+        indexed column of games.
+
+        Parameters:
+        ----------
+        filters : dict
+            Optional genre, platform, developer and publisher IDs, and year_from / year_to.
+        sort : str, optional
+            A key of BROWSE_SORTS.
+        '''
+        order_by, descending = BROWSE_SORTS[sort]
+        query = self._filter(Game.query.options(*options), filters)
+        return paginate(query, order_by, limit, cursor, descending)
+
+    def get_facets(self, filters):
+        '''
+        Get the number of games per value of each facet, for the current filters.
+
+        Each facet is counted with the filters of every other facet applied, so the counts
+        say how many games selecting that value would show. The counts of every facet are
+        computed with one UNION ALL statement and cached per filter set under the games tag,
+        and the platforms tag for the platform names (the other facets' names are reference
+        rows whose writes already invalidate games).
+
+        Parameters:
+        ----------
+        filters : dict
+            The browse filters.
+
+        Returns:
+        -------
+        dict[str, list[dict]]
+            The most frequent GAME_FACET_MAX_VALUES values of each facet, with their names and counts.
+        '''
+        key = 'game-facets:' + urlencode(sorted((name, value) for name, value in filters.items() if value is not None))
+        return self.cache.remember(key, [tags.GAMES, tags.PLATFORMS], lambda: self._count_facets(filters))
+
     def update(self, game, data):
         '''
         Update a game.
@@ -38,6 +107,7 @@ class GameRepository:
             setattr(game, key, value)
         
         self.db.session.commit()
+        self.cache.invalidate(tags.GAMES, tags.USER_REVIEWS)
         return game
     
     def delete(self, game):
@@ -46,12 +116,52 @@ class GameRepository:
         '''
         self.db.session.delete(game)
         self.db.session.commit()
+        self.cache.invalidate(tags.GAMES, tags.USER_REVIEWS)
         return game
-    
-    def get_by_title(self, title):
-        '''
-        Get games with the given title.
-        '''
-        search_term = f'%{title}%'
-        return Game.query.filter(Game.title.ilike(search_term)).all()
-        
\ No newline at end of file
+
+    def _count_facets(self, filters):
+        max_values = current_app.config['GAME_FACET_MAX_VALUES']
+        year = extract('year', Game.release_date)
+        dimensions = [(name, column) for name, (column, _) in FACET_COLUMNS.items()]
+        dimensions += [('platform', game_platform.c.platform_id), ('year', year)]
+
+        counts = []
+        for name, column in dimensions:
+            statement = db.select(literal(name).label('facet'), column.label('value'), func.count().label('count'))
+            statement = statement.select_from(Game)
+            if name == 'platform':
+                statement = statement.join(game_platform, game_platform.c.game_id == Game.id)
+            statement = self._filter(statement, filters, exclude=name)
+            counts.append(
+                statement.group_by(column).order_by(func.count().desc(), column).limit(max_values).subquery().select()
+            )
+
+        facets = {name: [] for name, _ in dimensions}
+        for name, value, count in self.db.session.execute(union_all(*counts)):
+            if name == 'year':
+                facets[name].append({'value': int(value), 'count': count})
+            else:
+                model = FACET_COLUMNS[name][1] if name in FACET_COLUMNS else Platform
+                facets[name].append({'id': value, 'name': reference_cache.name(model, value), 'count': count})
+        for values in facets.values():
+            values.sort(key=lambda entry: (-entry['count'], entry.get('id', entry.get('value'))))
+        return facets
+
+    def _filter(self, statement, filters, exclude=None):
+        # Works on ORM queries and Core selects alike
+        for name, (column, _) in FACET_COLUMNS.items():
+            if name != exclude and filters.get(name) is not None:
+                statement = statement.where(column == filters[name])
+
+        if exclude != 'platform' and filters.get('platform') is not None:
+            statement = statement.join(game_platform, game_platform.c.game_id == Game.id).where(
+                game_platform.c.platform_id == filters['platform']
+            )
+
+        if exclude != 'year':
+            if filters.get('year_from') is not None:
+                statement = statement.where(Game.release_date >= date(filters['year_from'], 1, 1))
+            if filters.get('year_to') is not None:
+                statement = statement.where(Game.release_date < date(filters['year_to'] + 1, 1, 1))
+        return statement
+
@@ -0,0 +1,115 @@
+import re
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, literal_column, or_, table, column
+from sqlalchemy.orm import with_expression
+from app import db
+from app.models.game import Game
+from app.models.game_search_index import create_search_index
+from app.pagination import Page, paginate
+
+class GameSearchRepository:
+    '''
+    Repository layer for full-text game search.
+
+    This class queries the search index created by app.models.game_search_index, using
+    FTS5 on SQLite and tsvector/pg_trgm on PostgreSQL. Other databases fall back to a
+    prefix match on the title.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+
+    Methods:
+    -------
+    search(text: str, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of games matching the text, most relevant first.
+    rebuild() -> None:
+        Creates the search index if needed and repopulates it.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db) -> None:
+        '''
+        Initializes the GameSearchRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        '''
+        self.db = db
+
+    def search(self, text, limit=None, cursor=None, options=()):
+        '''
+        Search games by title and description.
+
+        Every word of the text must match; the last word also matches as a prefix,
+        so results can be shown while the user is typing.
+
+        Parameters:
+        ----------
+        text : str
+            The search text.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        Page
+            A page of Game objects ordered by relevance, with search_rank loaded.
+        '''
+        terms = re.findall(r'\w+', text.lower())
+        if not terms:
+            return Page([])
+
+        dialect = self.db.session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            query, rank = self._sqlite_query(terms)
+        elif dialect == 'postgresql':
+            query, rank = self._postgres_query(terms, text)
+        else:
+            query, rank = self._fallback_query(terms)
+
+        rank = rank.label('search_rank')
+        query = query.options(*options, with_expression(Game.search_rank, rank))
+        return paginate(query, [rank, Game.id], limit, cursor, descending=True)
+
+    def rebuild(self):
+        '''
+        Create the search index if it does not exist and repopulate it from the games table.
+        '''
+        with self.db.engine.begin() as connection:
+            create_search_index(connection)
+
+    def _sqlite_query(self, terms):
+        games_fts = table('games_fts', column('rowid'))
+        match = ' '.join(f'"{term}"' for term in terms) + '*'
+
+        # bm25 is lower for better matches; titles weigh ten times more than descriptions
+        rank = -func.bm25(literal_column('games_fts'), 10.0, 1.0)
+        query = Game.query.join(games_fts, games_fts.c.rowid == Game.id).filter(
+            literal_column('games_fts').op('MATCH')(match)
+        )
+        return query, rank
+
+    def _postgres_query(self, terms, text):
+        search_vector = literal_column('games.search_vector')
+        ts_query = func.to_tsquery('simple', ' & '.join(terms) + ':*')
+
+        # Trigram similarity on the title catches typos the tsquery cannot
+        rank = func.ts_rank_cd(search_vector, ts_query) + func.similarity(Game.title, text)
+        query = Game.query.filter(or_(
+            search_vector.op('@@')(ts_query),
+            Game.title.op('%')(text)
+        ))
+        return query, rank
+
+    def _fallback_query(self, terms):
+        # Unindexed substring match, shorter titles first
+        rank = -func.length(Game.title)
+        query = Game.query.filter(*[Game.title.ilike(f'%{term}%') for term in terms])
+        return query, rank
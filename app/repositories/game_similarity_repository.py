@@ -0,0 +1,183 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import delete, func, insert, literal, union, union_all
+from app import db, cache
+from app.cache import Cache, tags
+from app.models.game import Game
+from app.models.game_similarity import GameSimilarity
+from app.models.user import User
+from app.models.user_backlog import UserBacklog
+from app.models.user_gamelist import UserGameList
+from app.models.user_gamelist_has_game import user_gamelist_has_game
+from app.models.user_review import UserReview
+
+# Interaction weight of a backlog entry; a review weighs its score / 10
+BACKLOG_WEIGHT = 0.5
+
+class GameSimilarityRepository:
+    '''
+    Repository layer for GameSimilarity model.
+
+    This class reads the precomputed neighbours of games and the recommendations derived from
+    them, and gives the similar games job streaming access to the user-game interactions.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+    cache : Cache
+        The response cache invalidated by writes.
+
+    Methods:
+    -------
+    get_similar(game_id: int, options: tuple) -> list[GameSimilarity]:
+        Retrieves the neighbours of a game, most similar first.
+    get_recommendations(user_id: int, limit: int, seed_size: int, min_score: int, options: tuple) -> list[tuple[Game, float]]:
+        Retrieves the games most similar to those a user liked, leaving out the games they have.
+    get_max_ids() -> tuple[int, int]:
+        Retrieves the highest user and game IDs.
+    stream_interactions(batch_size: int) -> Iterator[tuple[int, int, float]]:
+        Streams the weight of every user-game interaction, ordered by user_id.
+    replace(first_game_id: int, last_game_id: int, rows: list[dict]) -> None:
+        Replaces the neighbours of a range of games.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db, cache: Cache = cache) -> None:
+        '''
+        Initializes the GameSimilarityRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
+        '''
+        self.db = db
+        self.cache = cache
+
+    def get_similar(self, game_id, options=()):
+        '''
+        Get the neighbours of a game, most similar first, through ix_game_similarities_game_id_rank.
+
+        Parameters:
+        ----------
+        game_id : int
+            The ID of the game.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        list[GameSimilarity]
+            At most GAME_SIMILAR_TOP_N neighbours.
+        '''
+        return GameSimilarity.query.options(*options).filter(
+            GameSimilarity.game_id == game_id
+        ).order_by(GameSimilarity.rank).all()
+
+    def get_recommendations(self, user_id, limit, seed_size, min_score, options=()):
+        '''
+        Get the games most similar to those a user recently liked, with one aggregate query.
+
+        The seeds are the user's latest seed_size backlog entries and reviews scored at least
+        min_score. Their neighbours are summed by game, and games the user reviewed, has in
+        their backlog or in one of their lists are left out.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user.
+        limit : int
+            The maximum number of games to return.
+        seed_size : int
+            The number of recent reviews, and of recent backlog entries, used as seeds.
+        min_score : int
+            The lowest review score that counts as liking a game.
+        options : tuple, optional
+            Loader options matching the schema the games are serialized with.
+
+        Returns:
+        -------
+        list[tuple[Game, float]]
+            The recommended games and their summed similarity, best first.
+        '''
+        liked = db.select(UserReview.game_id).where(
+            UserReview.user_id == user_id, UserReview.score >= min_score
+        ).order_by(UserReview.id.desc()).limit(seed_size)
+        backlogged = db.select(UserBacklog.game_id).where(
+            UserBacklog.user_id == user_id
+        ).order_by(UserBacklog.id.desc()).limit(seed_size)
+        seeds = union_all(liked.subquery().select(), backlogged.subquery().select())
+
+        owned = union(
+            db.select(UserReview.game_id).where(UserReview.user_id == user_id),
+            db.select(UserBacklog.game_id).where(UserBacklog.user_id == user_id),
+            db.select(user_gamelist_has_game.c.game_id).join(
+                UserGameList, UserGameList.id == user_gamelist_has_game.c.gamelist_id
+            ).where(UserGameList.user_id == user_id)
+        )
+
+        total = func.sum(GameSimilarity.score).label('total')
+        scores = self.db.session.execute(
+            db.select(GameSimilarity.similar_game_id, total).where(
+                GameSimilarity.game_id.in_(seeds), GameSimilarity.similar_game_id.not_in(owned)
+            ).group_by(GameSimilarity.similar_game_id)
+                .order_by(total.desc(), GameSimilarity.similar_game_id).limit(limit)
+        ).all()
+        if not scores:
+            return []
+
+        games = {game.id: game for game in Game.query.options(*options).filter(Game.id.in_([id for id, _ in scores]))}
+        return [(games[id], score) for id, score in scores]
+
+    def get_max_ids(self):
+        max_user_id = self.db.session.scalar(db.select(func.max(User.id))) or 0
+        max_game_id = self.db.session.scalar(db.select(func.max(Game.id))) or 0
+        return max_user_id, max_game_id
+
+    def stream_interactions(self, batch_size=50000):
+        '''
+        Stream the weight of every user-game interaction, ordered by user.
+
+        A review weighs its score / 10 and a backlog entry BACKLOG_WEIGHT; a game both reviewed
+        and backlogged by a user keeps the larger weight.
+
+        Parameters:
+        ----------
+        batch_size : int, optional
+            The number of rows fetched from the cursor at a time.
+
+        Yields:
+        ------
+        tuple[int, int, float]
+            The user_id, game_id and weight of each interaction.
+        '''
+        interactions = union_all(
+            db.select(UserReview.user_id, UserReview.game_id, (UserReview.score / 10.0).label('weight')),
+            db.select(UserBacklog.user_id, UserBacklog.game_id, literal(BACKLOG_WEIGHT))
+        ).subquery()
+        statement = db.select(interactions.c.user_id, interactions.c.game_id, func.max(interactions.c.weight)).group_by(
+            interactions.c.user_id, interactions.c.game_id
+        ).order_by(interactions.c.user_id, interactions.c.game_id)
+        yield from self.db.session.execute(statement.execution_options(yield_per=batch_size))
+
+    def replace(self, first_game_id, last_game_id, rows):
+        '''
+        Replace the neighbours of the games with IDs from first_game_id to last_game_id and commit.
+
+        Parameters:
+        ----------
+        first_game_id : int
+            The lowest game ID of the range.
+        last_game_id : int
+            The highest game ID of the range.
+        rows : list[dict]
+            The new neighbours of the games in the range.
+        '''
+        self.db.session.execute(
+            delete(GameSimilarity).where(GameSimilarity.game_id.between(first_game_id, last_game_id))
+        )
+        if rows:
+            self.db.session.execute(insert(GameSimilarity.__table__), rows)
+        self.db.session.commit()
+        self.cache.invalidate(tags.GAMES)
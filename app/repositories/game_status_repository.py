@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
 from app.models.game_status import GameStatus
 
 class GameStatusRepository:
@@ -18,17 +20,20 @@ class GameStatusRepository:
     -------
     create(data: dict) -> GameStatus:
         Creates a new game status with the provided data.
-    get(id: int) -> GameStatus:
-        Retrieves a game status by its ID.
-    get_all() -> list[GameStatus]:
-        Retrieves all game statuses.
-    update(game_status: GameStatus, data: dict) -> GameStatus:
-        Updates an existing game status with the provided data.
-    delete(game_status: GameStatus) -> GameStatus:
-        Deletes the provided game status.
+    get(id: int) -> ReferenceRow:
+        Retrieves the cached row of a game status by its ID.
+    get_all() -> list[ReferenceRow]:
+        Retrieves the cached rows of all game statuses.
+    update(id: int, data: dict) -> GameStatus:
+        Updates a game status by its ID with the provided data.
+    delete(id: int) -> GameStatus:
+        Deletes a game status by its ID.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
         '''
         Initializes the GameStatusRepository with the given SQLAlchemy database instance.
 
@@ -36,8 +41,14 @@ class GameStatusRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        reference_cache : ReferenceCache, optional
+            The cache serving reads of this table (default is the reference_cache instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         '''
         self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
 
     def create(self, data):
         '''
@@ -56,6 +67,8 @@ class GameStatusRepository:
         game_status = GameStatus(**data)
         self.db.session.add(game_status)
         self.db.session.commit()
+        self.reference_cache.invalidate(GameStatus)
+        self.cache.invalidate(tags.GAME_STATUSES, tags.USER_REVIEWS)
         return game_status
     
     def get(self, id):
@@ -69,10 +82,10 @@ class GameStatusRepository:
 
         Returns:
         -------
-        GameStatus
-            The GameStatus object with the provided ID.
+        ReferenceRow
+            The cached (id, name) row of the game status with the specified ID, or None if not found.
         '''
-        return GameStatus.query.get(id)
+        return self.reference_cache.get(GameStatus, id)
 
     def get_all(self):
         '''
@@ -80,46 +93,58 @@ class GameStatusRepository:
 
         Returns:
         -------
-        list[GameStatus]
-            A list of all GameStatus objects in the database.
+        list[ReferenceRow]
+            The cached (id, name) rows of all game statuses, ordered by ID.
         '''
-        return GameStatus.query.all()
+        return self.reference_cache.get_all(GameStatus)
 
-    def update(self, game_status, data):
+    def update(self, id, data):
         '''
         Update an existing game status with the provided data.
 
         Parameters:
         ----------
-        game_status : GameStatus
-            The GameStatus object to update.
+        id : int
+            The ID of the game status to update.
         data : dict
             A dictionary containing the updated game status data.
 
         Returns:
         -------
         GameStatus
-            The updated GameStatus object.
+            The updated GameStatus object, or None if not found.
         '''
+        game_status = self.db.session.get(GameStatus, id)
+        if game_status is None:
+            return None
+
         for key, value in data.items():
             setattr(game_status, key, value)
         self.db.session.commit()
+        self.reference_cache.invalidate(GameStatus)
+        self.cache.invalidate(tags.GAME_STATUSES, tags.USER_REVIEWS)
         return game_status
     
-    def delete(self, game_status):
+    def delete(self, id):
         '''
         Delete the provided game status.
 
         Parameters:
         ----------
-        game_status : GameStatus
-            The GameStatus object to delete.
+        id : int
+            The ID of the game status to delete.
 
         Returns:
         -------
         GameStatus
-            The deleted GameStatus object.
+            The deleted GameStatus object, or None if not found.
         '''
+        game_status = self.db.session.get(GameStatus, id)
+        if game_status is None:
+            return None
+
         self.db.session.delete(game_status)
         self.db.session.commit()
+        self.reference_cache.invalidate(GameStatus)
+        self.cache.invalidate(tags.GAME_STATUSES, tags.USER_REVIEWS)
         return game_status
\ No newline at end of file
@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
 from app.models.genre import Genre
 
 class GenreRepository:
@@ -18,17 +20,20 @@ class GenreRepository:
     -------
     create(data: dict) -> Genre:
         Creates a new genre with the provided data.
-    get(id: int) -> Genre:
-        Retrieves a genre by its ID.
-    get_all() -> list[Genre]:
-        Retrieves all genres.
-    update(genre: Genre, data: dict) -> Genre:
-        Updates an existing genre with the provided data.
-    delete(genre: Genre) -> Genre:
-        Deletes the provided genre.
+    get(id: int) -> ReferenceRow:
+        Retrieves the cached row of a genre by its ID.
+    get_all() -> list[ReferenceRow]:
+        Retrieves the cached rows of all genres.
+    update(id: int, data: dict) -> Genre:
+        Updates a genre by its ID with the provided data.
+    delete(id: int) -> Genre:
+        Deletes a genre by its ID.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
         '''
         Initializes the GenreRepository with the given SQLAlchemy database instance.
 
@@ -36,8 +41,14 @@ class GenreRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        reference_cache : ReferenceCache, optional
+            The cache serving reads of this table (default is the reference_cache instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         '''
         self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
 
     def create(self, data):
         '''
@@ -56,6 +67,8 @@ class GenreRepository:
         genre = Genre(**data)
         self.db.session.add(genre)
         self.db.session.commit()
+        self.reference_cache.invalidate(Genre)
+        self.cache.invalidate(tags.GENRES, tags.GAMES)
         return genre
     
     def get(self, id):
@@ -69,10 +82,10 @@ class GenreRepository:
 
         Returns:
         -------
-        Genre
-            The Genre object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the genre with the specified ID, or None if not found.
         '''
-        return Genre.query.get(id)
+        return self.reference_cache.get(Genre, id)
     
     def get_all(self):
         '''
@@ -80,48 +93,60 @@ class GenreRepository:
 
         Returns:
         -------
-        list[Genre]
-            A list of all Genre objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all genres, ordered by ID.
         '''
-        return Genre.query.all()
+        return self.reference_cache.get_all(Genre)
     
-    def update(self, genre, data):
+    def update(self, id, data):
         '''
         Update an existing genre.
 
         Parameters:
         ----------
-        genre : Genre
-            The Genre object to update.
+        id : int
+            The ID of the genre to update.
         data : dict
             A dictionary containing the updated genre data.
 
         Returns:
         -------
         Genre
-            The updated Genre object.
+            The updated Genre object, or None if not found.
         '''
+        genre = self.db.session.get(Genre, id)
+        if genre is None:
+            return None
+
         for key, value in data.items():
             setattr(genre, key, value)
         
         self.db.session.commit()
+        self.reference_cache.invalidate(Genre)
+        self.cache.invalidate(tags.GENRES, tags.GAMES)
         return genre
     
-    def delete(self, genre):
+    def delete(self, id):
         '''
         Delete a genre.
 
         Parameters:
         ----------
-        genre : Genre
-            The Genre object to delete.
+        id : int
+            The ID of the genre to delete.
 
         Returns:
         -------
         Genre
-            The deleted Genre object.
+            The deleted Genre object, or None if not found.
         '''
+        genre = self.db.session.get(Genre, id)
+        if genre is None:
+            return None
+
         self.db.session.delete(genre)
         self.db.session.commit()
+        self.reference_cache.invalidate(Genre)
+        self.cache.invalidate(tags.GENRES, tags.GAMES)
         return genre
         
\ No newline at end of file
@@ -0,0 +1,66 @@
+from sqlalchemy.orm import joinedload
+from app.models.activity import Activity
+from app.models.follower import Follower
+from app.models.game import Game
+from app.models.game_rating_stats import GameRatingStats
+from app.models.game_similarity import GameSimilarity
+from app.models.user_backlog import UserBacklog
+from app.models.user_review import UserReview
+from app.models.user_suggestion import UserSuggestion
+
+"""
+Load Plans
+
+This module defines the loader options each endpoint passes to its repository so that the
+relationships touched by the schema it serializes with are loaded in the same query, instead
+of one lazy load per row.
+
+Keep each plan in sync with the fields of the schema named next to it.
+"""
+
+# GameSchema: genre, developer and publisher names come from the reference cache
+GAME = ()
+
+# GameDetailSchema: GameSchema plus the rating aggregates
+GAME_DETAIL = GAME + (
+    joinedload(Game.rating_stats),
+)
+
+# TopRatedGameSchema: the rating aggregates with a nested GameSchema
+TOP_RATED_GAME = (
+    joinedload(GameRatingStats.game),
+)
+
+# SimilarGameSchema: nested similar game (GameSchema)
+SIMILAR_GAME = (
+    joinedload(GameSimilarity.similar_game),
+)
+
+# UserReviewSchema: nested user, game (id, title) and status
+USER_REVIEW = (
+    joinedload(UserReview.user),
+    joinedload(UserReview.game),
+    joinedload(UserReview.status)
+)
+
+# UserBacklogSchema: nested game (id, title)
+USER_BACKLOG = (
+    joinedload(UserBacklog.game),
+)
+
+# FollowerSchema: usernames of both users
+FOLLOWER = (
+    joinedload(Follower.user),
+    joinedload(Follower.follower)
+)
+
+# ActivitySchema: nested actor (id, username) and game (id, title)
+ACTIVITY = (
+    joinedload(Activity.actor),
+    joinedload(Activity.game)
+)
+
+# UserSuggestionSchema: nested suggested user (id, username)
+USER_SUGGESTION = (
+    joinedload(UserSuggestion.suggested),
+)
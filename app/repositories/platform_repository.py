@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
 from app.models.platform import Platform
 
 class PlatformRepository:
@@ -18,17 +20,20 @@ class PlatformRepository:
     -------
     create(data: dict) -> Platform:
         Creates a new platform with the provided data.
-    get(id: int) -> Platform:
-        Retrieves a platform by its ID.
-    get_all() -> list[Platform]:
-        Retrieves all platforms.
-    update(platform: Platform, data: dict) -> Platform:
-        Updates an existing platform with the provided data.
-    delete(platform: Platform) -> Platform:
-        Deletes the provided platform.
+    get(id: int) -> ReferenceRow:
+        Retrieves the cached row of a platform by its ID.
+    get_all() -> list[ReferenceRow]:
+        Retrieves the cached rows of all platforms.
+    update(id: int, data: dict) -> Platform:
+        Updates a platform by its ID with the provided data.
+    delete(id: int) -> Platform:
+        Deletes a platform by its ID.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
         '''
         Initializes the PlatformRepository with the given SQLAlchemy database instance.
 
@@ -36,8 +41,14 @@ class PlatformRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        reference_cache : ReferenceCache, optional
+            The cache serving reads of this table (default is the reference_cache instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         '''
         self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
 
     def create(self, data):
         '''
@@ -56,6 +67,8 @@ class PlatformRepository:
         platform = Platform(**data)
         self.db.session.add(platform)
         self.db.session.commit()
+        self.reference_cache.invalidate(Platform)
+        self.cache.invalidate(tags.PLATFORMS)
         return platform
 
     def get(self, id):
@@ -69,10 +82,10 @@ class PlatformRepository:
 
         Returns:
         -------
-        Platform
-            The Platform object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the platform with the specified ID, or None if not found.
         '''
-        return Platform.query.get(id)
+        return self.reference_cache.get(Platform, id)
 
     def get_all(self):
         '''
@@ -80,46 +93,58 @@ class PlatformRepository:
 
         Returns:
         -------
-        list[Platform]
-            A list of all Platform objects in the database.
+        list[ReferenceRow]
+            The cached (id, name) rows of all platforms, ordered by ID.
         '''
-        return Platform.query.all()
+        return self.reference_cache.get_all(Platform)
 
-    def update(self, platform, data):
+    def update(self, id, data):
         '''
         Update an existing platform with the provided data.
 
         Parameters:
         ----------
-        platform : Platform
-            The Platform object to update.
+        id : int
+            The ID of the platform to update.
         data : dict
             A dictionary containing the new platform data.
 
         Returns:
         -------
         Platform
-            The updated Platform object.
+            The updated Platform object, or None if not found.
         '''
+        platform = self.db.session.get(Platform, id)
+        if platform is None:
+            return None
+
         for key, value in data.items():
             setattr(platform, key, value)
         self.db.session.commit()
+        self.reference_cache.invalidate(Platform)
+        self.cache.invalidate(tags.PLATFORMS)
         return platform
 
-    def delete(self, platform):
+    def delete(self, id):
         '''
         Delete the provided platform.
 
         Parameters:
         ----------
-        platform : Platform
-            The Platform object to delete.
+        id : int
+            The ID of the platform to delete.
 
         Returns:
         -------
         Platform
-            The deleted Platform object.
+            The deleted Platform object, or None if not found.
         '''
+        platform = self.db.session.get(Platform, id)
+        if platform is None:
+            return None
+
         self.db.session.delete(platform)
         self.db.session.commit()
+        self.reference_cache.invalidate(Platform)
+        self.cache.invalidate(tags.PLATFORMS)
         return platform
\ No newline at end of file
@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from app import db, reference_cache, cache
+from app.cache import Cache, tags
+from app.reference_cache import ReferenceCache
 from app.models.publisher import Publisher
 
 
@@ -19,17 +21,20 @@ class PublisherRepository:
     -------
     create(data: dict) -> Publisher:
         Creates a new publisher with the provided data.
-    get(id: int) -> Publisher:
-        Retrieves a publisher by its ID.
-    get_all() -> list[Publisher]:
-        Retrieves all publishers.
-    update(publisher: Publisher, data: dict) -> Publisher:
-        Updates an existing publisher with the provided data.
-    delete(publisher: Publisher) -> None:
-        Deletes the provided publisher.
+    get(id: int) -> ReferenceRow:
+        Retrieves the cached row of a publisher by its ID.
+    get_all() -> list[ReferenceRow]:
+        Retrieves the cached rows of all publishers.
+    update(id: int, data: dict) -> Publisher:
+        Updates a publisher by its ID with the provided data.
+    delete(id: int) -> None:
+        Deletes a publisher by its ID.
     """
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 reference_cache: ReferenceCache = reference_cache,
+                 cache: Cache = cache) -> None:
         """
         Initializes the PublisherRepository with the given SQLAlchemy database instance.
 
@@ -37,8 +42,14 @@ class PublisherRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        reference_cache : ReferenceCache, optional
+            The cache serving reads of this table (default is the reference_cache instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         """
         self.db = db
+        self.reference_cache = reference_cache
+        self.cache = cache
 
     def create(self, data):
         """
@@ -57,6 +68,8 @@ class PublisherRepository:
         publisher = Publisher(**data)
         self.db.session.add(publisher)
         self.db.session.commit()
+        self.reference_cache.invalidate(Publisher)
+        self.cache.invalidate(tags.PUBLISHERS, tags.GAMES)
         return publisher
     
     def get(self, id):
@@ -70,10 +83,10 @@ class PublisherRepository:
 
         Returns:
         -------
-        Publisher
-            The Publisher object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the publisher with the specified ID, or None if not found.
         """
-        return Publisher.query.get(id)
+        return self.reference_cache.get(Publisher, id)
     
     def get_all(self):
         """
@@ -81,44 +94,56 @@ class PublisherRepository:
 
         Returns:
         -------
-        list[Publisher]
-            A list of all Publisher objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all publishers, ordered by ID.
         """
-        return Publisher.query.all()
+        return self.reference_cache.get_all(Publisher)
     
-    def update(self, publisher, data):
+    def update(self, id, data):
         """
         Update an existing publisher.
 
         Parameters:
         ----------
-        publisher : Publisher
-            The Publisher object to update.
+        id : int
+            The ID of the publisher to update.
         data : dict
             A dictionary containing the updated publisher data.
 
         Returns:
         -------
         Publisher
-            The updated Publisher object.
+            The updated Publisher object, or None if not found.
         """
+        publisher = self.db.session.get(Publisher, id)
+        if publisher is None:
+            return None
+
         for key, value in data.items():
             setattr(publisher, key, value)
         self.db.session.commit()
+        self.reference_cache.invalidate(Publisher)
+        self.cache.invalidate(tags.PUBLISHERS, tags.GAMES)
         return publisher
     
-    def delete(self, publisher):
+    def delete(self, id):
         """
         Delete a publisher.
 
         Parameters:
         ----------
-        publisher : Publisher
-            The Publisher object to delete.
+        id : int
+            The ID of the publisher to delete.
 
         Returns:
         -------
         None
         """
+        publisher = self.db.session.get(Publisher, id)
+        if publisher is None:
+            return None
+
         self.db.session.delete(publisher)
-        self.db.session.commit()
\ No newline at end of file
+        self.db.session.commit()
+        self.reference_cache.invalidate(Publisher)
+        self.cache.invalidate(tags.PUBLISHERS, tags.GAMES)
\ No newline at end of file
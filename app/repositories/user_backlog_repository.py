@@ -1,6 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
+from app.models.activity import BACKLOG
 from app.models.user_backlog import UserBacklog
-from app import db
+from app import db, cache
+from app.cache import Cache, tags
+from app.repositories.activity_repository import ActivityRepository
+from app.pagination import paginate
 
 class UserBacklogRepository:
     '''
@@ -13,19 +17,26 @@ class UserBacklogRepository:
     ----------
     db : SQLAlchemy
         The SQLAlchemy database instance.
+    cache : Cache
+        The response cache invalidated by writes.
+    activity_repository : ActivityRepository
+        The repository used to publish new entries to the feeds of the user's followers.
 
     Methods:
     -------
-    get(user_id: int, game_id: int) -> UserBacklog:
+    get(user_id: int, game_id: int, options: tuple) -> UserBacklog:
         Retrieves a user backlog entry.
     create(data: dict) -> UserBacklog:
         Creates a new user backlog entry with the provided data.
     delete(user_backlog: UserBacklog) -> UserBacklog:
         Deletes the provided user backlog entry.
-    get_backlog(user_id: int) -> list[UserBacklog]:
-        Retrieves all games in a user's backlog.
+    get_backlog(user_id: int, limit: int, cursor: str, options: tuple) -> Page:
+        Retrieves a page of games in a user's backlog.
     '''
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 cache: Cache = cache,
+                 activity_repository: ActivityRepository = ActivityRepository()) -> None:
         '''
         Initializes the UserBacklogRepository with the given SQLAlchemy database instance.
 
@@ -33,10 +44,16 @@ class UserBacklogRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
+        activity_repository : ActivityRepository, optional
+            The feed activity repository (default is a new ActivityRepository instance).
         '''
         self.db = db
+        self.cache = cache
+        self.activity_repository = activity_repository
 
-    def get(self, user_id, game_id):
+    def get(self, user_id, game_id, options=()):
         '''
         Get a user backlog entry.
 
@@ -46,13 +63,15 @@ class UserBacklogRepository:
             The ID of the user to retrieve the backlog entry for.
         game_id : int
             The ID of the game to retrieve the backlog entry for.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
         UserBacklog
             The UserBacklog object.
         '''
-        return UserBacklog.query.filter_by(user_id=user_id, game_id=game_id).first()
+        return UserBacklog.query.options(*options).filter_by(user_id=user_id, game_id=game_id).first()
 
     def create(self, data):
         '''
@@ -60,19 +79,26 @@ class UserBacklogRepository:
         '''
         user_backlog = UserBacklog(**data)
         self.db.session.add(user_backlog)
+        self.db.session.flush()
+        self.activity_repository.record(user_backlog.user_id, BACKLOG, user_backlog.id, user_backlog.game_id)
         self.db.session.commit()
+        self.cache.invalidate(tags.USER_BACKLOGS)
         return user_backlog
 
     def delete(self, user_backlog):
         '''
         Delete a user backlog entry.
         '''
+        self.activity_repository.remove(BACKLOG, user_backlog.id)
         self.db.session.delete(user_backlog)
         self.db.session.commit()
+        self.cache.invalidate(tags.USER_BACKLOGS)
         return user_backlog
 
-    def get_backlog(self, user_id):
+    def get_backlog(self, user_id, limit=None, cursor=None, options=()):
         '''
-        Get all games in a user's backlog.
+        Get a page of games in a user's backlog, most recently added first,
+        applying the given loader options.
         '''
-        return UserBacklog.query.filter_by(user_id=user_id).all()
\ No newline at end of file
+        query = UserBacklog.query.options(*options).filter_by(user_id=user_id)
+        return paginate(query, [UserBacklog.id], limit, cursor, descending=True)
\ No newline at end of file
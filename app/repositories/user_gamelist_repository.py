@@ -0,0 +1,334 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, delete, func, insert, update
+from app import db, cache
+from app.cache import Cache, tags
+from app.models.game import Game
+from app.models.user_gamelist import UserGameList
+from app.models.user_gamelist_has_game import user_gamelist_has_game
+from app.pagination import paginate
+
+class UserGameListRepository:
+    '''
+    Repository layer for UserGameList model and its ordered membership.
+
+    This class provides methods to create, retrieve, rename and delete game lists, and to page
+    through, add, remove and reorder their games. Membership is never loaded through the
+    games relationship: pages are read in (position, game_id) order through
+    ix_user_gamelist_has_game_gamelist_id_position, and every bulk write is a single statement
+    that also keeps the games_count column of the list in step.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+    cache : Cache
+        The response cache invalidated by writes.
+
+    Methods:
+    -------
+    create(data: dict) -> UserGameList:
+        Creates a new game list.
+    get(gamelist_id: int) -> UserGameList:
+        Retrieves a game list by its ID.
+    get_by_user(user_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the game lists of a user.
+    update(gamelist: UserGameList, data: dict) -> UserGameList:
+        Updates a game list.
+    delete(gamelist: UserGameList) -> None:
+        Deletes a game list and its membership.
+    get_games(gamelist_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the games of a list, in list order.
+    get_missing_game_ids(game_ids: list[int]) -> list[int]:
+        Retrieves the given game IDs that do not exist.
+    add_games(gamelist_id: int, game_ids: list[int]) -> int:
+        Appends games to the end of a list.
+    remove_games(gamelist_id: int, game_ids: list[int]) -> int:
+        Removes games from a list.
+    move_games(gamelist_id: int, positions: list[dict]) -> int:
+        Moves games to new positions in a list, shifting the games after them.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db, cache: Cache = cache) -> None:
+        '''
+        Initializes the UserGameListRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
+        '''
+        self.db = db
+        self.cache = cache
+
+    def create(self, data):
+        '''
+        Create a new game list.
+
+        Parameters:
+        ----------
+        data : dict
+            The user_id and name of the list.
+
+        Returns:
+        -------
+        UserGameList
+            The created UserGameList object.
+        '''
+        gamelist = UserGameList(**data)
+        self.db.session.add(gamelist)
+        self.db.session.commit()
+        self.cache.invalidate(tags.USER_GAMELISTS)
+        return gamelist
+
+    def get(self, gamelist_id):
+        '''
+        Get a game list by its ID.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+
+        Returns:
+        -------
+        UserGameList
+            The UserGameList object, or None if not found.
+        '''
+        return self.db.session.get(UserGameList, gamelist_id)
+
+    def get_by_user(self, user_id, limit=None, cursor=None):
+        '''
+        Get a page of the game lists of a user, in creation order.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user.
+        limit : int, optional
+            The maximum number of lists to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+
+        Returns:
+        -------
+        Page
+            A page of UserGameList objects and the cursor for the next one.
+
+        Raises:
+        ------
+        InvalidCursorError
+            If the cursor is malformed.
+        '''
+        query = UserGameList.query.filter(UserGameList.user_id == user_id)
+        return paginate(query, [UserGameList.id], limit, cursor)
+
+    def update(self, gamelist, data):
+        '''
+        Update a game list.
+
+        Parameters:
+        ----------
+        gamelist : UserGameList
+            The list to update.
+        data : dict
+            The columns to change.
+
+        Returns:
+        -------
+        UserGameList
+            The updated UserGameList object.
+        '''
+        for key, value in data.items():
+            setattr(gamelist, key, value)
+
+        self.db.session.commit()
+        self.cache.invalidate(tags.USER_GAMELISTS)
+        return gamelist
+
+    def delete(self, gamelist):
+        '''
+        Delete a game list and its membership.
+
+        Parameters:
+        ----------
+        gamelist : UserGameList
+            The list to delete.
+        '''
+        self.db.session.execute(
+            delete(user_gamelist_has_game).where(user_gamelist_has_game.c.gamelist_id == gamelist.id)
+        )
+        self.db.session.delete(gamelist)
+        self.db.session.commit()
+        self.cache.invalidate(tags.USER_GAMELISTS)
+
+    def get_games(self, gamelist_id, limit=None, cursor=None):
+        '''
+        Get a page of the games of a list, in (position, game_id) order.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+
+        Returns:
+        -------
+        Page
+            A page of rows with the game_id, title and position of each game, and the cursor
+            for the next one.
+
+        Raises:
+        ------
+        InvalidCursorError
+            If the cursor is malformed.
+        '''
+        query = self.db.session.query(
+            user_gamelist_has_game.c.game_id, Game.title, user_gamelist_has_game.c.position
+        ).join(Game, Game.id == user_gamelist_has_game.c.game_id).filter(
+            user_gamelist_has_game.c.gamelist_id == gamelist_id
+        )
+        return paginate(query, [user_gamelist_has_game.c.position, user_gamelist_has_game.c.game_id], limit, cursor)
+
+    def get_missing_game_ids(self, game_ids):
+        '''
+        Get the given game IDs that do not exist.
+
+        Parameters:
+        ----------
+        game_ids : list[int]
+            The game IDs to check.
+
+        Returns:
+        -------
+        list[int]
+            The sorted game IDs that were not found.
+        '''
+        found = set(self.db.session.scalars(db.select(Game.id).where(Game.id.in_(game_ids))))
+        return sorted(set(game_ids) - found)
+
+    def add_games(self, gamelist_id, game_ids):
+        '''
+        Append games to the end of a list, in the order given, with one executemany and commit.
+
+        Games already in the list keep their position.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+        game_ids : list[int]
+            The IDs of the games to add.
+
+        Returns:
+        -------
+        int
+            The number of games added.
+        '''
+        members = user_gamelist_has_game.c
+        existing = set(self.db.session.scalars(
+            db.select(members.game_id).where(members.gamelist_id == gamelist_id, members.game_id.in_(game_ids))
+        ))
+        new_ids = [game_id for game_id in dict.fromkeys(game_ids) if game_id not in existing]
+        if not new_ids:
+            return 0
+
+        last = self.db.session.scalar(
+            db.select(func.max(members.position)).where(members.gamelist_id == gamelist_id)
+        )
+        start = 0 if last is None else last + 1
+        self.db.session.execute(insert(user_gamelist_has_game), [
+            {'gamelist_id': gamelist_id, 'game_id': game_id, 'position': position}
+            for position, game_id in enumerate(new_ids, start=start)
+        ])
+        self._count(gamelist_id, len(new_ids))
+        self.db.session.commit()
+        self.cache.invalidate(tags.USER_GAMELISTS)
+        return len(new_ids)
+
+    def remove_games(self, gamelist_id, game_ids):
+        '''
+        Remove games from a list with one statement and commit.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+        game_ids : list[int]
+            The IDs of the games to remove.
+
+        Returns:
+        -------
+        int
+            The number of games removed.
+        '''
+        members = user_gamelist_has_game.c
+        removed = self.db.session.execute(
+            delete(user_gamelist_has_game).where(members.gamelist_id == gamelist_id, members.game_id.in_(game_ids))
+        ).rowcount
+        if removed:
+            self._count(gamelist_id, -removed)
+        self.db.session.commit()
+        if removed:
+            self.cache.invalidate(tags.USER_GAMELISTS)
+        return removed
+
+    def move_games(self, gamelist_id, positions):
+        '''
+        Move games to new positions in a list and commit.
+
+        Moves are applied in the order given: each game is taken out of the list and put
+        back at its position, a 0-based index, shifting the games from there on by one.
+        Positions past the end move the game to the end, and games that are not in the list
+        are ignored. The list is then renumbered 0..n-1 and only the rows whose position
+        changed are written, with one executemany.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+        positions : list[dict]
+            The game_id and new position of each game.
+
+        Returns:
+        -------
+        int
+            The number of games moved.
+        '''
+        members = user_gamelist_has_game.c
+        current = dict(self.db.session.execute(
+            db.select(members.game_id, members.position).where(members.gamelist_id == gamelist_id)
+                .order_by(members.position, members.game_id)
+        ).all())
+
+        order = list(current)
+        moved = 0
+        for row in positions:
+            if row['game_id'] not in current:
+                continue
+            order.remove(row['game_id'])
+            order.insert(min(row['position'], len(order)), row['game_id'])
+            moved += 1
+
+        params = [
+            {'b_game_id': game_id, 'b_position': position}
+            for position, game_id in enumerate(order) if current[game_id] != position
+        ]
+        if params:
+            statement = user_gamelist_has_game.update().where(
+                members.gamelist_id == gamelist_id, members.game_id == bindparam('b_game_id')
+            ).values(position=bindparam('b_position'))
+            self.db.session.connection().execute(statement, params)
+            self.db.session.commit()
+            self.cache.invalidate(tags.USER_GAMELISTS)
+        return moved
+
+    def _count(self, gamelist_id, delta):
+        self.db.session.execute(
+            update(UserGameList).where(UserGameList.id == gamelist_id)
+                .values(games_count=UserGameList.games_count + delta).execution_options(synchronize_session=False)
+        )
@@ -1,46 +1,68 @@
 from flask_sqlalchemy import SQLAlchemy
-from flask_bcrypt import Bcrypt
-from app import db, bcrypt
+from sqlalchemy import insert
+from app import db, cache, passwords
+from app.cache import Cache, tags
 from app.models.user import User
+from app.passwords import PasswordHasher
+from app.pagination import paginate
 
 
 class UserRepository:
     def __init__(
         self,
         db: SQLAlchemy = db,
-        bcrypt: Bcrypt = bcrypt) -> None:
+        passwords: PasswordHasher = passwords,
+        cache: Cache = cache) -> None:
 
         self.db = db
-        self.bcrypt = bcrypt
+        self.passwords = passwords
+        self.cache = cache
 
 
     def create(self, data):
         password = data.pop('password')
-        hashed_password = self.bcrypt.generate_password_hash(password).decode('utf-8')
+        hashed_password = self.passwords.hash(password)
         data['password'] = hashed_password
 
         user = User(**data)
         
         self.db.session.add(user)
         self.db.session.commit()
+        self.cache.invalidate(tags.USERS)
         return user
+
+    def create_many(self, rows):
+        # Rows carry already hashed passwords; one executemany, IDs read back by username
+        self.db.session.execute(insert(User), rows)
+        self.db.session.commit()
+        self.cache.invalidate(tags.USERS)
+
+        usernames = [row['username'] for row in rows]
+        created = self.db.session.execute(db.select(User.username, User.id).where(User.username.in_(usernames)))
+        ids = {username: id for username, id in created}
+        return [ids[username] for username in usernames]
+
+    def hash_password(self, password):
+        return self.passwords.hash(password)
     
     def get(self, id):
         return User.query.get(id)
     
-    def get_all(self):
-        return User.query.all()
+    def get_all(self, limit=None, cursor=None):
+        return paginate(User.query, [User.username, User.id], limit, cursor)
     
     def update(self, user, data):
         for key, value in data.items():
             setattr(user, key, value)
         
         self.db.session.commit()
+        self.cache.invalidate(tags.USERS, tags.USER_REVIEWS, tags.FOLLOWERS)
         return user
     
     def delete(self, user):
         self.db.session.delete(user)
         self.db.session.commit()
+        self.cache.invalidate(tags.USERS, tags.USER_REVIEWS, tags.USER_BACKLOGS, tags.FOLLOWERS, tags.IDENTITIES)
         return user
     
     def get_by_email(self, email):
@@ -50,16 +72,27 @@ class UserRepository:
         return User.query.filter_by(username=username).first()
     
     def check_password(self, hash_password, password):
-        return self.bcrypt.check_password_hash(hash_password, password)
+        return self.passwords.check(hash_password, password)
+
+    def upgrade_password(self, user, password):
+        # Rehash with the configured cost while the plain password is known from a login
+        if self.passwords.needs_rehash(user.password):
+            user.password = self.passwords.hash(password)
+            self.db.session.commit()
     
     def change_password(self, user, data):
-        new_password = self.bcrypt.generate_password_hash(data['new_password']).decode('utf-8')
+        new_password = self.passwords.hash(data['new_password'])
         user.password = new_password
+        # Revoke every token issued with the old password
+        user.token_version = User.token_version + 1
         
         try:
             self.db.session.commit()
         except Exception as e:
             self.db.session.rollback()
             return {'message': 'An error occurred while changing password'}
+
+        self.cache.invalidate(tags.IDENTITIES)
+        return {'message': 'Password changed, log in again with the new password'}
         
     
\ No newline at end of file
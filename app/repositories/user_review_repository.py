@@ -1,6 +1,15 @@
 from flask_sqlalchemy import SQLAlchemy
-from app import db
+from sqlalchemy import insert
+from app import db, cache
+from app.cache import Cache, tags
+from app.models.activity import REVIEW
+from app.models.game import Game
+from app.models.game_status import GameStatus
+from app.models.user import User
 from app.models.user_review import UserReview
+from app.pagination import paginate
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.game_rating_stats_repository import GameRatingStatsRepository
 
 class UserReviewRepository:
     '''
@@ -8,27 +17,41 @@ class UserReviewRepository:
 
     This class provides methods to interact with the UserReview table in the database.
     It includes methods to create, retrieve, update, and delete user reviews.
+    Every write also updates the rating aggregates of the reviewed game and the feed activity
+    of the review in the same transaction.
 
     Attributes:
     ----------
     db : SQLAlchemy
         The SQLAlchemy database instance.
+    game_rating_stats_repository : GameRatingStatsRepository
+        The repository used to maintain the rating aggregates of each game.
+    activity_repository : ActivityRepository
+        The repository used to publish reviews to the feeds of the reviewer's followers.
+    cache : Cache
+        The response cache invalidated by every write.
 
     Methods:
     -------
     create(data: dict) -> UserReview:
         Creates a new user review with the provided data.
+    create_many(rows: list[dict]) -> list[int]:
+        Inserts several user reviews in one transaction.
     get(id: int) -> UserReview:
         Retrieves a user review by its ID.
-    get_all() -> list[UserReview]:
-        Retrieves all user reviews.
+    get_all(limit: int, cursor: str) -> Page:
+        Retrieves a page of user reviews.
     update(user_review: UserReview, data: dict) -> UserReview:
         Updates an existing user review with the provided data.
     delete(user_review: UserReview) -> UserReview:
         Deletes the provided user review.
     '''
 
-    def __init__(self, db: SQLAlchemy = db) -> None:
+    def __init__(self,
+                 db: SQLAlchemy = db,
+                 game_rating_stats_repository: GameRatingStatsRepository = GameRatingStatsRepository(),
+                 activity_repository: ActivityRepository = ActivityRepository(),
+                 cache: Cache = cache) -> None:
         '''
         Initializes the UserReviewRepository with the given SQLAlchemy database instance.
 
@@ -36,8 +59,17 @@ class UserReviewRepository:
         ----------
         db : SQLAlchemy, optional
             The SQLAlchemy database instance (default is the db instance from app).
+        game_rating_stats_repository : GameRatingStatsRepository, optional
+            The rating aggregates repository (default is a new GameRatingStatsRepository instance).
+        activity_repository : ActivityRepository, optional
+            The feed activity repository (default is a new ActivityRepository instance).
+        cache : Cache, optional
+            The response cache invalidated by writes (default is the cache instance from app).
         '''
         self.db = db
+        self.game_rating_stats_repository = game_rating_stats_repository
+        self.activity_repository = activity_repository
+        self.cache = cache
 
     def create(self, data):
         '''
@@ -55,10 +87,67 @@ class UserReviewRepository:
         '''
         user_review = UserReview(**data)
         self.db.session.add(user_review)
+        self.db.session.flush()
+        self.game_rating_stats_repository.apply(user_review.game_id, added=user_review.score)
+        self.activity_repository.record(
+            user_review.user_id, REVIEW, user_review.id, user_review.game_id, user_review.score
+        )
         self.db.session.commit()
+        self.cache.invalidate(tags.USER_REVIEWS, tags.RATINGS)
         return user_review
+
+    def create_many(self, rows):
+        '''
+        Insert several user reviews and update the rating aggregates of the reviewed games,
+        each with one executemany, in a single transaction.
+
+        Parameters:
+        ----------
+        rows : list[dict]
+            The validated user review data. Duplicates must have been filtered out.
+
+        Returns:
+        -------
+        list[int]
+            The IDs of the created user reviews, in the order of rows.
+        '''
+        if not rows:
+            return []
+
+        columns = UserReview.__table__.columns.keys()
+        rows = [{key: value for key, value in row.items() if key in columns} for row in rows]
+
+        # A plain executemany stays one statement on every backend; the IDs are read back by
+        # (user, game) pair, which is unique among the new rows.
+        self.db.session.execute(insert(UserReview), rows)
+        pairs = [(row['user_id'], row['game_id']) for row in rows]
+        created = self.db.session.execute(
+            db.select(UserReview.user_id, UserReview.game_id, UserReview.id).where(
+                UserReview.user_id.in_({user_id for user_id, _ in pairs}),
+                UserReview.game_id.in_({game_id for _, game_id in pairs})
+            )
+        )
+        id_by_pair = {(user_id, game_id): id for user_id, game_id, id in created}
+        ids = [id_by_pair[pair] for pair in pairs]
+
+        scores_by_game = {}
+        for row in rows:
+            scores_by_game.setdefault(row['game_id'], []).append(row['score'])
+        self.game_rating_stats_repository.add_scores(scores_by_game)
+
+        self.activity_repository.record_many([{
+            'actor_id': row['user_id'],
+            'kind': REVIEW,
+            'subject_id': id,
+            'game_id': row['game_id'],
+            'score': row['score']
+        } for row, id in zip(rows, ids)])
+
+        self.db.session.commit()
+        self.cache.invalidate(tags.USER_REVIEWS, tags.RATINGS)
+        return ids
     
-    def get(self, id):
+    def get(self, id, options=()):
         '''
         Retrieve a user review by its ID.
 
@@ -66,24 +155,35 @@ class UserReviewRepository:
         ----------
         id : int
             The ID of the user review to retrieve.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
         UserReview
             The UserReview object with the provided ID.
         '''
-        return UserReview.query.get(id)
+        return self.db.session.get(UserReview, id, options=options)
 
-    def get_all(self):
+    def get_all(self, limit=None, cursor=None, options=()):
         '''
-        Retrieve all user reviews.
+        Retrieve a page of user reviews, newest first.
+
+        Parameters:
+        ----------
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects in the database.
+        Page
+            A page of UserReview objects.
         '''
-        return UserReview.query.all()
+        return self._paginate(UserReview.query.options(*options), limit, cursor)
 
     def update(self, user_review, data):
         '''
@@ -101,9 +201,22 @@ class UserReviewRepository:
         UserReview
             The updated UserReview object.
         '''
+        old_game_id, old_score = user_review.game_id, user_review.score
+
         for key, value in data.items():
             setattr(user_review, key, value)
+
+        if user_review.game_id == old_game_id:
+            self.game_rating_stats_repository.apply(old_game_id, added=user_review.score, removed=old_score)
+        else:
+            self.game_rating_stats_repository.apply(old_game_id, removed=old_score)
+            self.game_rating_stats_repository.apply(user_review.game_id, added=user_review.score)
+
+        if (user_review.game_id, user_review.score) != (old_game_id, old_score):
+            self.activity_repository.update_review(user_review.id, user_review.game_id, user_review.score)
+
         self.db.session.commit()
+        self.cache.invalidate(tags.USER_REVIEWS, tags.RATINGS)
         return user_review
     
     def delete(self, user_review):
@@ -115,41 +228,56 @@ class UserReviewRepository:
         user_review : UserReview
             The user review to delete.
         '''
+        self.activity_repository.remove(REVIEW, user_review.id)
         self.db.session.delete(user_review)
+        self.game_rating_stats_repository.apply(user_review.game_id, removed=user_review.score)
         self.db.session.commit()
+        self.cache.invalidate(tags.USER_REVIEWS, tags.RATINGS)
         return user_review
     
-    def get_by_user_id(self, user_id):
+    def get_by_user_id(self, user_id, limit=None, cursor=None, options=()):
         '''
-        Retrieve all user reviews by user ID.
+        Retrieve a page of user reviews by user ID, newest first.
 
         Parameters:
         ----------
         user_id : int
             The ID of the user whose reviews to retrieve.
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects for the specified user.
+        Page
+            A page of UserReview objects for the specified user.
         '''
-        return UserReview.query.filter_by(user_id=user_id).all()
+        return self._paginate(UserReview.query.options(*options).filter_by(user_id=user_id), limit, cursor)
     
-    def get_by_game_id(self, game_id):
+    def get_by_game_id(self, game_id, limit=None, cursor=None, options=()):
         '''
-        Retrieve all user reviews by game ID.
+        Retrieve a page of user reviews by game ID, newest first.
 
         Parameters:
         ----------
         game_id : int
             The ID of the game whose reviews to retrieve.
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects for the specified game.
+        Page
+            A page of UserReview objects for the specified game.
         '''
-        return UserReview.query.filter_by(game_id=game_id).all()
+        return self._paginate(UserReview.query.options(*options).filter_by(game_id=game_id), limit, cursor)
     
     def get_by_user_game_id(self, user_id, game_id):
         '''
@@ -168,4 +296,53 @@ class UserReviewRepository:
             The UserReview object with the specified user and game IDs.
         '''
         return UserReview.query.filter_by(user_id=user_id, game_id=game_id).first()
-    
+
+    def get_existing_pairs(self, pairs):
+        '''
+        Find which (user ID, game ID) pairs already have a review, with one query.
+
+        Parameters:
+        ----------
+        pairs : list[tuple[int, int]]
+            The (user ID, game ID) pairs to check.
+
+        Returns:
+        -------
+        set[tuple[int, int]]
+            The pairs that already have a review.
+        '''
+        if not pairs:
+            return set()
+
+        user_ids = {user_id for user_id, _ in pairs}
+        game_ids = {game_id for _, game_id in pairs}
+        rows = self.db.session.execute(
+            db.select(UserReview.user_id, UserReview.game_id).where(
+                UserReview.user_id.in_(user_ids),
+                UserReview.game_id.in_(game_ids)
+            )
+        )
+        return {tuple(row) for row in rows} & set(pairs)
+
+    def get_existing_references(self, rows):
+        '''
+        Find which of the users, games and statuses referenced by the given reviews exist.
+
+        Parameters:
+        ----------
+        rows : list[dict]
+            The user review data.
+
+        Returns:
+        -------
+        dict[str, set[int]]
+            The existing IDs for each of the user_id, game_id and status_id fields.
+        '''
+        existing = {}
+        for field, model in (('user_id', User), ('game_id', Game), ('status_id', GameStatus)):
+            ids = {row[field] for row in rows}
+            existing[field] = set(self.db.session.scalars(db.select(model.id).where(model.id.in_(ids)))) if ids else set()
+        return existing
+
+    def _paginate(self, query, limit, cursor):
+        return paginate(query, [UserReview.id], limit, cursor, descending=True)
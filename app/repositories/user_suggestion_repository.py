@@ -0,0 +1,143 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import delete, func, insert, union, update
+from app import db
+from app.models.follower import Follower
+from app.models.user import User
+from app.models.user_backlog import UserBacklog
+from app.models.user_review import UserReview
+from app.models.user_suggestion import UserSuggestion
+
+class UserSuggestionRepository:
+    '''
+    Repository layer for UserSuggestion model.
+
+    This class reads the precomputed suggestions of a user, and gives the suggestions job
+    streaming access to the follow graph and to the games of every user.
+
+    Attributes:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance.
+
+    Methods:
+    -------
+    get_for_user(user_id: int, options: tuple) -> list[UserSuggestion]:
+        Retrieves the suggestions of a user, best first.
+    get_max_user_id() -> int:
+        Retrieves the highest user ID.
+    get_stale_user_ids() -> list[int]:
+        Retrieves the IDs of the users whose suggestions are out of date.
+    get_user_ids_with_following() -> list[int]:
+        Retrieves the IDs of the users who follow someone.
+    stream_follow_edges(batch_size: int) -> Iterator[tuple[int, int]]:
+        Streams (follower_id, user_id) pairs ordered by follower_id.
+    stream_user_games(batch_size: int) -> Iterator[tuple[int, int]]:
+        Streams the distinct (user_id, game_id) pairs of reviews and backlogs, ordered by user_id.
+    replace(user_ids: list[int], rows: list[dict]) -> None:
+        Replaces the suggestions of several users and clears their stale flag.
+    '''
+
+    def __init__(self, db: SQLAlchemy = db) -> None:
+        '''
+        Initializes the UserSuggestionRepository with the given SQLAlchemy database instance.
+
+        Parameters:
+        ----------
+        db : SQLAlchemy, optional
+            The SQLAlchemy database instance (default is the db instance from app).
+        '''
+        self.db = db
+
+    def get_for_user(self, user_id, options=()):
+        '''
+        Get the suggestions of a user, best first, leaving out users followed since they were computed.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        list[UserSuggestion]
+            At most SUGGESTIONS_TOP_K suggestions, read through ix_user_suggestions_user_id_rank.
+        '''
+        followed = db.select(Follower.user_id).where(
+            Follower.follower_id == user_id, Follower.user_id == UserSuggestion.suggested_id
+        ).exists()
+        return UserSuggestion.query.options(*options).filter(
+            UserSuggestion.user_id == user_id, ~followed
+        ).order_by(UserSuggestion.rank).all()
+
+    def get_max_user_id(self):
+        return self.db.session.scalar(db.select(func.max(User.id))) or 0
+
+    def get_stale_user_ids(self):
+        return self.db.session.scalars(
+            db.select(User.id).where(User.suggestions_stale.is_(True)).order_by(User.id)
+        ).all()
+
+    def get_user_ids_with_following(self):
+        return self.db.session.scalars(
+            db.select(Follower.follower_id).distinct().order_by(Follower.follower_id)
+        ).all()
+
+    def stream_follow_edges(self, batch_size=50000):
+        '''
+        Stream every follow edge, ordered by follower through ix_followers_follower_id_user_id.
+
+        Parameters:
+        ----------
+        batch_size : int, optional
+            The number of rows fetched from the cursor at a time.
+
+        Yields:
+        ------
+        tuple[int, int]
+            The follower_id and user_id of each edge.
+        '''
+        statement = db.select(Follower.follower_id, Follower.user_id).order_by(Follower.follower_id, Follower.user_id)
+        yield from self.db.session.execute(statement.execution_options(yield_per=batch_size))
+
+    def stream_user_games(self, batch_size=50000):
+        '''
+        Stream the games each user reviewed or added to their backlog.
+
+        Parameters:
+        ----------
+        batch_size : int, optional
+            The number of rows fetched from the cursor at a time.
+
+        Yields:
+        ------
+        tuple[int, int]
+            The distinct user_id and game_id pairs, ordered by user_id.
+        '''
+        pairs = union(
+            db.select(UserReview.user_id, UserReview.game_id),
+            db.select(UserBacklog.user_id, UserBacklog.game_id)
+        ).subquery()
+        statement = db.select(pairs.c.user_id, pairs.c.game_id).order_by(pairs.c.user_id, pairs.c.game_id)
+        yield from self.db.session.execute(statement.execution_options(yield_per=batch_size))
+
+    def replace(self, user_ids, rows):
+        '''
+        Replace the suggestions of several users, clear their stale flag and commit.
+
+        Parameters:
+        ----------
+        user_ids : list[int]
+            The IDs of the users whose suggestions were recomputed.
+        rows : list[dict]
+            The new suggestions of those users.
+        '''
+        self.db.session.execute(delete(UserSuggestion).where(UserSuggestion.user_id.in_(user_ids)))
+        if rows:
+            self.db.session.execute(insert(UserSuggestion.__table__), rows)
+        self.db.session.execute(
+            update(User).where(User.id.in_(user_ids)).values(suggestions_stale=False)
+                .execution_options(synchronize_session=False)
+        )
+        self.db.session.commit()
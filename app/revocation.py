@@ -0,0 +1,248 @@
+import hashlib
+import heapq
+import math
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+from flask import Flask, current_app, jsonify
+from flask_jwt_extended import JWTManager
+
+"""
+Token Revocation
+
+This module keeps the JTIs of revoked tokens until the tokens expire on their own, and installs
+the token_in_blocklist_loader that makes jwt_required reject them. Every store answers a
+lookup in O(1) and forgets a JTI once its token has expired, so it only ever holds revoked
+tokens that are still alive:
+
+- MemoryRevocationStore: a dictionary private to one process, swept in expiry order.
+- FileRevocationStore: one file per JTI in a directory, shared by every worker on the host.
+- RedisRevocationStore: any server speaking the Redis protocol, which expires the keys itself.
+
+The lookup runs on every authenticated request, so none of them takes a lock or touches the
+database on that path.
+"""
+
+
+class MemoryRevocationStore:
+    '''
+    In-process revocation store.
+
+    JTIs map to the expiry of their token, and a heap ordered by expiry lets revocations and
+    lookups drop the expired ones without scanning. Tokens without an expiry stay revoked
+    for the life of the process.
+    '''
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._expiries: Dict[str, float] = {}
+        self._heap = []
+        self._next_expiry = math.inf
+
+    def add(self, jti: str, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self._sweep(time.time())
+            if expires_at is None:
+                self._expiries[jti] = math.inf
+                return
+            self._expiries[jti] = expires_at
+            heapq.heappush(self._heap, (expires_at, jti))
+            self._next_expiry = self._heap[0][0]
+
+    def __contains__(self, jti: str) -> bool:
+        now = time.time()
+        # Reading an attribute and the dictionary is atomic; only a due sweep takes the lock
+        if self._next_expiry <= now:
+            with self._lock:
+                self._sweep(now)
+        expires_at = self._expiries.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def _sweep(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._heap)
+            if self._expiries.get(jti) == expires_at:
+                del self._expiries[jti]
+        self._next_expiry = self._heap[0][0] if self._heap else math.inf
+
+
+class FileRevocationStore:
+    '''
+    Directory revocation store shared by the worker processes of one host.
+
+    Each revoked JTI is a file named after its hash, holding the expiry of the token (0 for
+    none), so a lookup is a single open that usually fails. Expired files are removed when
+    they are looked up, and revocations sweep the whole directory at most once every
+    sweep_interval seconds.
+
+    Attributes:
+    ----------
+    directory : str
+        The directory holding the revoked JTIs. It is created if it does not exist.
+    sweep_interval : int
+        The minimum number of seconds between two sweeps of the directory.
+    '''
+
+    _ENTRY = struct.Struct('!d')
+
+    def __init__(self, directory: str, sweep_interval: int = 60) -> None:
+        self.directory = directory
+        self.sweep_interval = sweep_interval
+        os.makedirs(directory, exist_ok=True)
+        self._swept_at = 0.0
+
+    def add(self, jti: str, expires_at: Optional[float]) -> None:
+        now = time.time()
+        if now - self._swept_at >= self.sweep_interval:
+            self._swept_at = now
+            self._sweep(now)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(self._ENTRY.pack(expires_at or 0.0))
+            os.replace(tmp_path, self._path(jti))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    def __contains__(self, jti: str) -> bool:
+        path = self._path(jti)
+        expires_at = self._read(path)
+        if expires_at is None:
+            return False
+        if expires_at and expires_at <= time.time():
+            self._remove(path)
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return sum(1 for entry in os.scandir(self.directory) if not entry.name.startswith('.'))
+
+    def _sweep(self, now: float) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith('.'):
+                continue
+            expires_at = self._read(entry.path)
+            if expires_at and expires_at <= now:
+                self._remove(entry.path)
+
+    def _read(self, path: str) -> Optional[float]:
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) != self._ENTRY.size:
+            # Not written by this store; entries are renamed into place whole
+            return None
+        return self._ENTRY.unpack(data)[0]
+
+    def _path(self, jti: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(jti.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class RedisRevocationStore:
+    '''
+    Revocation store for any server speaking the Redis protocol.
+
+    Requires the redis package, installed by requirements-redis.txt, unless a client is passed
+    in. Each revoked JTI is a key set to expire with its token, so the server keeps only live
+    ones.
+
+    Attributes:
+    ----------
+    client : redis.Redis
+        The client the revoked JTIs are read from and written to.
+    '''
+
+    _PREFIX = 'revoked:'
+
+    def __init__(self, url: Optional[str] = None, client=None) -> None:
+        if client is None:
+            try:
+                import redis
+            except ImportError as err:
+                raise RuntimeError('The redis revocation store requires the redis package') from err
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def add(self, jti: str, expires_at: Optional[float]) -> None:
+        if expires_at is None:
+            self.client.set(self._PREFIX + jti, b'1')
+        elif expires_at > time.time():
+            self.client.set(self._PREFIX + jti, b'1', exat=math.ceil(expires_at))
+
+    def __contains__(self, jti: str) -> bool:
+        return bool(self.client.exists(self._PREFIX + jti))
+
+
+def create_store(config):
+    '''
+    Build the revocation store selected by REVOCATION_BACKEND.
+
+    Parameters:
+    ----------
+    config : Config
+        The application configuration.
+
+    Returns:
+    -------
+    MemoryRevocationStore | FileRevocationStore | RedisRevocationStore
+        The configured store.
+    '''
+    if config['REVOCATION_BACKEND'] == 'memory':
+        return MemoryRevocationStore()
+    if config['REVOCATION_BACKEND'] == 'file':
+        return FileRevocationStore(config['REVOCATION_DIR'], config['REVOCATION_SWEEP_INTERVAL'])
+    if config['REVOCATION_BACKEND'] == 'redis':
+        return RedisRevocationStore(config['REVOCATION_REDIS_URL'])
+    raise ValueError(f"Unknown revocation backend: {config['REVOCATION_BACKEND']}")
+
+
+class TokenBlocklist:
+    '''
+    Flask extension revoking tokens by JTI until they expire.
+
+    Methods:
+    -------
+    revoke(token: dict) -> None:
+        Revokes a decoded token.
+    is_revoked(token: dict) -> bool:
+        Tells whether a decoded token has been revoked.
+    '''
+
+    def init_app(self, app: Flask, jwt: JWTManager) -> None:
+        app.extensions['token_blocklist'] = create_store(app.config)
+
+        @jwt.token_in_blocklist_loader
+        def token_revoked(jwt_header, jwt_data):
+            return self.is_revoked(jwt_data)
+
+        @jwt.revoked_token_loader
+        def revoked_token(jwt_header, jwt_data):
+            # Same answer as a token revoked by a password change
+            return jsonify({'message': 'Token has been revoked'}), 401
+
+    @property
+    def store(self):
+        return current_app.extensions['token_blocklist']
+
+    def revoke(self, token: dict) -> None:
+        self.store.add(token['jti'], token.get('exp'))
+
+    def is_revoked(self, token: dict) -> bool:
+        return token['jti'] in self.store
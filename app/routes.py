@@ -1,4 +1,9 @@
-from flask import Blueprint
+import math
+from flask import Blueprint, jsonify
+from app import limiter
+from app.pagination import InvalidCursorError
+from app.passwords import PasswordHasherBusyError
+from app.rate_limit import RateLimitExceededError
 from app.controllers.auth_controller import auth
 from app.controllers.developer_controller import developers
 from app.controllers.follower_controller import followers
@@ -10,6 +15,7 @@ from app.controllers.platform_controller import platforms
 from app.controllers.publisher_controller import publishers
 from app.controllers.user_controller import users
 from app.controllers.user_backlog_controller import user_backlogs
+from app.controllers.user_gamelist_controller import user_gamelists
 from app.controllers.user_review_controller import user_reviews
 
 
@@ -28,4 +34,25 @@ api.register_blueprint(platforms, url_prefix='/platforms')
 api.register_blueprint(publishers, url_prefix='/publishers')
 api.register_blueprint(users, url_prefix='/users')
 api.register_blueprint(user_backlogs, url_prefix='/user_backlogs')
-api.register_blueprint(user_reviews, url_prefix='/user_reviews')
\ No newline at end of file
+api.register_blueprint(user_gamelists, url_prefix='/user_gamelists')
+api.register_blueprint(user_reviews, url_prefix='/user_reviews')
+
+
+# Rate limit shared by every route, on top of the policies of the routes themselves
+@api.before_request
+def limit_requests():
+    limiter.check('api')
+
+
+# Error handlers shared by every blueprint
+@api.errorhandler(InvalidCursorError)
+def handle_invalid_cursor(err):
+    return jsonify({'cursor': ['Invalid cursor.']}), 400
+
+@api.errorhandler(PasswordHasherBusyError)
+def handle_password_hasher_busy(err):
+    return jsonify({'message': 'Too many login attempts in progress, try again shortly.'}), 503, {'Retry-After': '1'}
+
+@api.errorhandler(RateLimitExceededError)
+def handle_rate_limit_exceeded(err):
+    return jsonify({'message': 'Too many requests, try again later.'}), 429, {'Retry-After': str(math.ceil(err.retry_after))}
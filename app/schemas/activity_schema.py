@@ -0,0 +1,16 @@
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
+from app.schemas.game_schema import GameSchema
+from app.schemas.user_schema import UserSchema
+
+
+class ActivitySchema(BaseSchema):
+    '''
+    Schema for Activity model.
+    '''
+    id = fields.Integer(dump_only=True)
+    kind = fields.Str(dump_only=True)
+    actor = fields.Nested(lambda: UserSchema(only=('id', 'username')))
+    game = fields.Nested(lambda: GameSchema(only=('id', 'title')))
+    score = fields.Integer(dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
@@ -1,11 +1,15 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import fields, validate
+from app.schemas.base_schema import BaseSchema
 
-class LoginSchema(Schema):
+class LoginSchema(BaseSchema):
     username = fields.Str(required=True)
     password = fields.Str(required=True)
 
-class AuthSchema(Schema):
+class AuthSchema(BaseSchema):
     access_token = fields.Str()
     refresh_token = fields.Str()
 
 
+
+class LogoutSchema(BaseSchema):
+    refresh_token = fields.Str()
@@ -0,0 +1,25 @@
+import time
+
+from flask import g, has_request_context
+from marshmallow import Schema
+
+
+class BaseSchema(Schema):
+    '''
+    Base class of the application schemas.
+
+    Times the outermost dump of the requests sampled by app.metrics, nested schemas included,
+    into their serialization time. Outside sampled requests it dumps as marshmallow does.
+    '''
+
+    def dump(self, obj, *, many=None):
+        if not has_request_context() or not g.get('metrics_sampled') or g.metrics_dump_depth:
+            return super().dump(obj, many=many)
+
+        g.metrics_dump_depth += 1
+        start = time.perf_counter()
+        try:
+            return super().dump(obj, many=many)
+        finally:
+            g.metrics_serialization += time.perf_counter() - start
+            g.metrics_dump_depth -= 1
@@ -1,5 +1,6 @@
-from marshmallow import Schema, fields
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
 
-class DeveloperSchema(Schema):
+class DeveloperSchema(BaseSchema):
     id = fields.Integer(dump_only=True)
     name = fields.Str(required=True)
\ No newline at end of file
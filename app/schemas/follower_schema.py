@@ -1,6 +1,7 @@
-from marshmallow import Schema, fields
+from marshmallow import EXCLUDE, ValidationError, fields, post_load
+from app.schemas.base_schema import BaseSchema
 
-class FollowerSchema(Schema):
+class FollowerSchema(BaseSchema):
     '''
     Schema for Follower model.
     '''
@@ -14,9 +15,36 @@ class FollowerSchema(Schema):
         return obj.follower.username
     
 
-class CreateOrDeleteFollowerSchema(Schema):
+class CreateOrDeleteFollowerSchema(BaseSchema):
     '''
     Schema for creating a Follower object.
     '''
     user_id = fields.Integer(required=True)
-    follower_id = fields.Integer(required=True)
\ No newline at end of file
+    follower_id = fields.Integer(required=True)
+
+
+class RelationshipArgsSchema(BaseSchema):
+    '''
+    Schema for the query string of the relationship endpoint.
+    '''
+    class Meta:
+        unknown = EXCLUDE
+
+    ids = fields.Str(required=True)
+
+    @post_load
+    def split_ids(self, data, **kwargs):
+        try:
+            data['ids'] = list(dict.fromkeys(int(id) for id in data['ids'].split(',') if id.strip()))
+        except ValueError:
+            raise ValidationError('Must be a comma-separated list of user IDs.', 'ids')
+        return data
+
+
+class RelationshipSchema(BaseSchema):
+    '''
+    Schema for the relationship between the authenticated user and another user.
+    '''
+    id = fields.Integer(dump_only=True)
+    following = fields.Boolean(dump_only=True)
+    followed_by = fields.Boolean(dump_only=True)
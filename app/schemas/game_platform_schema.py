@@ -1,12 +1,58 @@
-from marshmallow import Schema, fields
-from app.schemas.game_schema import GameSchema
-from app.schemas.platform_schema import PlatformSchema
+from marshmallow import EXCLUDE, ValidationError, fields, post_load, validate
+from app.schemas.base_schema import BaseSchema
 
-class GamePlatformSchema(Schema):
-    game = fields.Nested(lambda: GameSchema(only=('id', 'title')))
-    platform = fields.Nested(lambda: PlatformSchema(only=('id', 'name')))
+class PlatformLinkSchema(BaseSchema):
+    '''
+    Schema for a platform of a game.
+    '''
+    id = fields.Integer(dump_only=True)
+    name = fields.Str(dump_only=True)
 
 
-class CreateOrDeleteGamePlatform(Schema):
-    game_id = fields.Integer()
-    platform_id = fields.Integer()
\ No newline at end of file
+class GamePlatformsSchema(BaseSchema):
+    '''
+    Schema for the platforms of one game in a batch lookup.
+    '''
+    game_id = fields.Integer(dump_only=True)
+    platforms = fields.List(fields.Nested(PlatformLinkSchema), dump_only=True)
+
+
+class PlatformGameSchema(BaseSchema):
+    '''
+    Schema for a game of a platform.
+    '''
+    id = fields.Integer(attribute='game_id', dump_only=True)
+    title = fields.Str(dump_only=True)
+
+
+class GameIdsArgsSchema(BaseSchema):
+    '''
+    Schema for the query string of the batch platforms lookup.
+    '''
+    class Meta:
+        unknown = EXCLUDE
+
+    ids = fields.Str(required=True)
+
+    @post_load
+    def split_ids(self, data, **kwargs):
+        try:
+            data['ids'] = list(dict.fromkeys(int(id) for id in data['ids'].split(',') if id.strip()))
+        except ValueError:
+            raise ValidationError('Must be a comma-separated list of game IDs.', 'ids')
+        return data
+
+
+class CreateOrDeleteGamePlatform(BaseSchema):
+    '''
+    Schema for one game-platform link.
+    '''
+    game_id = fields.Integer(required=True)
+    platform_id = fields.Integer(required=True)
+
+
+class GamePlatformLinksSchema(BaseSchema):
+    '''
+    Schema for the body of the bulk link and unlink endpoints.
+    '''
+    links = fields.List(fields.Nested(CreateOrDeleteGamePlatform), required=True, validate=validate.Length(min=1))
@@ -1,6 +1,13 @@
-from marshmallow import Schema, fields
+from marshmallow import EXCLUDE, ValidationError, fields, validate, validates_schema
+from app.schemas.base_schema import BaseSchema
+from app import reference_cache
+from app.models.developer import Developer
+from app.models.genre import Genre
+from app.models.publisher import Publisher
+from app.models.game_rating_stats import SCORES
+from app.schemas.pagination_schema import PageArgsSchema
 
-class GameSchema(Schema):
+class GameSchema(BaseSchema):
     '''
     Schema for Game model.
     '''
@@ -14,16 +21,16 @@ class GameSchema(Schema):
     cover_image = fields.Str()
 
     def get_genre(self, obj):
-        return obj.genre.name
+        return reference_cache.name(Genre, obj.genre_id)
     
     def get_developer(self, obj):
-        return obj.developer.name
+        return reference_cache.name(Developer, obj.developer_id)
     
     def get_publisher(self, obj):
-        return obj.publisher.name
+        return reference_cache.name(Publisher, obj.publisher_id)
 
 
-class CreateOrDeleteGameSchema(Schema):
+class CreateOrDeleteGameSchema(BaseSchema):
     '''
     Schema for creating or deleting a Game object.
     '''
@@ -34,4 +41,108 @@ class CreateOrDeleteGameSchema(Schema):
     genre_id = fields.Integer(required=True)
     developer_id = fields.Integer(required=True)
     publisher_id = fields.Integer(required=True)
-    cover_image = fields.Str()
\ No newline at end of file
+    cover_image = fields.Str()
+
+
+class CatalogGameSchema(BaseSchema):
+    '''
+    Schema for a game record of a catalog import, referencing genres, developers,
+    publishers and platforms by name.
+    '''
+    title = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+    description = fields.Str(required=True)
+    release_date = fields.Date(required=True)
+    genre = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+    developer = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+    publisher = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+    platforms = fields.List(fields.Str(validate=validate.Length(min=1, max=255)), load_default=list)
+    cover_image = fields.Str(allow_none=True, load_default=None)
+
+    class Meta:
+        unknown = EXCLUDE
+
+
+class GameRatingSchema(BaseSchema):
+    '''
+    Schema for GameRatingStats model.
+    '''
+    average = fields.Float(dump_only=True)
+    count = fields.Integer(attribute='score_count', dump_only=True)
+    histogram = fields.Dict(keys=fields.Str(), values=fields.Integer(), dump_only=True)
+
+
+class GameDetailSchema(GameSchema):
+    '''
+    Schema for a single Game, including its rating aggregates.
+    '''
+    rating = fields.Method("get_rating")
+
+    def get_rating(self, obj):
+        if obj.rating_stats is None:
+            return {'average': None, 'count': 0, 'histogram': {str(score): 0 for score in SCORES}}
+        return GameRatingSchema().dump(obj.rating_stats)
+
+
+class TopRatedGameSchema(GameRatingSchema):
+    '''
+    Schema for an entry of the top-rated games ranking.
+    '''
+    game = fields.Nested(GameSchema)
+
+
+class GameBrowseArgsSchema(PageArgsSchema):
+    '''
+    Schema for the query string of the game listing, with its browse filters.
+    '''
+    genre = fields.Integer()
+    platform = fields.Integer()
+    developer = fields.Integer()
+    publisher = fields.Integer()
+    year_from = fields.Integer(validate=validate.Range(min=1, max=9998))
+    year_to = fields.Integer(validate=validate.Range(min=1, max=9998))
+    sort = fields.Str(load_default='title', validate=validate.OneOf(['title', 'release_date', '-release_date']))
+
+    @validates_schema
+    def validate_years(self, data, **kwargs):
+        if data.get('year_from') is not None and data.get('year_to') is not None and data['year_from'] > data['year_to']:
+            raise ValidationError('Must not be before year_from.', 'year_to')
+
+
+class TopRatedArgsSchema(PageArgsSchema):
+    '''
+    Schema for the query string of the top-rated games endpoint.
+    '''
+    min_reviews = fields.Integer(load_default=1, validate=validate.Range(min=1))
+
+
+class SimilarGameSchema(BaseSchema):
+    '''
+    Schema for a precomputed neighbour of a game.
+    '''
+    game = fields.Nested(GameSchema, attribute='similar_game')
+    score = fields.Float(dump_only=True)
+
+
+class RecommendedGameSchema(BaseSchema):
+    '''
+    Schema for a game recommended to a user.
+    '''
+    game = fields.Nested(GameSchema)
+    score = fields.Float(dump_only=True)
+
+
+class RecommendationArgsSchema(BaseSchema):
+    '''
+    Schema for the query string of the recommendations endpoint.
+    '''
+    class Meta:
+        unknown = EXCLUDE
+
+    limit = fields.Integer(load_default=20, validate=validate.Range(min=1, max=100))
+
+
+class GameSearchArgsSchema(PageArgsSchema):
+    '''
+    Schema for the query string of the game search endpoint.
+    '''
+    q = fields.Str(required=True, validate=validate.Length(min=1, max=255))
@@ -0,0 +1,12 @@
+from marshmallow import fields, validate, EXCLUDE
+from app.schemas.base_schema import BaseSchema
+
+class PageArgsSchema(BaseSchema):
+    '''
+    Schema for the query string of paginated list endpoints.
+    '''
+    class Meta:
+        unknown = EXCLUDE
+
+    limit = fields.Integer(validate=validate.Range(min=1))
+    cursor = fields.Str()
@@ -1,6 +1,7 @@
-from marshmallow import Schema, fields
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
 
-class PlatformSchema(Schema):
+class PlatformSchema(BaseSchema):
     '''
     Schema for Platform model.
     '''
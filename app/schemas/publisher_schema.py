@@ -1,6 +1,7 @@
-from marshmallow import Schema, fields
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
 
-class PublisherSchema(Schema):
+class PublisherSchema(BaseSchema):
     '''
     Schema for Publisher model.
     '''
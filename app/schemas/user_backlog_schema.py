@@ -1,8 +1,9 @@
-from marshmallow import Schema, fields
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
 from app.schemas.game_schema import GameSchema
 
 
-class UserBacklogSchema(Schema):
+class UserBacklogSchema(BaseSchema):
     '''
     Schema for UserBacklog model.
     '''
@@ -13,7 +14,7 @@ class UserBacklogSchema(Schema):
     
 
 
-class CreateOrDeleteUserBacklogSchema(Schema):
+class CreateOrDeleteUserBacklogSchema(BaseSchema):
     '''
     Schema for creating or deleting a UserBacklog object.
     '''
@@ -0,0 +1,50 @@
+from marshmallow import fields, validate
+from app.schemas.base_schema import BaseSchema
+
+class UserGameListSchema(BaseSchema):
+    '''
+    Schema for UserGameList model.
+    '''
+    id = fields.Integer(dump_only=True)
+    user_id = fields.Integer(dump_only=True)
+    name = fields.Str(dump_only=True)
+    games_count = fields.Integer(dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+
+
+class CreateOrUpdateUserGameListSchema(BaseSchema):
+    '''
+    Schema for creating or renaming a UserGameList object.
+    '''
+    name = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+
+
+class GameListEntrySchema(BaseSchema):
+    '''
+    Schema for a game in a list.
+    '''
+    id = fields.Integer(attribute='game_id', dump_only=True)
+    title = fields.Str(dump_only=True)
+    position = fields.Integer(dump_only=True)
+
+
+class GameListGamesSchema(BaseSchema):
+    '''
+    Schema for the body of the bulk add and remove endpoints.
+    '''
+    game_ids = fields.List(fields.Integer(), required=True, validate=validate.Length(min=1))
+
+
+class GameListPositionSchema(BaseSchema):
+    '''
+    Schema for the new position of one game in a list.
+    '''
+    game_id = fields.Integer(required=True)
+    position = fields.Integer(required=True, validate=validate.Range(min=0))
+
+
+class GameListPositionsSchema(BaseSchema):
+    '''
+    Schema for the body of the reorder endpoint.
+    '''
+    positions = fields.List(fields.Nested(GameListPositionSchema), required=True, validate=validate.Length(min=1))
@@ -1,18 +1,19 @@
-from marshmallow import Schema, fields
+from marshmallow import fields, validate
+from app.schemas.base_schema import BaseSchema
 
-class UserReviewSchema(Schema):
+class UserReviewSchema(BaseSchema):
     '''
     Schema for UserReview model.
     '''
     id = fields.Integer(dump_only=True)
     game_id = fields.Integer(required=True)
     user_id = fields.Integer(required=True)
-    score = fields.Integer(required=True)
+    score = fields.Integer(required=True, validate=validate.Range(min=1, max=10))
     status_id = fields.Integer(required=True)
     mastered = fields.Boolean()
     review = fields.Str(required=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
     user = fields.Nested('UserSchema', only=('id', 'username'))
-    game = fields.Nested('GameSchema', only=('id', 'name'))
+    game = fields.Nested('GameSchema', only=('id', 'title'))
     status = fields.Nested('GameStatusSchema', only=('id', 'name'))
\ No newline at end of file
@@ -1,7 +1,8 @@
-from marshmallow import Schema, fields
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
 
 
-class UserSchema(Schema):
+class UserSchema(BaseSchema):
     id = fields.Integer(dump_only=True)
     username = fields.Str(required=True)
     email = fields.Email(required=True)
@@ -11,7 +12,7 @@ class UserSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
 
-class CreateOrDeleteUserSchema(Schema):
+class CreateOrDeleteUserSchema(BaseSchema):
     username = fields.Str(required=True)
     email = fields.Email(required=True)
     password = fields.Str(required=True, load_only=True)
@@ -21,7 +22,13 @@ class CreateOrDeleteUserSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
 
-class ChangeUserPasswordSchema(Schema):
+class ChangeUserPasswordSchema(BaseSchema):
     old_password = fields.Str(required=True)
     new_password = fields.Str(required=True)
-    confirm_password = fields.Str(required=True)
\ No newline at end of file
+    confirm_password = fields.Str(required=True)
+
+
+class UserStatsSchema(BaseSchema):
+    id = fields.Integer(dump_only=True)
+    followers_count = fields.Integer(dump_only=True)
+    following_count = fields.Integer(dump_only=True)
@@ -0,0 +1,13 @@
+from marshmallow import fields
+from app.schemas.base_schema import BaseSchema
+from app.schemas.user_schema import UserSchema
+
+
+class UserSuggestionSchema(BaseSchema):
+    '''
+    Schema for UserSuggestion model.
+    '''
+    user = fields.Nested(lambda: UserSchema(only=('id', 'username')), attribute='suggested')
+    score = fields.Float(dump_only=True)
+    mutual_count = fields.Integer(dump_only=True)
+    shared_games = fields.Integer(dump_only=True)
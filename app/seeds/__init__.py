@@ -4,4 +4,5 @@ from app.seeds.game_status_seeds import seed_game_statuses
 from app.seeds.genre_seeds import seed_genres
 from app.seeds.platform_seeds import seed_platforms
 from app.seeds.publisher_seeds import seed_publishers
+from app.seeds.synthetic_seeds import seed_synthetic
 from app.seeds.user_seeds import seed_users
\ No newline at end of file
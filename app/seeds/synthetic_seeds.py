@@ -0,0 +1,198 @@
+import bisect
+import itertools
+import random
+import secrets
+from datetime import date, timedelta
+from app.models.developer import Developer
+from app.models.genre import Genre
+from app.models.platform import Platform
+from app.models.publisher import Publisher
+from app.repositories.catalog_repository import CatalogRepository
+from app.repositories.follower_repository import FollowerRepository
+from app.repositories.game_status_repository import GameStatusRepository
+from app.repositories.user_repository import UserRepository
+from app.repositories.user_review_repository import UserReviewRepository
+from app.seeds.genre_seeds import seed_genres
+from app.seeds.game_status_seeds import seed_game_statuses
+from app.seeds.platform_seeds import seed_platforms
+
+# Zipf exponents: how strongly follows concentrate on popular users and reviews on hit games
+FOLLOW_EXPONENT = 1.1
+GAME_EXPONENT = 1.0
+STUDIO_EXPONENT = 0.8
+
+# Password of every synthetic user, hashed once
+SYNTHETIC_PASSWORD = 'synthetic'
+
+WORDS = (
+    'shadow', 'crown', 'iron', 'echo', 'legend', 'star', 'quest', 'hollow', 'ember', 'frontier',
+    'night', 'storm', 'rogue', 'tide', 'relic', 'ashen', 'neon', 'wild', 'last', 'dawn'
+)
+
+
+class _Zipf:
+    '''
+    Sampler over a sequence whose i-th item is drawn with weight 1 / (i + 1) ** exponent.
+    '''
+
+    def __init__(self, items, exponent, rng) -> None:
+        self.items = list(items)
+        rng.shuffle(self.items)
+        self.cumulative = list(itertools.accumulate(1 / rank ** exponent for rank in range(1, len(self.items) + 1)))
+        self.rng = rng
+
+    def sample(self):
+        return self.items[bisect.bisect(self.cumulative, self.rng.random() * self.cumulative[-1])]
+
+    def distinct(self, count, exclude=None):
+        count = min(count, len(self.items) - (exclude is not None))
+        chosen = set()
+        for _ in range(count * 20):
+            if len(chosen) == count:
+                break
+            item = self.sample()
+            if item != exclude:
+                chosen.add(item)
+        return chosen
+
+
+def seed_synthetic(users,
+                   games,
+                   reviews_per_user,
+                   follows_per_user,
+                   seed=None,
+                   batch_size=5000,
+                   catalog_repository: CatalogRepository = CatalogRepository(),
+                   user_repository: UserRepository = UserRepository(),
+                   follower_repository: FollowerRepository = FollowerRepository(),
+                   user_review_repository: UserReviewRepository = UserReviewRepository(),
+                   game_status_repository: GameStatusRepository = GameStatusRepository()):
+    '''
+    Bulk-generate a large, skewed dataset for performance work.
+
+    Developers and publishers release games with a Zipf-distributed frequency, follows go to
+    users drawn from a power law (a few users gather most followers), and reviews concentrate
+    on a Zipf-distributed set of hit games. Rows are written in batch_size chunks through the
+    bulk repository methods, and names get a random run tag so the command can be repeated.
+
+    Parameters:
+    ----------
+    users : int
+        The number of users to create.
+    games : int
+        The number of games to create.
+    reviews_per_user : int
+        The number of distinct games each user reviews.
+    follows_per_user : int
+        The number of distinct users each user follows.
+    seed : int, optional
+        The random seed, for a repeatable distribution.
+    batch_size : int, optional
+        The number of rows written per statement and commit.
+
+    Returns:
+    -------
+    dict
+        The number of rows created per table.
+    '''
+    rng = random.Random(seed)
+    tag = secrets.token_hex(3)
+
+    if not catalog_repository.get_name_map(Genre):
+        seed_genres()
+    if not catalog_repository.get_name_map(Platform):
+        seed_platforms()
+    if not game_status_repository.get_all():
+        seed_game_statuses()
+
+    genre_ids = list(catalog_repository.get_name_map(Genre).values())
+    platform_ids = list(catalog_repository.get_name_map(Platform).values())
+    status_ids = [status.id for status in game_status_repository.get_all()]
+
+    # Studios: a long tail of developers and publishers with a few prolific ones
+    developer_ids = list(catalog_repository.create_names(
+        Developer, {f'Synthetic Studio {tag}-{i}' for i in range(max(games // 25, 1))}
+    ).values())
+    publisher_ids = list(catalog_repository.create_names(
+        Publisher, {f'Synthetic Publishing {tag}-{i}' for i in range(max(games // 100, 1))}
+    ).values())
+    catalog_repository.commit({Developer, Publisher})
+    developers = _Zipf(developer_ids, STUDIO_EXPONENT, rng)
+    publishers = _Zipf(publisher_ids, STUDIO_EXPONENT, rng)
+
+    # Games, with a hidden quality that centres their review scores
+    game_ids, quality, links = [], {}, 0
+    for start in range(0, games, batch_size):
+        rows, platforms = [], {}
+        for i in range(start, min(start + batch_size, games)):
+            title = f'{" ".join(rng.sample(WORDS, 2)).title()} {tag}-{i}'
+            rows.append({
+                'title': title,
+                'description': f'Synthetic game {i} of run {tag}.',
+                'release_date': date(1990, 1, 1) + timedelta(days=rng.randrange(365 * 35)),
+                'genre_id': rng.choice(genre_ids),
+                'developer_id': developers.sample(),
+                'publisher_id': publishers.sample(),
+                'cover_image': None
+            })
+            platforms[title] = rng.sample(platform_ids, rng.randint(1, min(3, len(platform_ids))))
+
+        ids, _ = catalog_repository.upsert_games(rows)
+        links += catalog_repository.link_platforms({
+            (ids[title], platform_id) for title, chosen in platforms.items() for platform_id in chosen
+        })
+        catalog_repository.commit()
+        for id in ids.values():
+            game_ids.append(id)
+            quality[id] = rng.uniform(4, 9)
+
+    # Users, sharing one password hash
+    password = user_repository.hash_password(SYNTHETIC_PASSWORD)
+    user_ids = []
+    for start in range(0, users, batch_size):
+        user_ids += user_repository.create_many([{
+            'username': f'synthetic_{tag}_{i}',
+            'email': f'synthetic_{tag}_{i}@example.com',
+            'password': password,
+            'bio': None
+        } for i in range(start, min(start + batch_size, users))])
+
+    # Follows, drawn from a power law over users
+    popular_users = _Zipf(user_ids, FOLLOW_EXPONENT, rng)
+    follows = 0
+    for chunk in _chunks(user_ids, max(batch_size // max(follows_per_user, 1), 1)):
+        rows = [
+            {'user_id': followed, 'follower_id': follower}
+            for follower in chunk for followed in popular_users.distinct(follows_per_user, exclude=follower)
+        ]
+        follower_repository.create_many(rows)
+        follows += len(rows)
+
+    # Reviews, concentrated on hit games
+    hit_games = _Zipf(game_ids, GAME_EXPONENT, rng)
+    reviews = 0
+    for chunk in _chunks(user_ids, max(batch_size // max(reviews_per_user, 1), 1)):
+        rows = [{
+            'user_id': user_id,
+            'game_id': game_id,
+            'score': min(max(round(rng.gauss(quality[game_id], 1.5)), 1), 10),
+            'status_id': rng.choice(status_ids),
+            'review': 'Synthetic review.'
+        } for user_id in chunk for game_id in hit_games.distinct(reviews_per_user)]
+        user_review_repository.create_many(rows)
+        reviews += len(rows)
+
+    counts = {
+        'users': len(user_ids),
+        'games': len(game_ids),
+        'game_platforms': links,
+        'followers': follows,
+        'user_reviews': reviews
+    }
+    print(f'Synthetic data seeded (run {tag}): {counts}')
+    return counts
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
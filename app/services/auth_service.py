@@ -1,5 +1,8 @@
+from app import blocklist
 from app.repositories.user_repository import UserRepository
-from flask_jwt_extended import create_access_token, create_refresh_token
+from app.revocation import TokenBlocklist
+from app.identity import identity_claims
+from flask_jwt_extended import create_access_token, create_refresh_token, decode_token
 
 class AuthService:
     """
@@ -14,28 +17,36 @@ class AuthService:
         Initializes the AuthService with a UserRepository instance.
 
     login(username: str, password: str) -> dict:
-        Logs in a user.
+        Logs in a user, upgrading their password hash if it was made with another cost.
         - Parameters:
             - username (str): The username of the user.
             - password (str): The password of the user.
         - Returns:
             - dict: A message indicating whether the login was successful.
 
-    refresh(current_user_id: int) -> dict:
+    refresh(current_user: Identity) -> dict:
         Refreshes the access token for the current user.
         - Parameters:
-            - current_user_id (int): The ID of the current user.
+            - current_user (Identity): The confirmed identity of the refresh token.
         - Returns:
             - dict: A new access token.
 
-    logout() -> dict:
-        Logs out the current user.
+    logout(token: dict, refresh_token: str = None) -> dict:
+        Logs out the current user by revoking their token, and their refresh token if given.
+        - Parameters:
+            - token (dict): The decoded token of the request.
+            - refresh_token (str): The encoded refresh token of the same user.
         - Returns:
-            - dict: A message indicating whether the logout was successful.
+            - dict: A message indicating whether the logout was successful, or None if the refresh
+              token belongs to another user.
     """
     
-    def __init__(self):
-        self.user_repository = UserRepository()
+    def __init__(
+        self,
+        user_repository: UserRepository = UserRepository(),
+        blocklist: TokenBlocklist = blocklist):
+        self.user_repository = user_repository
+        self.blocklist = blocklist
 
 
     def login(self, username, password):
@@ -44,8 +55,10 @@ class AuthService:
 
         # Check password
         if user and self.user_repository.check_password(user.password, password):
-            access_token = create_access_token(identity=user.id, fresh=True)
-            refresh_token = create_refresh_token(identity=user.id)
+            self.user_repository.upgrade_password(user, password)
+            claims = identity_claims(user)
+            access_token = create_access_token(identity=user.id, fresh=True, additional_claims=claims)
+            refresh_token = create_refresh_token(identity=user.id, additional_claims=claims)
             
             return {
                 'access_token': access_token,
@@ -54,10 +67,18 @@ class AuthService:
         
         return {'message': 'Invalid credentials'}
     
-    def refresh(self, current_user_id):
-        new_access_token = create_access_token(identity=current_user_id, fresh=False)
+    def refresh(self, current_user):
+        new_access_token = create_access_token(identity=current_user.id, fresh=False, additional_claims=identity_claims(current_user))
         return {'access_token': new_access_token}
 
-    def logout(self):
-        # Placeholder for logout functionality
-        return {'message': 'Logout successful!'}
\ No newline at end of file
+    def logout(self, token, refresh_token=None):
+        if refresh_token:
+            # Expired or forged tokens raise and are answered like any invalid token
+            refresh = decode_token(refresh_token)
+            if refresh['type'] != 'refresh' or refresh['sub'] != token['sub']:
+                return None
+            self.blocklist.revoke(refresh)
+
+        self.blocklist.revoke(token)
+
+        return {'message': 'Logout successful!'}
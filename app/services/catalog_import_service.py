@@ -0,0 +1,278 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+from marshmallow import ValidationError
+from app.models.developer import Developer
+from app.models.genre import Genre
+from app.models.platform import Platform
+from app.models.publisher import Publisher
+from app.repositories.catalog_repository import CatalogRepository
+from app.schemas.game_schema import CatalogGameSchema
+
+# Record field resolved against each reference table
+REFERENCE_FIELDS = {
+    'genre': Genre,
+    'developer': Developer,
+    'publisher': Publisher
+}
+
+# Formats recognised from the file extension
+FORMATS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv'
+}
+
+# Separator of the platform names in a CSV column
+CSV_PLATFORM_SEPARATOR = '|'
+
+
+class ImportResult:
+    '''
+    Counters of a catalog import.
+
+    Attributes:
+    ----------
+    rows : int
+        The number of records read.
+    created : int
+        The number of games inserted.
+    updated : int
+        The number of existing games updated.
+    invalid : int
+        The number of records rejected.
+    links : int
+        The number of game_platforms links inserted.
+    errors : list[tuple[int, dict]]
+        The line number and validation messages of the first rejected records.
+    seconds : float
+        The time spent importing.
+    '''
+
+    # Maximum number of rejected records whose messages are kept
+    MAX_ERRORS = 20
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.invalid = 0
+        self.links = 0
+        self.errors = []
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def reject(self, line, messages):
+        self.invalid += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append((line, messages))
+
+
+class CatalogImportService:
+    """
+    Service layer for bulk catalog imports.
+
+    This class streams JSON Lines or CSV catalog files in fixed-size chunks, so memory stays
+    constant however large the file is. Genre, developer, publisher and platform names are
+    resolved to IDs through in-memory maps (missing names are created), and each chunk is
+    upserted and linked to its platforms with a handful of set-based statements and committed
+    once.
+
+    Attributes:
+    ----------
+    catalog_repository : CatalogRepository
+        The repository instance used to write the catalog.
+
+    Methods:
+    -------
+    import_file(path: str, format: str, batch_size: int, on_batch: Callable) -> ImportResult:
+        Imports every record of a catalog file.
+    import_records(records: Iterable, batch_size: int, on_batch: Callable) -> ImportResult:
+        Imports (line, record) pairs.
+    """
+
+    def __init__(self, catalog_repository: CatalogRepository = CatalogRepository()) -> None:
+        """
+        Initializes the CatalogImportService with the given CatalogRepository instance.
+
+        Parameters:
+        ----------
+        catalog_repository : CatalogRepository, optional
+            The repository instance used to write the catalog (default is a new CatalogRepository instance).
+        """
+        self.catalog_repository = catalog_repository
+
+    def import_file(self, path, format=None, batch_size=1000, on_batch=None):
+        """
+        Import every record of a catalog file.
+
+        Parameters:
+        ----------
+        path : str
+            The path of the file.
+        format : str, optional
+            'jsonl' or 'csv' (default is inferred from the file extension).
+        batch_size : int, optional
+            The number of records written and committed together.
+        on_batch : Callable, optional
+            Called with the ImportResult after every committed chunk.
+
+        Returns:
+        -------
+        ImportResult
+            The counters of the import.
+        """
+        format = format or FORMATS.get(os.path.splitext(path)[1].lower())
+        if format not in ('jsonl', 'csv'):
+            raise ValueError(f'Cannot infer the format of {path}, pass jsonl or csv explicitly.')
+
+        with open(path, newline='', encoding='utf-8') as file:
+            records = read_jsonl(file) if format == 'jsonl' else read_csv(file)
+            return self.import_records(records, batch_size, on_batch)
+
+    def import_records(self, records, batch_size=1000, on_batch=None):
+        """
+        Import (line, record) pairs, one chunk of batch_size records at a time.
+
+        Parameters:
+        ----------
+        records : Iterable[tuple[int, dict]]
+            The line number and raw fields of each record. A None record marks a line that
+            could not be parsed.
+        batch_size : int, optional
+            The number of records written and committed together.
+        on_batch : Callable, optional
+            Called with the ImportResult after every committed chunk.
+
+        Returns:
+        -------
+        ImportResult
+            The counters of the import.
+        """
+        result = ImportResult()
+        names = {model: self.catalog_repository.get_name_map(model) for model in (*REFERENCE_FIELDS.values(), Platform)}
+        start = time.perf_counter()
+
+        records = iter(records)
+        while chunk := list(islice(records, batch_size)):
+            self._import_chunk(chunk, names, result)
+            result.seconds = time.perf_counter() - start
+            if on_batch is not None:
+                on_batch(result)
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _import_chunk(self, chunk, names, result):
+        result.rows += len(chunk)
+
+        games = {}
+        for line, data in self._validate(chunk, result):
+            # A title repeated within the chunk keeps its last record
+            games[data['title']] = data
+
+        created_models = set()
+        for field, model in REFERENCE_FIELDS.items():
+            if self._resolve(model, {data[field] for data in games.values()}, names):
+                created_models.add(model)
+        if self._resolve(Platform, {name for data in games.values() for name in data['platforms']}, names):
+            created_models.add(Platform)
+
+        rows = [{
+            'title': data['title'],
+            'description': data['description'],
+            'release_date': data['release_date'],
+            'genre_id': names[Genre][data['genre']],
+            'developer_id': names[Developer][data['developer']],
+            'publisher_id': names[Publisher][data['publisher']],
+            'cover_image': data['cover_image']
+        } for data in games.values()]
+        ids, created = self.catalog_repository.upsert_games(rows)
+
+        pairs = {
+            (ids[data['title']], names[Platform][name])
+            for data in games.values() for name in data['platforms']
+        }
+        result.links += self.catalog_repository.link_platforms(pairs)
+
+        self.catalog_repository.commit(created_models)
+        result.created += created
+        result.updated += len(rows) - created
+
+    def _validate(self, chunk, result):
+        parsed = [(line, record) for line, record in chunk if record is not None]
+        for line, record in chunk:
+            if record is None:
+                result.reject(line, {'_schema': ['Could not parse the record.']})
+
+        try:
+            validated, errors = CatalogGameSchema(many=True).load([record for _, record in parsed]), {}
+        except ValidationError as err:
+            validated, errors = err.valid_data, err.messages
+
+        for index, (line, _) in enumerate(parsed):
+            if index in errors:
+                result.reject(line, errors[index])
+            else:
+                yield line, validated[index]
+
+    def _resolve(self, model, wanted, names):
+        missing = wanted - names[model].keys()
+        names[model].update(self.catalog_repository.create_names(model, missing))
+        return bool(missing)
+
+
+def read_jsonl(file):
+    '''
+    Stream the records of a JSON Lines file.
+
+    Parameters:
+    ----------
+    file : TextIO
+        The open file.
+
+    Yields:
+    ------
+    tuple[int, dict]
+        The line number and the record, or None if the line is not a JSON object.
+    '''
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            record = None
+        yield line, record if isinstance(record, dict) else None
+
+
+def read_csv(file):
+    '''
+    Stream the records of a CSV file with a header row.
+
+    Platforms are read from a single column separated by CSV_PLATFORM_SEPARATOR, and empty
+    cells are treated as missing.
+
+    Parameters:
+    ----------
+    file : TextIO
+        The open file, opened with newline=''.
+
+    Yields:
+    ------
+    tuple[int, dict]
+        The line number and the record.
+    '''
+    reader = csv.DictReader(file)
+    for row in reader:
+        record = {key: value.strip() for key, value in row.items() if key and value and value.strip()}
+        if 'platforms' in record:
+            record['platforms'] = [
+                name.strip() for name in record['platforms'].split(CSV_PLATFORM_SEPARATOR) if name.strip()
+            ]
+        yield reader.line_num, record
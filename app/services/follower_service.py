@@ -1,4 +1,5 @@
 from app.repositories.follower_repository import FollowerRepository
+from app.repositories.user_repository import UserRepository
 
 class FollowerService:
     """
@@ -11,6 +12,8 @@ class FollowerService:
     ----------
     follower_repository : FollowerRepository
         The repository instance used to interact with the follower data.
+    user_repository : UserRepository
+        The repository instance used to check that both users exist.
 
     Methods:
     -------
@@ -18,14 +21,17 @@ class FollowerService:
         Follows a user by creating a new follower entry.
     unfollow(follower: Follower) -> None:
         Unfollows a user by deleting the follower entry.
-    get_followers(user_id: int) -> list[Follower]:
-        Retrieves all followers for a given user.
-    get_following(follower_id: int) -> list[Follower]:
-        Retrieves all users that a given user is following.
+    get_followers(user_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of followers for a given user.
+    get_following(follower_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of users that a given user is following.
+    get_relationships(user_id: int, other_ids: list[int]) -> list[dict]:
+        Retrieves whether a user follows, and is followed by, each of several users.
     """
     
     def __init__(self,
-                 follower_repository: FollowerRepository= FollowerRepository()):
+                 follower_repository: FollowerRepository= FollowerRepository(),
+                 user_repository: UserRepository = UserRepository()):
         '''
         Initializes the FollowerService with the given FollowerRepository.
 
@@ -33,8 +39,11 @@ class FollowerService:
         ----------
         follower_repository : FollowerRepository, optional
             The FollowerRepository instance (default is the FollowerRepository instance from app).
+        user_repository : UserRepository, optional
+            The UserRepository instance (default is a new UserRepository instance).
         '''
         self.follower_repository = follower_repository
+        self.user_repository = user_repository
 
 
     def get_relation(self, user_id, follower_id):
@@ -93,36 +102,65 @@ class FollowerService:
         '''
         self.follower_repository.delete(follower)
 
-    def get_followers(self, user_id):
+    def get_followers(self, user_id, limit=None, cursor=None, options=()):
         '''
-        Get all followers for a given user.
+        Get a page of followers for a given user.
 
         Parameters:
         ----------
         user_id : int
             The ID of the user to retrieve followers for.
+        limit : int, optional
+            The maximum number of followers to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[Follower]
-            A list of Follower objects.
+        Page
+            A page of Follower objects.
         '''
-        return self.follower_repository.get_followers(user_id)
+        return self.follower_repository.get_followers(user_id, limit, cursor, options)
     
-    def get_following(self, follower_id):
+    def get_following(self, follower_id, limit=None, cursor=None, options=()):
         '''
-        Get all users that a given user is following.
+        Get a page of users that a given user is following.
 
         Parameters:
         ----------
         follower_id : int
             The ID of the user to retrieve following for.
+        limit : int, optional
+            The maximum number of relationships to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[Follower]
-            A list of Follower objects.
+        Page
+            A page of Follower objects.
         '''
-        return self.follower_repository.get_following(follower_id)
+        return self.follower_repository.get_following(follower_id, limit, cursor, options)
 
-    
\ No newline at end of file
+    def get_relationships(self, user_id, other_ids):
+        '''
+        Get whether a user follows, and is followed by, each of several users.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user the relationships are seen from.
+        other_ids : list[int]
+            The IDs of the other users.
+
+        Returns:
+        -------
+        list[dict]
+            The id, following and followed_by flags of each other user, in the order given.
+        '''
+        relationships = self.follower_repository.get_relationships(user_id, other_ids)
+        return [{'id': id, **relationships[id]} for id in other_ids]
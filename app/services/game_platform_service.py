@@ -4,62 +4,134 @@ class GamePlatformService:
     """
     Service class for managing game-platform relationships.
 
-    This class provides methods to create, delete, and retrieve game-platform relationships.
+    This class provides methods to link and unlink games and platforms, one or many at a time,
+    and to retrieve the platforms of games and the games of a platform.
     It interacts with the GamePlatformRepository to perform database operations.
 
+    Attributes:
+    ----------
+    game_platform_repository : GamePlatformRepository
+        The repository instance used to interact with the game_platforms table.
+
     Methods:
     --------
-    __init__():
-        Initializes the GamePlatformService with a GamePlatformRepository instance.
-
-    create_game_platform(game_id: int, platform_id: int) -> dict:
-        Creates a new game-platform relationship.
-        - Parameters:
-            - game_id (int): The ID of the game.
-            - platform_id (int): The ID of the platform.
-        - Returns:
-            - dict: A message indicating whether the game-platform relationship was created or already exists.
-
+    create_game_platform(game_id: int, platform_id: int) -> bool:
+        Creates a game-platform relationship.
     delete_game_platform(game_id: int, platform_id: int) -> bool:
         Deletes a game-platform relationship.
-        - Parameters:
-            - game_id (int): The ID of the game.
-            - platform_id (int): The ID of the platform.
-        - Returns:
-            - bool: True if the relationship was deleted, False otherwise.
-
+    link(links: list[dict]) -> int:
+        Creates several game-platform relationships.
+    unlink(links: list[dict]) -> int:
+        Deletes several game-platform relationships.
     get_platform_by_game(game_id: int) -> list:
         Retrieves all platforms associated with a given game.
-        - Parameters:
-            - game_id (int): The ID of the game.
-        - Returns:
-            - list: A list of platforms associated with the game.
-
-    get_game_by_platform(platform_id: int) -> list:
-        Retrieves all games associated with a given platform.
-        - Parameters:
-            - platform_id (int): The ID of the platform.
-        - Returns:
-            - list: A list of games associated with the platform.
+    get_platforms_by_games(game_ids: list[int]) -> list[dict]:
+        Retrieves the platforms of several games.
+    get_game_by_platform(platform_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the games associated with a given platform.
     """
-        
-    def __init__(self):
-        self.game_platform_repository = GamePlatformRepository()
+
+    def __init__(self, game_platform_repository: GamePlatformRepository = GamePlatformRepository()) -> None:
+        """
+        Initializes the GamePlatformService with the given GamePlatformRepository instance.
+
+        Parameters:
+        ----------
+        game_platform_repository : GamePlatformRepository, optional
+            The repository instance (default is a new GamePlatformRepository instance).
+        """
+        self.game_platform_repository = game_platform_repository
 
     def create_game_platform(self, game_id, platform_id):
-        # Check if game platform already exists
-        game_platform = self.game_platform_repository.get_game_platform_by_id(game_id, platform_id)
+        """
+        Create a game-platform relationship.
+
+        Returns:
+        -------
+        bool
+            True if the relationship was created, False if it already existed.
 
-        if game_platform:
-            return {'message': 'Game platform already exists!'}
-        
-        return self.game_platform_repository.create_game_platform(game_id, platform_id)
+        Raises:
+        ------
+        ValueError
+            If the game or the platform does not exist.
+        """
+        return self.link([{'game_id': game_id, 'platform_id': platform_id}]) == 1
 
     def delete_game_platform(self, game_id, platform_id):
-        return self.game_platform_repository.delete_game_platform(game_id, platform_id)
+        """
+        Delete a game-platform relationship.
+
+        Returns:
+        -------
+        bool
+            True if the relationship was deleted, False if it did not exist.
+        """
+        return self.unlink([{'game_id': game_id, 'platform_id': platform_id}]) == 1
+
+    def link(self, links):
+        """
+        Create the given game-platform relationships, skipping those that already exist.
+
+        Parameters:
+        ----------
+        links : list[dict]
+            The game_id and platform_id of each relationship.
+
+        Returns:
+        -------
+        int
+            The number of relationships created.
+
+        Raises:
+        ------
+        ValueError
+            If any of the games or platforms does not exist.
+        """
+        pairs = {(link['game_id'], link['platform_id']) for link in links}
+        missing_games, missing_platforms = self.game_platform_repository.get_missing_ids(
+            {game_id for game_id, _ in pairs}, {platform_id for _, platform_id in pairs}
+        )
+        if missing_games or missing_platforms:
+            raise ValueError({'game_ids': missing_games, 'platform_ids': missing_platforms})
+
+        return self.game_platform_repository.create_many(pairs)
+
+    def unlink(self, links):
+        """
+        Delete the given game-platform relationships.
+
+        Parameters:
+        ----------
+        links : list[dict]
+            The game_id and platform_id of each relationship.
+
+        Returns:
+        -------
+        int
+            The number of relationships deleted.
+        """
+        return self.game_platform_repository.delete_many({(link['game_id'], link['platform_id']) for link in links})
 
     def get_platform_by_game(self, game_id):
         return self.game_platform_repository.get_all_platforms(game_id)
 
-    def get_game_by_platform(self, platform_id):
-        return self.game_platform_repository.get_all_games(platform_id)
\ No newline at end of file
+    def get_platforms_by_games(self, game_ids):
+        """
+        Get the platforms of several games with one query.
+
+        Parameters:
+        ----------
+        game_ids : list[int]
+            The IDs of the games.
+
+        Returns:
+        -------
+        list[dict]
+            The game_id and platforms of each game, in the order given.
+        """
+        platforms = self.game_platform_repository.get_platforms_for_games(game_ids)
+        return [{'game_id': game_id, 'platforms': platforms.get(game_id, [])} for game_id in game_ids]
+
+    def get_game_by_platform(self, platform_id, limit=None, cursor=None):
+        return self.game_platform_repository.get_all_games(platform_id, limit, cursor)
@@ -1,4 +1,6 @@
 from app.repositories.game_repository import GameRepository
+from app.repositories.game_rating_stats_repository import GameRatingStatsRepository
+from app.repositories.game_search_repository import GameSearchRepository
 
 class GameService:
     """
@@ -11,6 +13,10 @@ class GameService:
     ----------
     game_repository : GameRepository
         The repository instance used to interact with the game data.
+    game_rating_stats_repository : GameRatingStatsRepository
+        The repository instance used to read the rating aggregates of games.
+    game_search_repository : GameSearchRepository
+        The repository instance used to run full-text game searches.
 
     Methods:
     -------
@@ -18,17 +24,26 @@ class GameService:
         Creates a new game.
     get(id: int) -> Game:
         Retrieves a game by its ID.
-    get_all() -> list[Game]:
-        Retrieves all games.
+    get_all(limit: int, cursor: str) -> Page:
+        Retrieves a page of games.
     update(game: Game, data: dict) -> Game:
         Updates a game.
     delete(game: Game) -> None:
         Deletes a game.
-    get_by_title(title: str) -> Game:
-        Retrieves a game by its title.
+    browse(filters: dict, sort: str, limit: int, cursor: str) -> Page:
+        Retrieves a page of the games matching the browse filters.
+    get_facets(filters: dict) -> dict:
+        Retrieves the game counts per facet value for the browse filters.
+    search(text: str, limit: int, cursor: str) -> Page:
+        Retrieves a page of games matching a full-text search.
+    get_top_rated(min_reviews: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of games ordered by average review score.
     """
 
-    def __init__(self, game_repository: GameRepository = GameRepository()) -> None:
+    def __init__(self,
+                 game_repository: GameRepository = GameRepository(),
+                 game_rating_stats_repository: GameRatingStatsRepository = GameRatingStatsRepository(),
+                 game_search_repository: GameSearchRepository = GameSearchRepository()) -> None:
         """
         Initializes the GameService with the given GameRepository instance.
 
@@ -36,8 +51,14 @@ class GameService:
         ----------
         game_repository : GameRepository, optional
             The repository instance used to interact with the game data (default is a new GameRepository instance).
+        game_rating_stats_repository : GameRatingStatsRepository, optional
+            The repository instance used to read rating aggregates (default is a new GameRatingStatsRepository instance).
+        game_search_repository : GameSearchRepository, optional
+            The repository instance used to run full-text searches (default is a new GameSearchRepository instance).
         """
         self.game_repository = game_repository
+        self.game_rating_stats_repository = game_rating_stats_repository
+        self.game_search_repository = game_search_repository
 
     def create(self, data):
         """
@@ -55,7 +76,7 @@ class GameService:
         """
         return self.game_repository.create(data)
     
-    def get(self, id):
+    def get(self, id, options=()):
         """
         Get a game by ID.
 
@@ -63,24 +84,35 @@ class GameService:
         ----------
         id : int
             The ID of the game to retrieve.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
         Game
             The Game object with the specified ID, or None if not found.
         """
-        return self.game_repository.get(id)
+        return self.game_repository.get(id, options)
     
-    def get_all(self):
+    def get_all(self, limit=None, cursor=None, options=()):
         """
-        Get all games.
+        Get a page of games.
+
+        Parameters:
+        ----------
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[Game]
-            A list of all Game objects.
+        Page
+            A page of Game objects.
         """
-        return self.game_repository.get_all()
+        return self.game_repository.get_all(limit, cursor, options)
     
     def update(self, game, data):
         """
@@ -111,18 +143,86 @@ class GameService:
         """
         return self.game_repository.delete(game)
     
-    def get_by_title(self, title):
+    def browse(self, filters, sort='title', limit=None, cursor=None, options=()):
         """
-        Get a game by title.
+        Get a page of the games matching the browse filters.
 
         Parameters:
         ----------
-        title : str
-            The title of the game to retrieve.
+        filters : dict
+            Optional genre, platform, developer and publisher IDs, and year_from / year_to.
+        sort : str, optional
+            'title', 'release_date' or '-release_date'.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        Game
-            The Game object with the specified title, or None if not found.
+        Page
+            A page of Game objects.
+        """
+        return self.game_repository.browse(filters, sort, limit, cursor, options)
+
+    def get_facets(self, filters):
+        """
+        Get the game counts per genre, platform, developer, publisher and release year.
+
+        Parameters:
+        ----------
+        filters : dict
+            The browse filters.
+
+        Returns:
+        -------
+        dict
+            The values of each facet with their counts, most frequent first.
+        """
+        return self.game_repository.get_facets(filters)
+
+    def search(self, text, limit=None, cursor=None, options=()):
+        """
+        Search games by title and description, most relevant first.
+
+        Parameters:
+        ----------
+        text : str
+            The search text. The last word also matches as a prefix.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        Page
+            A page of matching Game objects.
+        """
+        return self.game_search_repository.search(text, limit, cursor, options)
+    
+    def get_top_rated(self, min_reviews=1, limit=None, cursor=None, options=()):
+        """
+        Get a page of games ordered by average review score, best first.
+
+        Parameters:
+        ----------
+        min_reviews : int, optional
+            The minimum number of reviews a game needs to be ranked.
+        limit : int, optional
+            The maximum number of games to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        Page
+            A page of GameRatingStats objects.
         """
-        return self.game_repository.get_by_title(title)
\ No newline at end of file
+        return self.game_rating_stats_repository.get_top_rated(min_reviews, limit, cursor, options)
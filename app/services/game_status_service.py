@@ -14,9 +14,9 @@ class GameStatusService:
 
     Methods:
     -------
-    get(id: int) -> GameStatus:
+    get(id: int) -> ReferenceRow:
         Retrieves a game status by its ID.
-    get_all() -> list[GameStatus]:
+    get_all() -> list[ReferenceRow]:
         Retrieves all game statuses.
     """
 
@@ -42,8 +42,8 @@ class GameStatusService:
 
         Returns:
         -------
-        GameStatus
-            The GameStatus object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the game status with the specified ID, or None if not found.
         """
         return self.game_status_repository.get(id)
     
@@ -53,7 +53,7 @@ class GameStatusService:
 
         Returns:
         -------
-        list[GameStatus]
-            A list of all GameStatus objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all game statuses, ordered by ID.
         """
         return self.game_status_repository.get_all()
\ No newline at end of file
@@ -14,9 +14,9 @@ class GenreService:
 
     Methods:
     -------
-    get(id: int) -> Genre:
+    get(id: int) -> ReferenceRow:
         Retrieves a genre by its ID.
-    get_all() -> list[Genre]:
+    get_all() -> list[ReferenceRow]:
         Retrieves all genres.
     """
 
@@ -42,8 +42,8 @@ class GenreService:
 
         Returns:
         -------
-        Genre
-            The Genre object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the genre with the specified ID, or None if not found.
         """
         return self.genre_repository.get(id)
     
@@ -53,7 +53,7 @@ class GenreService:
 
         Returns:
         -------
-        list[Genre]
-            A list of all Genre objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all genres, ordered by ID.
         """
         return self.genre_repository.get_all()
\ No newline at end of file
@@ -14,9 +14,9 @@ class PlatformService:
 
     Methods:
     -------
-    get(id: int) -> Platform:
+    get(id: int) -> ReferenceRow:
         Retrieves a platform by its ID.
-    get_all() -> list[Platform]:
+    get_all() -> list[ReferenceRow]:
         Retrieves all platforms.
     """
 
@@ -42,8 +42,8 @@ class PlatformService:
 
         Returns:
         -------
-        Platform
-            The Platform object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the platform with the specified ID, or None if not found.
         """
         return self.platform_repository.get(id)
     
@@ -53,7 +53,7 @@ class PlatformService:
 
         Returns:
         -------
-        list[Platform]
-            A list of all Platform objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all platforms, ordered by ID.
         """
         return self.platform_repository.get_all()
\ No newline at end of file
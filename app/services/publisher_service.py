@@ -14,9 +14,9 @@ class PublisherService:
 
     Methods:
     -------
-    get(id: int) -> Publisher:
+    get(id: int) -> ReferenceRow:
         Retrieves a publisher by its ID.
-    get_all() -> list[Publisher]:
+    get_all() -> list[ReferenceRow]:
         Retrieves all publishers.
     """
 
@@ -42,8 +42,8 @@ class PublisherService:
 
         Returns:
         -------
-        Publisher
-            The Publisher object with the specified ID, or None if not found.
+        ReferenceRow
+            The cached (id, name) row of the publisher with the specified ID, or None if not found.
         """
         return self.publisher_repository.get(id)
     
@@ -53,7 +53,7 @@ class PublisherService:
 
         Returns:
         -------
-        list[Publisher]
-            A list of all Publisher objects.
+        list[ReferenceRow]
+            The cached (id, name) rows of all publishers, ordered by ID.
         """
         return self.publisher_repository.get_all()
\ No newline at end of file
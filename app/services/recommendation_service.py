@@ -0,0 +1,192 @@
+import heapq
+import math
+import time
+from flask import current_app
+from app.repositories.game_similarity_repository import GameSimilarityRepository
+from app.sparse import SparseRows
+
+# Co-occurrence count at which the similarity of two games keeps half its weight
+SHRINKAGE = 5
+
+
+class SimilarityResult:
+    '''
+    Counters of a similar games run.
+
+    Attributes:
+    ----------
+    games : int
+        The number of games whose neighbours were recomputed.
+    similarities : int
+        The number of neighbours written.
+    interactions : int
+        The number of user-game interactions loaded.
+    seconds : float
+        The time spent, loading the interactions included.
+    '''
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.similarities = 0
+        self.interactions = 0
+        self.seconds = 0.0
+
+
+class RecommendationService:
+    """
+    Service layer for similar games and game recommendations.
+
+    The similar games job treats reviews and backlog entries as a sparse user x game matrix X
+    (a review weighs its score / 10, a backlog entry BACKLOG_WEIGHT) and computes the item-item
+    cosine similarity X^T X / (|x_i| |x_j|) one game row at a time, walking the game -> users
+    transpose and then each user's games (a row-by-row sparse product), so memory holds the
+    two sparse matrices plus one row of scores. Similarities are shrunk by n / (n + SHRINKAGE),
+    where n is the number of users the two games share, and the top GAME_SIMILAR_TOP_N of each
+    game are written chunk_size games at a time.
+
+    Recommendations sum the stored neighbours of the games a user recently liked.
+
+    Attributes:
+    ----------
+    game_similarity_repository : GameSimilarityRepository
+        The repository instance used to read the interactions and write the similarities.
+
+    Methods:
+    -------
+    compute(chunk_size: int, max_user_games: int, on_chunk: Callable) -> SimilarityResult:
+        Recomputes the neighbours of every game.
+    get_similar(game_id: int, options: tuple) -> list[GameSimilarity]:
+        Retrieves the neighbours of a game, most similar first.
+    get_recommendations(user_id: int, limit: int, options: tuple) -> list[dict]:
+        Retrieves recommended games for a user, best first.
+    """
+
+    def __init__(self,
+                 game_similarity_repository: GameSimilarityRepository = GameSimilarityRepository()) -> None:
+        """
+        Initializes the RecommendationService with the given GameSimilarityRepository instance.
+
+        Parameters:
+        ----------
+        game_similarity_repository : GameSimilarityRepository, optional
+            The repository instance (default is a new GameSimilarityRepository instance).
+        """
+        self.game_similarity_repository = game_similarity_repository
+
+    def get_similar(self, game_id, options=()):
+        """
+        Get the neighbours of a game, most similar first.
+
+        Parameters:
+        ----------
+        game_id : int
+            The ID of the game.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        list[GameSimilarity]
+            The precomputed neighbours of the game.
+        """
+        return self.game_similarity_repository.get_similar(game_id, options)
+
+    def get_recommendations(self, user_id, limit, options=()):
+        """
+        Get recommended games for a user, best first, leaving out the games they already have.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user.
+        limit : int
+            The maximum number of games to return.
+        options : tuple, optional
+            Loader options matching the schema the games are serialized with.
+
+        Returns:
+        -------
+        list[dict]
+            The game and score of each recommendation.
+        """
+        recommendations = self.game_similarity_repository.get_recommendations(
+            user_id,
+            limit,
+            current_app.config['RECOMMENDATION_SEED_GAMES'],
+            current_app.config['RECOMMENDATION_MIN_SCORE'],
+            options
+        )
+        return [{'game': game, 'score': score} for game, score in recommendations]
+
+    def compute(self, chunk_size=1000, max_user_games=1000, on_chunk=None):
+        """
+        Recompute the neighbours of every game.
+
+        Parameters:
+        ----------
+        chunk_size : int, optional
+            The number of consecutive game IDs whose neighbours are written and committed together.
+        max_user_games : int, optional
+            Users who interacted with more games than this are left out, which bounds the
+            work per game.
+        on_chunk : Callable, optional
+            Called with the SimilarityResult after every committed chunk.
+
+        Returns:
+        -------
+        SimilarityResult
+            The counters of the run.
+        """
+        result = SimilarityResult()
+        start = time.perf_counter()
+        repository = self.game_similarity_repository
+        top_n = current_app.config['GAME_SIMILAR_TOP_N']
+
+        max_user_id, max_game_id = repository.get_max_ids()
+        user_games = SparseRows.from_sorted(repository.stream_interactions(), max_user_id + 1, weighted=True)
+        game_users = user_games.transpose(max_game_id + 1)
+        result.interactions = len(user_games.columns)
+
+        norms = [math.sqrt(sum(weight * weight for weight in game_users.row_values(game_id))) for game_id in range(max_game_id + 1)]
+
+        for first in range(1, max_game_id + 1, chunk_size):
+            last = min(first + chunk_size - 1, max_game_id)
+            rows = []
+            for game_id in range(first, last + 1):
+                rows += self._neighbours(game_id, user_games, game_users, norms, top_n, max_user_games)
+            repository.replace(first, last, rows)
+
+            result.games += last - first + 1
+            result.similarities += len(rows)
+            result.seconds = time.perf_counter() - start
+            if on_chunk is not None:
+                on_chunk(result)
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _neighbours(self, game_id, user_games, game_users, norms, top_n, max_user_games):
+        if not norms[game_id]:
+            return []
+
+        # Row game_id of X^T X: every user of the game contributes weight products with their other games
+        dots, counts = {}, {}
+        for user_id, weight in zip(game_users[game_id], game_users.row_values(game_id)):
+            if user_games.degree(user_id) > max_user_games:
+                continue
+            for other_id, other_weight in zip(user_games[user_id], user_games.row_values(user_id)):
+                dots[other_id] = dots.get(other_id, 0.0) + weight * other_weight
+                counts[other_id] = counts.get(other_id, 0) + 1
+        dots.pop(game_id, None)
+
+        scored = (
+            (dot / (norms[game_id] * norms[other_id]) * counts[other_id] / (counts[other_id] + SHRINKAGE), other_id)
+            for other_id, dot in dots.items()
+        )
+        return [{
+            'game_id': game_id,
+            'similar_game_id': other_id,
+            'rank': rank,
+            'score': score,
+            'users': counts[other_id]
+        } for rank, (score, other_id) in enumerate(heapq.nlargest(top_n, scored), start=1)]
@@ -20,8 +20,8 @@ class UserBacklogService:
         Creates a new user backlog entry with the provided data.
     delete(user_backlog: UserBacklog) -> UserBacklog:
         Deletes the provided user backlog entry.
-    get_backlog(user_id: int) -> list[UserBacklog]:
-        Retrieves all games in a user's backlog.
+    get_backlog(user_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of games in a user's backlog.
     """
     
     def __init__(self,
@@ -36,7 +36,7 @@ class UserBacklogService:
         '''
         self.user_backlog_repository = user_backlog_repository
 
-    def get(self, user_id, game_id):
+    def get(self, user_id, game_id, options=()):
         '''
         Get a user backlog entry.
 
@@ -46,13 +46,15 @@ class UserBacklogService:
             The ID of the user to retrieve the backlog entry for.
         game_id : int
             The ID of the game to retrieve the backlog entry for.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
         UserBacklog
             The UserBacklog object.
         '''
-        return self.user_backlog_repository.get(user_id, game_id)
+        return self.user_backlog_repository.get(user_id, game_id, options)
 
     def create(self, data):
         '''
@@ -66,8 +68,8 @@ class UserBacklogService:
         '''
         return self.user_backlog_repository.delete(user_backlog)
 
-    def get_backlog(self, user_id):
+    def get_backlog(self, user_id, limit=None, cursor=None, options=()):
         '''
-        Get all games in a user's backlog.
+        Get a page of games in a user's backlog, applying the given loader options.
         '''
-        return self.user_backlog_repository.get_backlog(user_id)
\ No newline at end of file
+        return self.user_backlog_repository.get_backlog(user_id, limit, cursor, options)
\ No newline at end of file
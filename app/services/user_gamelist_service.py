@@ -0,0 +1,98 @@
+from app.repositories.user_gamelist_repository import UserGameListRepository
+
+class UserGameListService:
+    """
+    Service layer for UserGameList operations.
+
+    This class provides methods to interact with the UserGameListRepository.
+    It includes methods to manage game lists and their ordered games.
+
+    Attributes:
+    ----------
+    user_gamelist_repository : UserGameListRepository
+        The repository instance used to interact with the game list data.
+
+    Methods:
+    -------
+    get(gamelist_id: int) -> UserGameList:
+        Retrieves a game list by its ID.
+    get_by_user(user_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the game lists of a user.
+    create(data: dict) -> UserGameList:
+        Creates a new game list.
+    update(gamelist: UserGameList, data: dict) -> UserGameList:
+        Renames a game list.
+    delete(gamelist: UserGameList) -> None:
+        Deletes a game list.
+    get_games(gamelist_id: int, limit: int, cursor: str) -> Page:
+        Retrieves a page of the games of a list, in list order.
+    add_games(gamelist_id: int, game_ids: list[int]) -> int:
+        Appends games to a list.
+    remove_games(gamelist_id: int, game_ids: list[int]) -> int:
+        Removes games from a list.
+    move_games(gamelist_id: int, positions: list[dict]) -> int:
+        Moves games to new positions in a list, shifting the games after them.
+    """
+
+    def __init__(self,
+                 user_gamelist_repository: UserGameListRepository = UserGameListRepository()):
+        '''
+        Initializes the UserGameListService with the given UserGameListRepository.
+
+        Parameters:
+        ----------
+        user_gamelist_repository : UserGameListRepository, optional
+            The UserGameListRepository instance (default is a new UserGameListRepository instance).
+        '''
+        self.user_gamelist_repository = user_gamelist_repository
+
+    def get(self, gamelist_id):
+        return self.user_gamelist_repository.get(gamelist_id)
+
+    def get_by_user(self, user_id, limit=None, cursor=None):
+        return self.user_gamelist_repository.get_by_user(user_id, limit, cursor)
+
+    def create(self, data):
+        return self.user_gamelist_repository.create(data)
+
+    def update(self, gamelist, data):
+        return self.user_gamelist_repository.update(gamelist, data)
+
+    def delete(self, gamelist):
+        self.user_gamelist_repository.delete(gamelist)
+
+    def get_games(self, gamelist_id, limit=None, cursor=None):
+        return self.user_gamelist_repository.get_games(gamelist_id, limit, cursor)
+
+    def add_games(self, gamelist_id, game_ids):
+        '''
+        Append games to the end of a list, skipping those already in it.
+
+        Parameters:
+        ----------
+        gamelist_id : int
+            The ID of the list.
+        game_ids : list[int]
+            The IDs of the games to add, in the order they should appear.
+
+        Returns:
+        -------
+        int
+            The number of games added.
+
+        Raises:
+        ------
+        ValueError
+            If any of the games does not exist; the missing IDs are the error's argument.
+        '''
+        missing = self.user_gamelist_repository.get_missing_game_ids(game_ids)
+        if missing:
+            raise ValueError(missing)
+
+        return self.user_gamelist_repository.add_games(gamelist_id, game_ids)
+
+    def remove_games(self, gamelist_id, game_ids):
+        return self.user_gamelist_repository.remove_games(gamelist_id, game_ids)
+
+    def move_games(self, gamelist_id, positions):
+        return self.user_gamelist_repository.move_games(gamelist_id, positions)
@@ -16,8 +16,10 @@ class UserReviewService:
     -------
     get(id: int) -> UserReview:
         Retrieves a user review by its ID.
-    get_all() -> list[UserReview]:
-        Retrieves all user reviews.
+    get_all(limit: int, cursor: str) -> Page:
+        Retrieves a page of user reviews.
+    create_batch(items: list[tuple[int, dict]]) -> list[dict]:
+        Creates several user reviews in one transaction.
     """
 
     def __init__(self, user_review_repository: UserReviewRepository = UserReviewRepository()) -> None:
@@ -31,7 +33,7 @@ class UserReviewService:
         """
         self.user_review_repository = user_review_repository
 
-    def get(self, id):
+    def get(self, id, options=()):
         """
         Get a user review by ID.
 
@@ -39,24 +41,35 @@ class UserReviewService:
         ----------
         id : int
             The ID of the user review to retrieve.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
         UserReview
             The UserReview object with the specified ID, or None if not found.
         """
-        return self.user_review_repository.get(id)
+        return self.user_review_repository.get(id, options)
     
-    def get_all(self):
+    def get_all(self, limit=None, cursor=None, options=()):
         """
-        Get all user reviews.
+        Get a page of user reviews.
+
+        Parameters:
+        ----------
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects.
+        Page
+            A page of UserReview objects.
         """
-        return self.user_review_repository.get_all()
+        return self.user_review_repository.get_all(limit, cursor, options)
     
     def create(self, data):
         """
@@ -74,13 +87,59 @@ class UserReviewService:
         """
 
         # Check if user review already exists
-        user_review = self.user_review_repository.get_by_user_and_game(data['user_id'], data['game_id'])
+        user_review = self.user_review_repository.get_by_user_game_id(data['user_id'], data['game_id'])
 
         if user_review:
             return {'message': 'User review already exists!'}
         
 
         return self.user_review_repository.create(data)
+
+    def create_batch(self, items):
+        """
+        Create several user reviews in one transaction.
+
+        Reviews whose user, game or status does not exist, or whose user already reviewed
+        the game (in the database or earlier in the batch), are skipped.
+
+        Parameters:
+        ----------
+        items : list[tuple[int, dict]]
+            The position in the request and the validated data of each user review.
+
+        Returns:
+        -------
+        list[dict]
+            One result per item, with its index and a status of created, duplicate or invalid.
+        """
+        rows = [data for _, data in items]
+        existing = self.user_review_repository.get_existing_references(rows)
+        duplicates = self.user_review_repository.get_existing_pairs(
+            [(data['user_id'], data['game_id']) for data in rows]
+        )
+
+        results, created = [], []
+        for index, data in items:
+            errors = {
+                field: [f'{name} not found.']
+                for field, name in (('user_id', 'User'), ('game_id', 'Game'), ('status_id', 'Status'))
+                if data[field] not in existing[field]
+            }
+            pair = (data['user_id'], data['game_id'])
+
+            if errors:
+                results.append({'index': index, 'status': 'invalid', 'errors': errors})
+            elif pair in duplicates:
+                results.append({'index': index, 'status': 'duplicate', 'message': 'User review already exists!'})
+            else:
+                duplicates.add(pair)
+                created.append((index, data))
+
+        ids = self.user_review_repository.create_many([data for _, data in created])
+        for (index, _), id in zip(created, ids):
+            results.append({'index': index, 'status': 'created', 'id': id})
+
+        return results
     
     def update(self, user_review, data):
         """
@@ -118,34 +177,46 @@ class UserReviewService:
         
         return self.user_review_repository.delete(user_review)
     
-    def get_by_user(self, user_id):
+    def get_by_user(self, user_id, limit=None, cursor=None, options=()):
         """
-        Get all user reviews by user.
+        Get a page of user reviews by user.
 
         Parameters:
         ----------
         user_id : int
             The ID of the user.
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects by the specified user.
+        Page
+            A page of UserReview objects by the specified user.
         """
-        return self.user_review_repository.get_by_user(user_id)
+        return self.user_review_repository.get_by_user_id(user_id, limit, cursor, options)
     
-    def get_by_game(self, game_id):
+    def get_by_game(self, game_id, limit=None, cursor=None, options=()):
         """
-        Get all user reviews by game.
+        Get a page of user reviews by game.
 
         Parameters:
         ----------
         game_id : int
             The ID of the game.
+        limit : int, optional
+            The maximum number of user reviews to return.
+        cursor : str, optional
+            The cursor returned by the previous page.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
 
         Returns:
         -------
-        list[UserReview]
-            A list of all UserReview objects by the specified game.
+        Page
+            A page of UserReview objects for the specified game.
         """
-        return self.user_review_repository.get_by_game(game_id)
\ No newline at end of file
+        return self.user_review_repository.get_by_game_id(game_id, limit, cursor, options)
\ No newline at end of file
@@ -1,8 +1,12 @@
 from app.repositories.user_repository import UserRepository
+from app.repositories.activity_repository import ActivityRepository
 
 class UserService:
-    def __init__(self, user_repository: UserRepository = UserRepository()) -> None:
+    def __init__(self,
+                 user_repository: UserRepository = UserRepository(),
+                 activity_repository: ActivityRepository = ActivityRepository()) -> None:
         self.user_repository = user_repository
+        self.activity_repository = activity_repository
 
     
     def create(self, validated_data):
@@ -21,9 +25,12 @@ class UserService:
     def get(self, id):
         return self.user_repository.get(id)
     
-    def get_all(self):
-        return self.user_repository.get_all()
+    def get_all(self, limit=None, cursor=None):
+        return self.user_repository.get_all(limit, cursor)
     
+    def get_feed(self, user_id, limit=None, cursor=None, options=()):
+        return self.activity_repository.get_feed(user_id, limit, cursor, options)
+
     def update(self, user, validated_data):
         return self.user_repository.update(user, validated_data)
     
@@ -0,0 +1,168 @@
+import heapq
+import math
+import time
+from collections import Counter
+from itertools import islice
+from flask import current_app
+from app.repositories.user_suggestion_repository import UserSuggestionRepository
+from app.sparse import SparseRows
+
+# Candidates ranked by mutual connections before the game overlap is computed, per suggestion kept
+CANDIDATE_FACTOR = 5
+
+
+class SuggestionResult:
+    '''
+    Counters of a suggestions run.
+
+    Attributes:
+    ----------
+    users : int
+        The number of users whose suggestions were recomputed.
+    suggestions : int
+        The number of suggestions written.
+    edges : int
+        The number of follow edges loaded.
+    seconds : float
+        The time spent, loading the graph included.
+    '''
+
+    def __init__(self) -> None:
+        self.users = 0
+        self.suggestions = 0
+        self.edges = 0
+        self.seconds = 0.0
+
+
+class UserSuggestionService:
+    """
+    Service layer for "people you may know" suggestions.
+
+    The suggestions of a user are the users followed by the users they follow (second-degree
+    connections), ranked by the number of such mutual connections and weighted by the cosine
+    similarity of the games both users reviewed or added to their backlog. The job loads the
+    follow graph and the games of every user into compact arrays once, then recomputes and
+    writes the top SUGGESTIONS_TOP_K suggestions of chunk_size users at a time.
+
+    Attributes:
+    ----------
+    user_suggestion_repository : UserSuggestionRepository
+        The repository instance used to read the graph and write the suggestions.
+
+    Methods:
+    -------
+    compute(full: bool, chunk_size: int, max_degree: int, on_chunk: Callable) -> SuggestionResult:
+        Recomputes the suggestions of the stale users, or of every user.
+    get_for_user(user_id: int, options: tuple) -> list[UserSuggestion]:
+        Retrieves the suggestions of a user, best first.
+    """
+
+    def __init__(self,
+                 user_suggestion_repository: UserSuggestionRepository = UserSuggestionRepository()) -> None:
+        """
+        Initializes the UserSuggestionService with the given UserSuggestionRepository instance.
+
+        Parameters:
+        ----------
+        user_suggestion_repository : UserSuggestionRepository, optional
+            The repository instance (default is a new UserSuggestionRepository instance).
+        """
+        self.user_suggestion_repository = user_suggestion_repository
+
+    def get_for_user(self, user_id, options=()):
+        """
+        Get the suggestions of a user, best first.
+
+        Parameters:
+        ----------
+        user_id : int
+            The ID of the user.
+        options : tuple, optional
+            Loader options matching the schema the result is serialized with.
+
+        Returns:
+        -------
+        list[UserSuggestion]
+            The precomputed suggestions of the user.
+        """
+        return self.user_suggestion_repository.get_for_user(user_id, options)
+
+    def compute(self, full=False, chunk_size=1000, max_degree=5000, on_chunk=None):
+        """
+        Recompute the suggestions of the users flagged stale by follow writes, or of every user.
+
+        Parameters:
+        ----------
+        full : bool, optional
+            Recompute every user who follows someone, e.g. to pick up review and backlog changes.
+        chunk_size : int, optional
+            The number of users whose suggestions are written and committed together.
+        max_degree : int, optional
+            Followed users who follow more users than this are skipped as connectors, which
+            bounds the work per user.
+        on_chunk : Callable, optional
+            Called with the SuggestionResult after every committed chunk.
+
+        Returns:
+        -------
+        SuggestionResult
+            The counters of the run.
+        """
+        result = SuggestionResult()
+        start = time.perf_counter()
+        repository = self.user_suggestion_repository
+        top_k = current_app.config['SUGGESTIONS_TOP_K']
+
+        user_ids = repository.get_user_ids_with_following() if full else repository.get_stale_user_ids()
+        if user_ids:
+            size = repository.get_max_user_id() + 1
+            following = SparseRows.from_sorted(repository.stream_follow_edges(), size)
+            games = SparseRows.from_sorted(repository.stream_user_games(), size)
+            result.edges = len(following.columns)
+
+            users = iter(user_ids)
+            while chunk := list(islice(users, chunk_size)):
+                rows = []
+                for user_id in chunk:
+                    rows += self._suggest(user_id, following, games, top_k, max_degree)
+                repository.replace(chunk, rows)
+
+                result.users += len(chunk)
+                result.suggestions += len(rows)
+                result.seconds = time.perf_counter() - start
+                if on_chunk is not None:
+                    on_chunk(result)
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _suggest(self, user_id, following, games, top_k, max_degree):
+        followed = following[user_id]
+
+        mutual = Counter()
+        for connector in followed:
+            if following.degree(connector) <= max_degree:
+                mutual.update(following[connector])
+        for excluded in (user_id, *followed):
+            mutual.pop(excluded, None)
+        if not mutual:
+            return []
+
+        # Rank a shortlist by mutual connections, then weight it by the overlap in games
+        own_games = set(games[user_id])
+        scored = []
+        for candidate, mutual_count in heapq.nlargest(top_k * CANDIDATE_FACTOR, mutual.items(), key=lambda item: item[1]):
+            candidate_games = games[candidate]
+            shared = len(own_games.intersection(candidate_games))
+            similarity = shared / math.sqrt(len(own_games) * len(candidate_games)) if shared else 0.0
+            scored.append((mutual_count * (1 + similarity), candidate, mutual_count, shared))
+
+        best = heapq.nlargest(top_k, scored)
+        return [{
+            'user_id': user_id,
+            'suggested_id': candidate,
+            'rank': rank,
+            'score': score,
+            'mutual_count': mutual_count,
+            'shared_games': shared
+        } for rank, (score, candidate, mutual_count, shared) in enumerate(best, start=1)]
@@ -0,0 +1,105 @@
+from array import array
+from itertools import accumulate
+
+"""
+Sparse Rows
+
+This module holds the compressed sparse row matrices the offline jobs build from the database:
+the follow graph of the suggestions job and the user-game interactions of the similar games
+job. Rows and columns are database IDs, so no ID-to-index map is needed; a matrix costs 8
+bytes per row plus 4 bytes per entry (8 with values) in flat arrays.
+"""
+
+
+class SparseRows:
+    '''
+    Compressed sparse rows: the columns of row r are columns[offsets[r]:offsets[r + 1]], with
+    their values at the same positions of values.
+
+    Attributes:
+    ----------
+    offsets : array
+        Start of each row in columns, plus the end of the last row.
+    columns : array
+        Column of every entry, row by row.
+    values : array
+        Value of every entry, or None for a pattern-only matrix.
+    '''
+
+    def __init__(self, offsets, columns, values=None) -> None:
+        self.offsets = offsets
+        self.columns = columns
+        self.values = values
+
+    @classmethod
+    def from_sorted(cls, entries, size, weighted=False):
+        '''
+        Build a matrix from entries ordered by row, e.g. streamed from an ORDER BY query.
+
+        Parameters:
+        ----------
+        entries : Iterable[tuple]
+            (row, column) pairs, or (row, column, value) triples when weighted.
+        size : int
+            The number of rows; every row must be below it.
+        weighted : bool, optional
+            Whether the entries carry values.
+
+        Returns:
+        -------
+        SparseRows
+            The matrix.
+        '''
+        counts = array('q', bytes(8 * (size + 1)))
+        columns = array('i')
+        values = array('d') if weighted else None
+        for entry in entries:
+            counts[entry[0] + 1] += 1
+            columns.append(entry[1])
+            if weighted:
+                values.append(entry[2])
+        return cls(array('q', accumulate(counts)), columns, values)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row):
+        return self.columns[self.offsets[row]:self.offsets[row + 1]]
+
+    def row_values(self, row):
+        return self.values[self.offsets[row]:self.offsets[row + 1]]
+
+    def degree(self, row):
+        return self.offsets[row + 1] - self.offsets[row]
+
+    def transpose(self, size):
+        '''
+        Build the transposed matrix with a counting sort, in two passes over the entries.
+
+        Parameters:
+        ----------
+        size : int
+            The number of columns of this matrix, i.e. the rows of the transpose.
+
+        Returns:
+        -------
+        SparseRows
+            The transpose, whose rows list their columns in ascending order.
+        '''
+        counts = array('q', bytes(8 * (size + 1)))
+        for column in self.columns:
+            counts[column + 1] += 1
+        offsets = array('q', accumulate(counts))
+
+        cursor = array('q', offsets[:-1])
+        columns = array('i', bytes(4 * len(self.columns)))
+        values = array('d', bytes(8 * len(self.columns))) if self.values is not None else None
+        for row in range(len(self)):
+            for position in range(self.offsets[row], self.offsets[row + 1]):
+                column = self.columns[position]
+                target = cursor[column]
+                cursor[column] += 1
+                columns[target] = row
+                if values is not None:
+                    values[target] = self.values[position]
+        return SparseRows(offsets, columns, values)
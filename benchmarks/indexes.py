@@ -0,0 +1,262 @@
+import argparse
+from datetime import date
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Index Benchmark
+
+This script seeds a throw-away SQLite database with a large synthetic dataset (1M user reviews
+by default), then times the repository queries the secondary indexes were designed for, first
+with those indexes dropped and then with them in place, and prints the speedup and the query
+plan of each.
+
+Usage:
+    python benchmarks/indexes.py
+    python benchmarks/indexes.py --reviews 200000 --repeat 50 --json indexes.json
+
+The same repository methods the API calls are timed, so the numbers include ORM overhead; the
+plans show whether each query scans its table or searches an index.
+"""
+
+# Indexes under test, by table
+INDEXES = {
+    'user_reviews': ['ix_user_reviews_game_id_id', 'ix_user_reviews_user_id_id', 'uq_user_reviews_user_id_game_id'],
+    'user_backlogs': ['ix_user_backlogs_user_id_id', 'uq_user_backlogs_user_id_game_id'],
+    'followers': ['ix_followers_follower_id_user_id'],
+    'game_platforms': ['ix_game_platforms_platform_id_game_id'],
+    'games': ['ix_games_genre_id', 'ix_games_developer_id', 'ix_games_publisher_id']
+}
+
+
+def seed(db, reviews, batch=50000):
+    '''
+    Insert the synthetic dataset with executemany batches.
+
+    Parameters:
+    ----------
+    db : SQLAlchemy
+        The SQLAlchemy database instance, inside an application context.
+    reviews : int
+        The number of user reviews. Every other table is sized relative to it.
+
+    Returns:
+    -------
+    dict
+        The number of rows of each table.
+    '''
+    from app.models import Developer, Follower, Game, GameStatus, Genre, Platform, Publisher, User, UserBacklog, UserReview
+    from app.models.game_platform import game_platform
+
+    users = max(reviews // 20, 100)
+    games = max(reviews // 50, 100)
+    sizes = {
+        'users': users,
+        'games': games,
+        'user_reviews': reviews,
+        'user_backlogs': reviews // 5,
+        'followers': reviews // 2,
+        'game_platforms': games * 3
+    }
+
+    def insert(table, rows):
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == batch:
+                db.session.execute(table.insert(), chunk)
+                chunk = []
+        if chunk:
+            db.session.execute(table.insert(), chunk)
+
+    for model in (Genre, Developer, Publisher, Platform, GameStatus):
+        insert(model.__table__, ({'id': id, 'name': f'{model.__name__} {id}'} for id in range(1, 21)))
+    insert(User.__table__, (
+        {'id': id, 'username': f'user{id}', 'email': f'user{id}@example.com', 'password': 'x'}
+        for id in range(1, users + 1)
+    ))
+    insert(Game.__table__, ({
+        'id': id, 'title': f'Game {id}', 'description': 'Synthetic game', 'release_date': date(2020, 1, 1),
+        'genre_id': id % 20 + 1, 'developer_id': id % 17 + 1, 'publisher_id': id % 13 + 1
+    } for id in range(1, games + 1)))
+    insert(game_platform, (
+        {'game_id': game_id, 'platform_id': (game_id + offset) % 20 + 1}
+        for game_id in range(1, games + 1) for offset in range(3)
+    ))
+
+    # Pair k gets user k % users and a distinct game per pass over the users, so pairs are unique
+    def pairs(count):
+        for k in range(count):
+            user_id = k % users + 1
+            yield user_id, (k // users * 7 + user_id) % games + 1
+
+    insert(UserReview.__table__, (
+        {'user_id': user_id, 'game_id': game_id, 'score': user_id % 10 + 1, 'status_id': 1, 'review': 'ok'}
+        for user_id, game_id in pairs(reviews)
+    ))
+    insert(UserBacklog.__table__, (
+        {'user_id': user_id, 'game_id': game_id} for user_id, game_id in pairs(sizes['user_backlogs'])
+    ))
+    insert(Follower.__table__, (
+        {'user_id': user_id, 'follower_id': (game_id - 1) % users + 1}
+        for user_id, game_id in pairs(sizes['followers']) if (game_id - 1) % users + 1 != user_id
+    ))
+
+    db.session.commit()
+    return sizes
+
+
+def workloads(sizes):
+    '''
+    Build the timed queries, one per indexed access path.
+
+    Parameters:
+    ----------
+    sizes : dict
+        The number of rows of each table.
+
+    Returns:
+    -------
+    list[tuple[str, Callable, str]]
+        The name, the callable running the query with a random key, and SQL for its plan.
+    '''
+    from sqlalchemy import func
+    from app import db
+    from app.models import Game
+    from app.models.game_platform import game_platform
+    from app.repositories.follower_repository import FollowerRepository
+    from app.repositories.user_backlog_repository import UserBacklogRepository
+    from app.repositories.user_review_repository import UserReviewRepository
+
+    reviews, backlogs, followers = UserReviewRepository(), UserBacklogRepository(), FollowerRepository()
+    user = lambda: random.randint(1, sizes['users'])
+    game = lambda: random.randint(1, sizes['games'])
+
+    return [
+        ('reviews by game', lambda: reviews.get_by_game_id(game(), limit=20),
+         'SELECT id FROM user_reviews WHERE game_id = 1 ORDER BY id DESC LIMIT 21'),
+        ('reviews by user', lambda: reviews.get_by_user_id(user(), limit=20),
+         'SELECT id FROM user_reviews WHERE user_id = 1 ORDER BY id DESC LIMIT 21'),
+        ('review by user and game', lambda: reviews.get_by_user_game_id(user(), game()),
+         'SELECT id FROM user_reviews WHERE user_id = 1 AND game_id = 1'),
+        ('backlog by user', lambda: backlogs.get_backlog(user(), limit=20),
+         'SELECT id FROM user_backlogs WHERE user_id = 1 ORDER BY id DESC LIMIT 21'),
+        ('following', lambda: followers.get_following(user(), limit=20),
+         'SELECT user_id FROM followers WHERE follower_id = 1 ORDER BY user_id LIMIT 21'),
+        ('games by platform', lambda: db.session.execute(
+            db.select(game_platform.c.game_id).where(game_platform.c.platform_id == random.randint(1, 20))
+         ).all(),
+         'SELECT game_id FROM game_platforms WHERE platform_id = 1'),
+        ('games by genre', lambda: db.session.scalar(
+            db.select(func.count()).select_from(Game).where(Game.genre_id == random.randint(1, 20))
+         ),
+         'SELECT count(*) FROM games WHERE genre_id = 1')
+    ]
+
+
+def time_workloads(db, queries, repeat):
+    '''
+    Run every query repeat times and return the median latency of each, in milliseconds.
+    '''
+    results = {}
+    for name, run, _ in queries:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - start) * 1000)
+            db.session.rollback()
+        results[name] = statistics.median(samples)
+    return results
+
+
+def plans(db, queries):
+    return {
+        name: ' / '.join(row[-1] for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')))
+        for name, _, sql in queries
+    }
+
+
+def set_indexes(db, present):
+    '''
+    Drop or create the indexes under test.
+    '''
+    for table_name, names in INDEXES.items():
+        table = db.metadata.tables[table_name]
+        for index in table.indexes:
+            if index.name in names:
+                if present:
+                    index.create(db.engine, checkfirst=True)
+                else:
+                    index.drop(db.engine, checkfirst=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the speedup of the secondary indexes.')
+    parser.add_argument('--reviews', type=int, default=1000000, help='number of user reviews to seed')
+    parser.add_argument('--repeat', type=int, default=20, help='runs of each query per measurement')
+    parser.add_argument('--seed', type=int, default=1, help='random seed of the query keys')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bonfire-indexes-')
+    os.environ['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(directory, "benchmark.db")}'
+    os.environ.setdefault('JWT_SECRET_KEY', 'benchmark')
+
+    from app import create_app, db
+    from app.config.config import Config
+
+    config = Config().dev_config
+    config.SQL_QUERY_BUDGET = None
+    config.METRICS_ENABLED = False
+    app = create_app(config)
+
+    try:
+        with app.app_context():
+            db.create_all()
+            start = time.perf_counter()
+            sizes = seed(db, args.reviews)
+            print(f'Seeded {sum(sizes.values())} rows in {time.perf_counter() - start:.1f}s: {sizes}')
+
+            queries = workloads(sizes)
+
+            set_indexes(db, present=False)
+            db.session.execute(db.text('ANALYZE'))
+            random.seed(args.seed)
+            before, plans_before = time_workloads(db, queries, args.repeat), plans(db, queries)
+
+            set_indexes(db, present=True)
+            db.session.execute(db.text('ANALYZE'))
+            random.seed(args.seed)
+            after, plans_after = time_workloads(db, queries, args.repeat), plans(db, queries)
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f'{"query":<26}{"no index ms":>13}{"indexed ms":>13}{"speedup":>10}')
+    for name in before:
+        print(f'{name:<26}{before[name]:>13.3f}{after[name]:>13.3f}{before[name] / after[name]:>9.1f}x')
+    print()
+    for name in before:
+        print(f'{name}:\n    without: {plans_before[name]}\n    with:    {plans_after[name]}')
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({
+                'rows': sizes,
+                'median_ms': {name: {'without': before[name], 'with': after[name]} for name in before},
+                'plans': {name: {'without': plans_before[name], 'with': plans_after[name]} for name in before}
+            }, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
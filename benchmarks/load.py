@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Load Benchmark
+
+This script drives the main read routes of the API and reports p50/p95/p99 latency and
+throughput per route. By default it seeds a throw-away SQLite database with seed_synthetic and
+calls the application through the Flask test client, which measures the application alone;
+--serve starts a local threaded WSGI server and calls it over HTTP with --concurrency clients,
+and --url targets a server that is already running (and already seeded).
+
+Usage:
+    python benchmarks/load.py --users 5000 --games 2000 --requests 300
+    python benchmarks/load.py --serve --concurrency 8 --json load.json
+    python benchmarks/load.py --url http://localhost:5000 --users 20000 --games 5000
+    python benchmarks/load.py --baseline load.json --max-regression 20
+
+Request keys are drawn from a fixed --seed, so two runs over the same data issue the same
+requests. With --baseline the script exits with status 1 when the p95 of any route regressed
+by more than --max-regression percent, so CI can track regressions between releases.
+"""
+
+# Routes under test: name and path template, filled with random IDs, years and search terms
+ROUTES = [
+    ('games', '/api/v1/games/?limit=20'),
+    ('games browse', '/api/v1/games/?year_from={year}&sort=-release_date&limit=20'),
+    ('game', '/api/v1/games/{game}'),
+    ('games top-rated', '/api/v1/games/top-rated?limit=20'),
+    ('games search', '/api/v1/games/search?q={term}'),
+    ('reviews by game', '/api/v1/user_reviews/game/{game}?limit=20'),
+    ('reviews by user', '/api/v1/user_reviews/user/{user}?limit=20'),
+    ('followers', '/api/v1/followers/{user}?limit=20'),
+    ('following', '/api/v1/followers/following/{user}?limit=20'),
+    ('users', '/api/v1/users/?limit=20'),
+    ('user', '/api/v1/users/{user}'),
+    ('genres', '/api/v1/genres/')
+]
+
+SEARCH_TERMS = ('shadow', 'crown', 'iron', 'legend', 'star', 'quest', 'ember', 'night', 'storm', 'dawn')
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def plan(args, users, games):
+    '''
+    Build the requests of every route from the fixed random seed.
+
+    Returns:
+    -------
+    dict[str, list[str]]
+        The paths to request, by route name.
+    '''
+    rng = random.Random(args.seed)
+    return {
+        name: [
+            template.format(
+                user=rng.randint(1, users), game=rng.randint(1, games), year=rng.randint(1990, 2024), term=rng.choice(SEARCH_TERMS)
+            )
+            for _ in range(args.requests)
+        ]
+        for name, template in ROUTES
+    }
+
+
+def run_client(client, paths):
+    '''
+    Issue the requests one after the other through the Flask test client.
+    '''
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for path in paths:
+        begin = time.perf_counter()
+        response = client.get(path)
+        latencies.append((time.perf_counter() - begin) * 1000)
+        errors += response.status_code >= 500
+    return latencies, errors, time.perf_counter() - start
+
+
+def run_http(base_url, paths, concurrency):
+    '''
+    Issue the requests over HTTP from concurrency threads.
+    '''
+    def fetch(path):
+        begin = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url + path, timeout=30) as response:
+                response.read()
+                failed = False
+        except urllib.error.HTTPError as err:
+            failed = err.code >= 500
+        except OSError:
+            failed = True
+        return (time.perf_counter() - begin) * 1000, failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetch, paths))
+    return [latency for latency, _ in results], sum(failed for _, failed in results), time.perf_counter() - start
+
+
+def measure(args, requests, call):
+    '''
+    Warm every route up, then time it.
+
+    Returns:
+    -------
+    dict[str, dict]
+        The request count, errors, req/s and p50/p95/p99 latency of every route.
+    '''
+    results = {}
+    for name, paths in requests.items():
+        call(paths[:args.warmup])
+        latencies, errors, seconds = call(paths)
+        results[name] = {
+            'requests': len(paths),
+            'errors': errors,
+            'req_per_s': len(paths) / seconds,
+            'p50_ms': percentile(latencies, 0.50),
+            'p95_ms': percentile(latencies, 0.95),
+            'p99_ms': percentile(latencies, 0.99),
+            'mean_ms': statistics.fmean(latencies)
+        }
+    return results
+
+
+def report(results, baseline, max_regression):
+    '''
+    Print the results and return whether any route regressed past the budget.
+    '''
+    print(f'{"route":<18}{"req/s":>9}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"errors":>8}{"p95 vs base":>13}')
+    regressed = False
+    for name, result in results.items():
+        change = ''
+        if baseline and name in baseline:
+            delta = (result['p95_ms'] / baseline[name]['p95_ms'] - 1) * 100
+            change = f'{delta:+.1f}%'
+            if max_regression is not None and delta > max_regression:
+                regressed = True
+                change += ' !'
+        print(f'{name:<18}{result["req_per_s"]:>9.0f}{result["p50_ms"]:>9.2f}{result["p95_ms"]:>9.2f}'
+              f'{result["p99_ms"]:>9.2f}{result["errors"]:>8}{change:>13}')
+    return regressed
+
+
+def run_local(args, requests):
+    '''
+    Seed a throw-away database and measure the application in-process or behind a local server.
+    '''
+    directory = tempfile.mkdtemp(prefix='bonfire-load-')
+    os.environ['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(directory, "benchmark.db")}'
+    os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret-key-of-sufficient-length')
+
+    from app import create_app, db
+    from app.config.config import Config
+    from app.seeds import seed_synthetic
+
+    config = Config().dev_config
+    config.DEBUG = False
+    config.SQL_QUERY_BUDGET = None
+    app = create_app(config)
+
+    try:
+        with app.app_context():
+            db.create_all()
+            start = time.perf_counter()
+            seed_synthetic(args.users, args.games, args.reviews_per_user, args.follows_per_user, seed=args.seed)
+            print(f'Seeded in {time.perf_counter() - start:.1f}s')
+
+        if not args.serve:
+            client = app.test_client()
+            return measure(args, requests, lambda paths: run_client(client, paths))
+
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base_url = f'http://127.0.0.1:{server.server_port}'
+            return measure(args, requests, lambda paths: run_http(base_url, paths, args.concurrency))
+        finally:
+            server.shutdown()
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the latency and throughput of the main routes.')
+    parser.add_argument('--users', type=int, default=5000, help='synthetic users to seed (or IDs to draw from with --url)')
+    parser.add_argument('--games', type=int, default=2000, help='synthetic games to seed (or IDs to draw from with --url)')
+    parser.add_argument('--reviews-per-user', type=int, default=20, help='reviews per synthetic user')
+    parser.add_argument('--follows-per-user', type=int, default=10, help='follows per synthetic user')
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per route')
+    parser.add_argument('--warmup', type=int, default=20, help='untimed requests per route before timing')
+    parser.add_argument('--seed', type=int, default=1, help='random seed of the data and the request keys')
+    parser.add_argument('--serve', action='store_true', help='call a local threaded WSGI server over HTTP')
+    parser.add_argument('--url', help='call an already running and seeded server at this base URL')
+    parser.add_argument('--concurrency', type=int, default=4, help='concurrent clients with --serve or --url')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare the p95 of each route with this earlier --json file')
+    parser.add_argument('--max-regression', type=float, help='fail when a p95 regressed by more than this percent')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['routes']
+
+    requests = plan(args, args.users, args.games)
+
+    if args.url:
+        results = measure(args, requests, lambda paths: run_http(args.url.rstrip('/'), paths, args.concurrency))
+    else:
+        results = run_local(args, requests)
+
+    regressed = report(results, baseline, args.max_regression)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'arguments': vars(args), 'routes': results}, file, indent=2)
+
+    if regressed:
+        print(f'p95 latency regressed by more than {args.max_regression}%')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
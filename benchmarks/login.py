@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.seeds.synthetic_seeds import SYNTHETIC_PASSWORD
+
+"""
+Login Benchmark
+
+This script measures POST /auth/login throughput against a local threaded WSGI server while a
+probe client keeps calling a cheap cached route, so it shows both how many bcrypt checks per
+second the password pool sustains and whether a login burst starves everything else. It seeds
+a throw-away SQLite database with seed_synthetic users, whose password hashes use the
+configured cost.
+
+Usage:
+    python benchmarks/login.py --workers 2 --logins 400 --concurrency 32
+    python benchmarks/login.py --workers 0 --max-pending 1000
+    python benchmarks/login.py --rounds 12 --workers 8 --json login.json
+
+The development configuration hashes on the request thread (PASSWORD_HASH_WORKERS = 0); pass
+--workers to measure the process pool.
+
+Logins answered 503 were shed by PASSWORD_HASH_MAX_PENDING; they are counted separately from
+errors and left out of the login latency percentiles.
+"""
+
+# Cheap route the probe client calls during the burst
+PROBE_PATH = '/api/v1/genres/'
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return float('nan')
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def post_login(base_url, username):
+    '''
+    Log in once and return the latency in milliseconds and the status code.
+    '''
+    body = json.dumps({'username': username, 'password': SYNTHETIC_PASSWORD}).encode('utf-8')
+    request = urllib.request.Request(
+        base_url + '/api/v1/auth/login', data=body, headers={'Content-Type': 'application/json'}
+    )
+    begin = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as err:
+        status = err.code
+    except OSError:
+        status = 0
+    return (time.perf_counter() - begin) * 1000, status
+
+
+def probe(base_url, stop, latencies):
+    '''
+    Call the probe route back to back until stop is set.
+    '''
+    while not stop.is_set():
+        begin = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url + PROBE_PATH, timeout=60) as response:
+                response.read()
+        except OSError:
+            pass
+        latencies.append((time.perf_counter() - begin) * 1000)
+
+
+def run_burst(base_url, usernames, args):
+    '''
+    Issue the logins from concurrency threads while the probe runs.
+
+    Returns:
+    -------
+    dict
+        The login and probe measurements.
+    '''
+    baseline = []
+    stop = threading.Event()
+    thread = threading.Thread(target=probe, args=(base_url, stop, baseline))
+    thread.start()
+    time.sleep(1)
+    stop.set()
+    thread.join()
+
+    probe_latencies = []
+    stop = threading.Event()
+    thread = threading.Thread(target=probe, args=(base_url, stop, probe_latencies))
+    thread.start()
+
+    names = [usernames[index % len(usernames)] for index in range(args.logins)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda username: post_login(base_url, username), names))
+    seconds = time.perf_counter() - start
+
+    stop.set()
+    thread.join()
+
+    succeeded = [latency for latency, status in results if status == 200]
+    return {
+        'logins': len(results),
+        'succeeded': len(succeeded),
+        'shed': sum(status == 503 for _, status in results),
+        'errors': sum(status not in (200, 503) for _, status in results),
+        'logins_per_s': len(succeeded) / seconds,
+        'login_p50_ms': percentile(succeeded, 0.50),
+        'login_p95_ms': percentile(succeeded, 0.95),
+        'probe_idle_p50_ms': percentile(baseline, 0.50),
+        'probe_p50_ms': percentile(probe_latencies, 0.50),
+        'probe_p95_ms': percentile(probe_latencies, 0.95)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure login throughput and its effect on other routes.')
+    parser.add_argument('--users', type=int, default=200, help='synthetic users to seed and log in as')
+    parser.add_argument('--logins', type=int, default=200, help='timed login requests')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent login clients')
+    parser.add_argument('--rounds', type=int, help='override PASSWORD_HASH_ROUNDS')
+    parser.add_argument('--workers', type=int, help='override PASSWORD_HASH_WORKERS')
+    parser.add_argument('--max-pending', type=int, help='override PASSWORD_HASH_MAX_PENDING')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bonfire-login-')
+    os.environ['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(directory, "benchmark.db")}'
+    os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret-key-of-sufficient-length')
+
+    from app import create_app, db
+    from app.config.config import Config
+    from app.models.user import User
+    from app.seeds import seed_synthetic
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    config = Config().dev_config
+    config.DEBUG = False
+    config.SQL_QUERY_BUDGET = None
+    # Every login comes from 127.0.0.1
+    config.RATE_LIMITS = {}
+    for name, value in (('PASSWORD_HASH_ROUNDS', args.rounds), ('PASSWORD_HASH_WORKERS', args.workers),
+                        ('PASSWORD_HASH_MAX_PENDING', args.max_pending)):
+        if value is not None:
+            setattr(config, name, value)
+    app = create_app(config)
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    try:
+        with app.app_context():
+            db.create_all()
+            seed_synthetic(args.users, 10, 0, 0, seed=1)
+            usernames = db.session.scalars(db.select(User.username).order_by(User.id)).all()
+
+        server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base_url = f'http://127.0.0.1:{server.server_port}'
+            # Warm the password pool and the probe route up
+            post_login(base_url, usernames[0])
+            result = run_burst(base_url, usernames, args)
+        finally:
+            server.shutdown()
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f'cost {app.config["PASSWORD_HASH_ROUNDS"]}, {app.config["PASSWORD_HASH_WORKERS"]} workers, '
+          f'{app.config["PASSWORD_HASH_MAX_PENDING"]} pending, {args.concurrency} clients')
+    print(f'logins: {result["succeeded"]}/{result["logins"]} ok, {result["shed"]} shed (503), {result["errors"]} errors, '
+          f'{result["logins_per_s"]:.1f}/s, p50 {result["login_p50_ms"]:.0f} ms, p95 {result["login_p95_ms"]:.0f} ms')
+    print(f'{PROBE_PATH}: idle p50 {result["probe_idle_p50_ms"]:.2f} ms, '
+          f'during logins p50 {result["probe_p50_ms"]:.2f} ms, p95 {result["probe_p95_ms"]:.2f} ms')
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'arguments': vars(args), 'config': {
+                name: app.config[name] for name in ('PASSWORD_HASH_ROUNDS', 'PASSWORD_HASH_WORKERS', 'PASSWORD_HASH_MAX_PENDING')
+            }, 'result': result}, file, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
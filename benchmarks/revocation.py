@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Revocation Benchmark
+
+This script measures what the token blocklist adds to an authenticated request: it fills each
+revocation store with revoked live tokens, then times the token_in_blocklist_loader that
+jwt_required calls, for tokens that are not revoked (the common case) and for tokens that are,
+and compares the median against a budget. It also times whole authenticated requests with the
+blocklist installed and with a loader that revokes nothing, as a sanity check on the total.
+
+Usage:
+    python benchmarks/revocation.py
+    python benchmarks/revocation.py --revoked 1000000 --lookups 200000 --budget-us 50
+    python benchmarks/revocation.py --backends memory file redis --redis-url redis://localhost:6379/0
+
+The exit status is 1 if any median lookup exceeds the budget.
+"""
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def time_loader(loader, tokens, rounds=5):
+    '''
+    Time the blocklist loader once per token, keeping the best of rounds passes.
+
+    Returns:
+    -------
+    list
+        The per-call latency of every token in microseconds.
+    '''
+    best = None
+    for _ in range(rounds):
+        samples = []
+        for token in tokens:
+            begin = time.perf_counter_ns()
+            loader({}, token)
+            samples.append((time.perf_counter_ns() - begin) / 1000)
+        if best is None or sorted(samples)[len(samples) // 2] < sorted(best)[len(best) // 2]:
+            best = samples
+    return best
+
+
+def time_requests(client, headers, requests):
+    '''
+    Time authenticated requests back to back.
+
+    Returns:
+    -------
+    float
+        The median request latency in microseconds.
+    '''
+    samples = []
+    for _ in range(requests):
+        begin = time.perf_counter_ns()
+        client.post('/api/v1/auth/refresh', headers=headers)
+        samples.append((time.perf_counter_ns() - begin) / 1000)
+    return percentile(samples, 0.50)
+
+
+def bench_backend(backend, args, directory):
+    '''
+    Fill one store and time its loader and an authenticated route.
+
+    Returns:
+    -------
+    dict
+        The measurements of the backend.
+    '''
+    from app import create_app, db, jwt
+    from app.config.config import Config
+    from flask_jwt_extended import create_refresh_token
+
+    config = Config().dev_config
+    config.DEBUG = False
+    config.SQL_QUERY_BUDGET = None
+    config.REVOCATION_BACKEND = backend
+    config.REVOCATION_DIR = os.path.join(directory, 'revoked')
+    config.REVOCATION_REDIS_URL = args.redis_url
+    app = create_app(config)
+
+    with app.app_context():
+        from app.models.user import User
+        db.create_all()
+        db.session.add(User(username='benchmark', email='benchmark@email.com', password='-'))
+        db.session.commit()
+        store = app.extensions['token_blocklist']
+        expires_at = time.time() + 3600
+
+        revoked = [str(uuid.uuid4()) for _ in range(args.revoked)]
+        begin = time.perf_counter()
+        for jti in revoked:
+            store.add(jti, expires_at)
+        fill_seconds = time.perf_counter() - begin
+
+        live = [{'jti': str(uuid.uuid4()), 'exp': expires_at} for _ in range(args.lookups)]
+        hits = [{'jti': jti, 'exp': expires_at} for jti in revoked[:args.lookups]]
+
+        with app.test_request_context():
+            loader = jwt._token_in_blocklist_callback
+            miss_samples = time_loader(loader, live)
+            hit_samples = time_loader(loader, hits)
+
+        headers = {'Authorization': 'Bearer ' + create_refresh_token(identity=1, additional_claims={'ver': 0})}
+
+    client = app.test_client()
+    with_blocklist = time_requests(client, headers, args.requests)
+    blocklist_loader = jwt._token_in_blocklist_callback
+    jwt.token_in_blocklist_loader(lambda jwt_header, jwt_data: False)
+    try:
+        without_blocklist = time_requests(client, headers, args.requests)
+    finally:
+        jwt.token_in_blocklist_loader(blocklist_loader)
+
+    with app.app_context():
+        db.engine.dispose()
+
+    return {
+        'backend': backend,
+        'revoked': args.revoked,
+        'fill_us_per_token': fill_seconds * 1e6 / max(args.revoked, 1),
+        'miss_p50_us': percentile(miss_samples, 0.50),
+        'miss_p99_us': percentile(miss_samples, 0.99),
+        'hit_p50_us': percentile(hit_samples, 0.50) if hit_samples else float('nan'),
+        'hit_p99_us': percentile(hit_samples, 0.99) if hit_samples else float('nan'),
+        'request_p50_us': with_blocklist,
+        'request_without_blocklist_p50_us': without_blocklist
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the cost of token revocation checks.')
+    parser.add_argument('--backends', nargs='+', default=['memory', 'file'], help='revocation stores to measure')
+    parser.add_argument('--revoked', type=int, default=100000, help='revoked live tokens in each store')
+    parser.add_argument('--lookups', type=int, default=20000, help='timed loader calls per case')
+    parser.add_argument('--requests', type=int, default=500, help='timed authenticated requests')
+    parser.add_argument('--budget-us', type=float, default=50.0, help='maximum median loader latency')
+    parser.add_argument('--redis-url', default='redis://localhost:6379/0', help='server of the redis store')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bonfire-revocation-')
+    os.environ['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(directory, "benchmark.db")}'
+    os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret-key-of-sufficient-length')
+
+    results = []
+    try:
+        for backend in args.backends:
+            results.append(bench_backend(backend, args, directory))
+            shutil.rmtree(os.path.join(directory, 'revoked'), ignore_errors=True)
+            os.remove(os.path.join(directory, 'benchmark.db'))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    over_budget = False
+    for result in results:
+        worst = max(result['miss_p50_us'], result['hit_p50_us'])
+        over_budget |= worst > args.budget_us
+        print(f'{result["backend"]}: {result["revoked"]} revoked, fill {result["fill_us_per_token"]:.1f} us/token')
+        print(f'  not revoked: p50 {result["miss_p50_us"]:.2f} us, p99 {result["miss_p99_us"]:.2f} us')
+        print(f'  revoked:     p50 {result["hit_p50_us"]:.2f} us, p99 {result["hit_p99_us"]:.2f} us')
+        print(f'  POST /auth/refresh p50 {result["request_p50_us"]:.0f} us, '
+              f'{result["request_without_blocklist_p50_us"]:.0f} us without the blocklist')
+        print(f'  {"within" if worst <= args.budget_us else "OVER"} the {args.budget_us:.0f} us budget')
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'arguments': vars(args), 'results': results}, file, indent=2)
+    return 1 if over_budget else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+"""
+Startup Benchmark
+
+This script measures how long a fresh interpreter takes to import the app package and to
+build an application with create_app, which is what every worker boot, CLI invocation and
+serverless cold start pays. Each measurement runs in its own subprocess so that nothing is
+cached between runs.
+
+Usage:
+    python benchmarks/startup.py --runs 10
+    python benchmarks/startup.py --max-import-ms 150 --max-create-ms 600 --json startup.json
+
+With --max-import-ms / --max-create-ms the script exits with status 1 when the median exceeds
+the budget, so CI can fail on start-up regressions; --json writes the results for tracking.
+
+Reference medians of import plus create_app, 21 interleaved cold starts on one machine:
+
+    before the factory (import app built the application)     751 ms
+    factory, Flask-Migrate and alembic imported by the package  925 ms
+    factory, Flask-Migrate imported by "flask db" only          713 ms
+
+Most of what remains is importing Flask and SQLAlchemy themselves, and configuring the mappers
+(which the first query would otherwise do).
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+created = time.perf_counter()
+print((imported - start) * 1000, (created - imported) * 1000)
+'''
+
+
+def measure(runs):
+    '''
+    Run the probe in fresh interpreters.
+
+    Parameters:
+    ----------
+    runs : int
+        The number of interpreters to start.
+
+    Returns:
+    -------
+    tuple[list[float], list[float]]
+        The import and create_app times of each run, in milliseconds.
+    '''
+    env = dict(os.environ)
+    env.setdefault('SQLALCHEMY_DATABASE_URI', 'sqlite:///:memory:')
+    env.setdefault('JWT_SECRET_KEY', 'benchmark')
+
+    imports, creates = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        imports.append(float(output[-2]))
+        creates.append(float(output[-1]))
+    return imports, creates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the start-up time of the application.')
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters to start')
+    parser.add_argument('--max-import-ms', type=float, help='fail when the median import time exceeds this')
+    parser.add_argument('--max-create-ms', type=float, help='fail when the median create_app time exceeds this')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    imports, creates = measure(args.runs)
+    results = {
+        'runs': args.runs,
+        'import_ms': statistics.median(imports),
+        'create_app_ms': statistics.median(creates)
+    }
+    print(f"import app:   {results['import_ms']:8.1f} ms (median of {args.runs})")
+    print(f"create_app(): {results['create_app_ms']:8.1f} ms (median of {args.runs})")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    failed = False
+    if args.max_import_ms is not None and results['import_ms'] > args.max_import_ms:
+        print(f'import time exceeds the budget of {args.max_import_ms} ms')
+        failed = True
+    if args.max_create_ms is not None and results['create_app_ms'] > args.max_create_ms:
+        print(f'create_app time exceeds the budget of {args.max_create_ms} ms')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
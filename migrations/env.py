@@ -90,9 +90,22 @@ def run_migrations_online():
                 directives[:] = []
                 logger.info('No changes in schema detected.')
 
+    # the game search index (app/models/game_search_index.py) is raw DDL the models do not
+    # describe, so autogenerate must not offer to drop it
+    def include_object(object, name, type_, reflected, compare_to):
+        if type_ == 'table':
+            return not name.startswith('games_fts')
+        if type_ == 'column':
+            return name != 'search_vector'
+        if type_ == 'index':
+            return name not in ('ix_games_search_vector', 'ix_games_title_trgm')
+        return True
+
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    if conf_args.get("include_object") is None:
+        conf_args["include_object"] = include_object
 
     connectable = get_engine()
 
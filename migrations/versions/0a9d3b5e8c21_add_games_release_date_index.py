@@ -0,0 +1,24 @@
+"""Add an index on games.release_date for the browse year filters and sorts
+
+Revision ID: 0a9d3b5e8c21
+Revises: f2b86d14c7e9
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a9d3b5e8c21'
+down_revision = 'f2b86d14c7e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_games_release_date', 'games', ['release_date'])
+
+
+def downgrade():
+    op.drop_index('ix_games_release_date', table_name='games')
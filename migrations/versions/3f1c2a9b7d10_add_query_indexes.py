@@ -0,0 +1,81 @@
+"""Add indexes matching the repository queries
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns, unique) of every index, next to the repository query it serves
+INDEXES = [
+    # UserReviewRepository.get_by_game_id / get_by_user_id: filter, then page by id
+    ('user_reviews', 'ix_user_reviews_game_id_id', ['game_id', 'id'], False),
+    ('user_reviews', 'ix_user_reviews_user_id_id', ['user_id', 'id'], False),
+    # UserReviewRepository.get_by_user_and_game / get_existing_pairs, one review per user and game
+    ('user_reviews', 'uq_user_reviews_user_id_game_id', ['user_id', 'game_id'], True),
+    # UserBacklogRepository.get_backlog: filter, then page by id
+    ('user_backlogs', 'ix_user_backlogs_user_id_id', ['user_id', 'id'], False),
+    # UserBacklogRepository.get, one entry per user and game
+    ('user_backlogs', 'uq_user_backlogs_user_id_game_id', ['user_id', 'game_id'], True),
+    # FollowerRepository.get_following: filter, then page by user_id
+    ('followers', 'ix_followers_follower_id_user_id', ['follower_id', 'user_id'], False),
+    # GamePlatformRepository.get_all_games
+    ('game_platforms', 'ix_game_platforms_platform_id_game_id', ['platform_id', 'game_id'], False),
+    # Games by genre, developer and publisher, and the foreign key checks of their deletes
+    ('games', 'ix_games_genre_id', ['genre_id'], False),
+    ('games', 'ix_games_developer_id', ['developer_id'], False),
+    ('games', 'ix_games_publisher_id', ['publisher_id'], False),
+    # GameRatingStatsRepository.get_top_rated: page by average
+    ('game_rating_stats', 'ix_game_rating_stats_average', ['average', 'game_id'], False)
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    for table, name, columns, unique in INDEXES:
+        if table not in tables or name in {index['name'] for index in inspector.get_indexes(table)}:
+            continue
+        if unique:
+            _check_unique(table, columns)
+        _create_index(name, table, columns, unique)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    for table, name, columns, unique in reversed(INDEXES):
+        if table in tables and name in {index['name'] for index in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
+
+
+def _create_index(name, table, columns, unique):
+    # Build PostgreSQL indexes concurrently so large tables stay writable meanwhile
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def _check_unique(table, columns):
+    # Fail with an actionable message rather than a bare integrity error
+    column_list = ', '.join(columns)
+    duplicates = op.get_bind().execute(sa.text(
+        f'SELECT COUNT(*) FROM (SELECT {column_list} FROM {table} GROUP BY {column_list} HAVING COUNT(*) > 1) AS duplicates'
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f'{table} has {duplicates} duplicated ({column_list}) pairs; remove them before adding the unique index.'
+        )
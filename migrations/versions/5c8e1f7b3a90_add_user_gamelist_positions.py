@@ -0,0 +1,49 @@
+"""Add positions to game list membership and a games counter to game lists
+
+Revision ID: 5c8e1f7b3a90
+Revises: 0a9d3b5e8c21
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c8e1f7b3a90'
+down_revision = '0a9d3b5e8c21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user_gamelist_has_game') as batch_op:
+        batch_op.add_column(sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+    with op.batch_alter_table('user_gamelists') as batch_op:
+        batch_op.add_column(sa.Column('games_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Existing games keep the game ID order they were listed in, numbered from 0 within each list
+    op.execute(
+        'UPDATE user_gamelist_has_game SET position = ('
+        'SELECT count(*) FROM user_gamelist_has_game AS earlier '
+        'WHERE earlier.gamelist_id = user_gamelist_has_game.gamelist_id '
+        'AND earlier.game_id < user_gamelist_has_game.game_id)'
+    )
+    op.execute(
+        'UPDATE user_gamelists SET games_count = ('
+        'SELECT count(*) FROM user_gamelist_has_game WHERE user_gamelist_has_game.gamelist_id = user_gamelists.id)'
+    )
+
+    op.create_index(
+        'ix_user_gamelist_has_game_gamelist_id_position', 'user_gamelist_has_game', ['gamelist_id', 'position', 'game_id']
+    )
+    op.create_index('ix_user_gamelists_user_id_id', 'user_gamelists', ['user_id', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_user_gamelists_user_id_id', table_name='user_gamelists')
+    op.drop_index('ix_user_gamelist_has_game_gamelist_id_position', table_name='user_gamelist_has_game')
+    with op.batch_alter_table('user_gamelists') as batch_op:
+        batch_op.drop_column('games_count')
+    with op.batch_alter_table('user_gamelist_has_game') as batch_op:
+        batch_op.drop_column('position')
@@ -0,0 +1,53 @@
+"""Add the activities and timeline_entries tables of the activity feed
+
+Revision ID: 8b2e4d6f1a35
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f1a35'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'activities',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('subject_id', sa.Integer(), nullable=False),
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=True),
+        sa.Column('fanned_out', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['actor_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['game_id'], ['games.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('uq_activities_kind_subject_id', 'activities', ['kind', 'subject_id'], unique=True)
+    op.create_index('ix_activities_actor_id_fanned_out_id', 'activities', ['actor_id', 'fanned_out', 'id'])
+
+    op.create_table(
+        'timeline_entries',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('activity_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'activity_id')
+    )
+    op.create_index('ix_timeline_entries_activity_id', 'timeline_entries', ['activity_id'])
+
+
+def downgrade():
+    op.drop_index('ix_timeline_entries_activity_id', table_name='timeline_entries')
+    op.drop_table('timeline_entries')
+    op.drop_index('ix_activities_actor_id_fanned_out_id', table_name='activities')
+    op.drop_index('uq_activities_kind_subject_id', table_name='activities')
+    op.drop_table('activities')
@@ -0,0 +1,27 @@
+"""Add the token version of users
+
+Revision ID: 9e4f2a6c1d73
+Revises: 5c8e1f7b3a90
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4f2a6c1d73'
+down_revision = '5c8e1f7b3a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing users start at version 0, which is also the version of tokens issued without the claim
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('token_version')
@@ -0,0 +1,72 @@
+"""Add the rating aggregates and the search index of games
+
+Revision ID: b6d3f8a2c4e5
+Revises: 9e4f2a6c1d73
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.game_search_index import create_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6d3f8a2c4e5'
+down_revision = '9e4f2a6c1d73'
+branch_labels = None
+depends_on = None
+
+SCORES = range(1, 11)
+
+
+def upgrade():
+    # Databases created by db.create_all already have both, so each step checks first
+    inspector = sa.inspect(op.get_bind())
+
+    if 'game_rating_stats' not in inspector.get_table_names():
+        op.create_table(
+            'game_rating_stats',
+            sa.Column('game_id', sa.Integer(), sa.ForeignKey('games.id'), primary_key=True),
+            sa.Column('score_sum', sa.Integer(), nullable=False),
+            sa.Column('score_count', sa.Integer(), nullable=False),
+            sa.Column('average', sa.Float(), nullable=True),
+            *(sa.Column(f'score_{score}', sa.Integer(), nullable=False) for score in SCORES)
+        )
+        op.create_index('ix_game_rating_stats_average', 'game_rating_stats', ['average', 'game_id'])
+        _backfill_rating_stats()
+
+    # The search index is raw DDL (an FTS5 table and triggers on SQLite, a generated column
+    # and GIN indexes on PostgreSQL) that autogenerate cannot see; it is idempotent
+    create_search_index(op.get_bind())
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for trigger in ('games_fts_insert', 'games_fts_delete', 'games_fts_update'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS games_fts')
+    elif bind.dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_games_title_trgm')
+        op.execute('DROP INDEX IF EXISTS ix_games_search_vector')
+        op.execute('ALTER TABLE games DROP COLUMN IF EXISTS search_vector')
+
+    if 'game_rating_stats' in sa.inspect(bind).get_table_names():
+        op.drop_index('ix_game_rating_stats_average', table_name='game_rating_stats')
+        op.drop_table('game_rating_stats')
+
+
+def _backfill_rating_stats():
+    # One row per game, reviewed or not, as GameRepository.create and the review writes expect
+    histogram = ', '.join(
+        f'COALESCE(SUM(CASE WHEN user_reviews.score = {score} THEN 1 ELSE 0 END), 0)' for score in SCORES
+    )
+    op.execute(
+        f'INSERT INTO game_rating_stats (game_id, score_sum, score_count, average, '
+        f'{", ".join(f"score_{score}" for score in SCORES)}) '
+        f'SELECT games.id, COALESCE(SUM(user_reviews.score), 0), COUNT(user_reviews.id), '
+        f'AVG(CAST(user_reviews.score AS FLOAT)), {histogram} '
+        f'FROM games LEFT OUTER JOIN user_reviews ON user_reviews.game_id = games.id '
+        f'GROUP BY games.id'
+    )
@@ -0,0 +1,35 @@
+"""Add follower and following counters to users
+
+Revision ID: c4d91e7a2b58
+Revises: 8b2e4d6f1a35
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d91e7a2b58'
+down_revision = '8b2e4d6f1a35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('followers_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('following_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the counters of existing users from the followers table
+    op.execute(
+        'UPDATE users SET '
+        'followers_count = (SELECT count(*) FROM followers WHERE followers.user_id = users.id), '
+        'following_count = (SELECT count(*) FROM followers WHERE followers.follower_id = users.id)'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('following_count')
+        batch_op.drop_column('followers_count')
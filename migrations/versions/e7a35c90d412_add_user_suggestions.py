@@ -0,0 +1,47 @@
+"""Add the user_suggestions table and the suggestions_stale flag of users
+
+Revision ID: e7a35c90d412
+Revises: c4d91e7a2b58
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a35c90d412'
+down_revision = 'c4d91e7a2b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'user_suggestions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('suggested_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('mutual_count', sa.Integer(), nullable=False),
+        sa.Column('shared_games', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['suggested_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'suggested_id')
+    )
+    op.create_index('ix_user_suggestions_user_id_rank', 'user_suggestions', ['user_id', 'rank'])
+
+    # Existing users start stale, so the first run of the job computes everyone who follows someone
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('suggestions_stale', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.execute(
+        sa.text('UPDATE users SET suggestions_stale = :stale WHERE id IN (SELECT follower_id FROM followers)')
+            .bindparams(stale=True)
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('suggestions_stale')
+    op.drop_index('ix_user_suggestions_user_id_rank', table_name='user_suggestions')
+    op.drop_table('user_suggestions')
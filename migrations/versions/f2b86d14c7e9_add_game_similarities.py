@@ -0,0 +1,36 @@
+"""Add the game_similarities table of the similar games job
+
+Revision ID: f2b86d14c7e9
+Revises: e7a35c90d412
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b86d14c7e9'
+down_revision = 'e7a35c90d412'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'game_similarities',
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('similar_game_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('users', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['game_id'], ['games.id']),
+        sa.ForeignKeyConstraint(['similar_game_id'], ['games.id']),
+        sa.PrimaryKeyConstraint('game_id', 'similar_game_id')
+    )
+    op.create_index('ix_game_similarities_game_id_rank', 'game_similarities', ['game_id', 'rank'])
+
+
+def downgrade():
+    op.drop_index('ix_game_similarities_game_id_rank', table_name='game_similarities')
+    op.drop_table('game_similarities')